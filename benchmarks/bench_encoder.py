@@ -0,0 +1,89 @@
+"""Benchmark the table-driven text→Morse encoder against the legacy loop.
+
+Usage::
+
+    python benchmarks/bench_encoder.py [--size-mb 10] [--repeat 3]
+
+The corpus is built by repeating the translation text samples until it
+reaches the requested size, so every character is encodable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+	sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.main.python.exceptions import UnsupportedCharacterError  # noqa: E402
+from src.main.python.resources import constants as consts  # noqa: E402
+from src.main.python.utils.morse_translator import convert_text_to_morse  # noqa: E402
+
+
+def legacy_convert_text_to_morse(message: str) -> str:
+	"""Reference copy of the original per-character, three-dict encoder."""
+
+	if not message:
+		return ""
+
+	morse_words: list[str] = []
+	for word in message.split(" "):
+		if word == "":
+			morse_words.append("")
+			continue
+		symbols: list[str] = []
+		for char in word:
+			if char in consts.LETTER_TO_MORSE_MAP:
+				symbols.append(consts.LETTER_TO_MORSE_MAP[char])
+			elif char in consts.NUMBER_TO_MORSE_MAP:
+				symbols.append(consts.NUMBER_TO_MORSE_MAP[char])
+			elif char in consts.SYMBOL_TO_MORSE_MAP:
+				symbols.append(consts.SYMBOL_TO_MORSE_MAP[char])
+			else:
+				raise UnsupportedCharacterError(char)
+		morse_words.append(" ".join(symbols))
+	return "   ".join(morse_words)
+
+
+def build_corpus(size_bytes: int) -> str:
+	samples = " ".join(consts.TRANSLATION_TEXT_SAMPLES)
+	repeats = size_bytes // len(samples.encode("utf-8")) + 1
+	return " ".join([samples] * repeats)
+
+
+def _time(func, corpus: str, repeat: int) -> tuple[float, str]:
+	best = float("inf")
+	result = ""
+	for _ in range(repeat):
+		start = time.perf_counter()
+		result = func(corpus)
+		best = min(best, time.perf_counter() - start)
+	return best, result
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--size-mb", type=float, default=10.0)
+	parser.add_argument("--repeat", type=int, default=3)
+	args = parser.parse_args(argv)
+
+	corpus = build_corpus(int(args.size_mb * 1024 * 1024))
+	megabytes = len(corpus.encode("utf-8")) / (1024 * 1024)
+	print(f"corpus: {megabytes:.1f} MB, {len(corpus):,} characters")
+
+	legacy_seconds, legacy_output = _time(legacy_convert_text_to_morse, corpus, args.repeat)
+	table_seconds, table_output = _time(convert_text_to_morse, corpus, args.repeat)
+	if legacy_output != table_output:
+		raise SystemExit("encoders disagree on the benchmark corpus")
+
+	print(f"legacy loop:   {legacy_seconds:8.3f} s  {megabytes / legacy_seconds:8.1f} MB/s")
+	print(f"table-driven:  {table_seconds:8.3f} s  {megabytes / table_seconds:8.1f} MB/s")
+	print(f"speedup:       {legacy_seconds / table_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+	main()
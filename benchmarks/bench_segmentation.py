@@ -0,0 +1,95 @@
+"""Benchmark decoding Morse without letter gaps.
+
+Usage::
+
+    python benchmarks/bench_segmentation.py [--words 2000] [--order 3]
+        [--beam 1 --beam 8 ...] [--text pg1342.txt] [--no-word-gaps]
+
+The model is trained on the first half of the corpus and the decoder is
+measured on Morse encoded from the second half with the letter gaps removed:
+the exercise texts by default, or a plain-text ``--text`` file cleaned to the
+characters the encoder supports.  For every beam width it reports throughput
+in Morse elements per second and the share of words decoded correctly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+	sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.main.python.resources import constants as consts  # noqa: E402
+from src.main.python.utils.alphabets import compile_alphabet  # noqa: E402
+from src.main.python.utils.morse_translator import convert_text_to_morse  # noqa: E402
+from src.main.python.utils.segmentation import CharNgramModel, segment_morse  # noqa: E402
+
+
+def corpus_words(path: Path | None) -> list[str]:
+	if path is None:
+		text = " ".join((*consts.TRANSLATION_TEXT_SAMPLES, *consts.TEST_TEXT_PROMPTS))
+	else:
+		text = path.read_text(encoding="utf-8", errors="ignore")
+	supported = compile_alphabet().encode_table
+	cleaned = ("".join(char for char in word if char in supported) for word in text.split())
+	return [word for word in cleaned if word]
+
+
+def gapless_morse(words: list[str], *, word_gaps: bool) -> str:
+	morse = convert_text_to_morse(" ".join(words))
+	joined = (word.replace(" ", "") for word in morse.split("   "))
+	return ("   " if word_gaps else "").join(joined)
+
+
+def word_spans(words: list[str]) -> set[tuple[int, str]]:
+	"""Each word with its offset in the element stream, which no split of letters shifts."""
+
+	spans = set()
+	offset = 0
+	for word in words:
+		spans.add((offset, word.lower()))
+		offset += len(convert_text_to_morse(word).replace(" ", ""))
+	return spans
+
+
+def word_accuracy(decoded: str, words: list[str]) -> float:
+	"""Share of words decoded with the right letters in the right place."""
+
+	return len(word_spans(decoded.split()) & word_spans(words)) / len(words)
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--words", type=int, default=2000)
+	parser.add_argument("--order", type=int, default=3)
+	parser.add_argument("--beam", type=int, action="append", default=[])
+	parser.add_argument("--text", type=Path)
+	parser.add_argument("--no-word-gaps", action="store_true")
+	args = parser.parse_args(argv)
+
+	words = corpus_words(args.text)
+	half = max(len(words) // 2, 1)
+	model = CharNgramModel.train([" ".join(words[:half])], order=args.order)
+	test = (words[half:] or words)[: args.words]
+	morse = gapless_morse(test, word_gaps=not args.no_word_gaps)
+	elements = sum(element in ".-" for element in morse)
+	print(f"{len(test):,} words, {elements:,} elements, order {args.order}")
+
+	for beam in args.beam or [1, 4, 8, 16]:
+		start = time.perf_counter()
+		decoded = segment_morse(
+			morse, model=model, beam_width=beam, insert_spaces=args.no_word_gaps
+		)
+		seconds = time.perf_counter() - start
+		print(
+			f"  beam {beam:3d}: {seconds:7.3f} s  {elements / seconds / 1000:8.1f} k elements/s"
+			f"  words correct {word_accuracy(decoded, test):6.1%}"
+		)
+
+
+if __name__ == "__main__":
+	main()
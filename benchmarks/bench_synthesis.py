@@ -0,0 +1,93 @@
+"""Benchmark the audio synthesis engines.
+
+Usage::
+
+    python benchmarks/bench_synthesis.py [--repeat 3] [--engine python --engine numpy]
+
+Renders Morse for texts of increasing length, from a single word to several
+exercise sentences, under a few speed, pitch and sample-rate settings, and reports each engine's render time and
+its speedup over the pure-Python engine.  The template engine is measured
+both cold (templates rebuilt, as after a settings change) and warm.  Engines
+that are not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+	sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.main.python.resources import constants as consts  # noqa: E402
+from src.main.python.services import morse_audio  # noqa: E402
+from src.main.python.services.morse_audio import (  # noqa: E402
+	available_engines,
+	render_morse_samples,
+)
+from src.main.python.utils.morse_translator import convert_text_to_morse  # noqa: E402
+
+TEXTS = {
+	"word": "Morsekood",
+	"sentence": "Tartu Ylikool asutati aastal 1632.",
+	"three sentences": " ".join(consts.TRANSLATION_TEXT_SAMPLES[10:13]),
+	"ten sentences": " ".join(consts.TRANSLATION_TEXT_SAMPLES[10:20]),
+}
+
+SETTINGS = {
+	"default": {},
+	"fast 22 kHz": {"unit_duration_ms": 60, "sample_rate": 22050},
+	"slow high pitch": {"unit_duration_ms": 150, "frequency": 900.0},
+}
+
+
+def _time(
+	morse: str, engine: str, repeat: int, settings: dict, *, cold: bool = False
+) -> tuple[float, int]:
+	best = float("inf")
+	frames = b""
+	for _ in range(repeat):
+		if cold:
+			morse_audio._run_templates.cache_clear()
+		start = time.perf_counter()
+		frames = render_morse_samples(morse, engine=engine, **settings)
+		best = min(best, time.perf_counter() - start)
+	return best, len(frames) // 2
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--engine", action="append", default=[])
+	args = parser.parse_args(argv)
+	engines = list(args.engine or available_engines())
+	missing = set(engines) - set(available_engines())
+	if missing:
+		raise SystemExit(f"engines not available here: {', '.join(sorted(missing))}")
+
+	for setting, options in SETTINGS.items():
+		print(f"{setting}:")
+		for name, text in TEXTS.items():
+			morse = convert_text_to_morse(text)
+			timings = {engine: _time(morse, engine, args.repeat, options) for engine in engines}
+			if "template" in timings:
+				timings = {
+					"template (cold)": _time(morse, "template", args.repeat, options, cold=True),
+					**timings,
+				}
+			samples = next(iter(timings.values()))[1]
+			rate = options.get("sample_rate", 44100)
+			line = f"  {name:16s} {samples / rate:6.1f} s audio"
+			baseline = timings.get("python", (None,))[0]
+			for engine, (seconds, _) in timings.items():
+				line += f"  {engine}: {seconds * 1000:7.1f} ms"
+				if baseline and engine != "python":
+					line += f" ({baseline / seconds:6.0f}x)"
+			print(line)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,109 @@
+"""Benchmark the precompiled transliteration table against a per-character loop.
+
+Usage::
+
+    python benchmarks/bench_transliteration.py [--size-mb 10] [--repeat 3]
+        [--text pg2600.txt ...] [--alphabet estonian]
+
+Always measures a mixed corpus: the translation text samples with accented,
+typographic and Cyrillic text mixed in, repeated to the requested size.
+Every ``--text`` file is measured as is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+	sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.main.python.resources import constants as consts  # noqa: E402
+from src.main.python.utils.alphabets import compile_alphabet  # noqa: E402
+from src.main.python.utils.transliteration import TRANSLITERATIONS, transliterate  # noqa: E402
+
+_FOREIGN = "„Crème brûlée“ — Straße, Ærø, naïve café; Щука и ёж. "
+
+
+def mixed_corpus(size_bytes: int) -> str:
+	samples = " ".join(consts.TRANSLATION_TEXT_SAMPLES) + " " + _FOREIGN
+	repeats = size_bytes // len(samples.encode("utf-8")) + 1
+	return "\n".join([samples] * repeats)
+
+
+def loop_transliterate(text: str, alphabet: str) -> str:
+	"""Reference per-character cleanup with the same rules, without a table."""
+
+	supported = compile_alphabet(alphabet).encode_table
+
+	def fold(char: str) -> str | None:
+		if char in supported:
+			return char
+		decomposed = unicodedata.normalize("NFKD", char)
+		folded = "".join(part for part in decomposed if not unicodedata.combining(part))
+		if decomposed == char or not all(part in supported for part in folded):
+			return None
+		return folded
+
+	pieces: list[str] = []
+	for char in text:
+		if char in supported:
+			pieces.append(char)
+		elif unicodedata.combining(char):
+			continue
+		elif char in TRANSLITERATIONS:
+			pieces.append("".join(fold(part) or part for part in TRANSLITERATIONS[char]))
+		else:
+			pieces.append(fold(char) or char)
+	return "".join(pieces)
+
+
+def _time(func, corpus: str, repeat: int) -> tuple[float, str]:
+	best = float("inf")
+	result = ""
+	for _ in range(repeat):
+		start = time.perf_counter()
+		result = func(corpus)
+		best = min(best, time.perf_counter() - start)
+	return best, result
+
+
+def measure(name: str, corpus: str, repeat: int, alphabet: str) -> None:
+	megabytes = len(corpus.encode("utf-8")) / (1024 * 1024)
+	print(f"{name}: {megabytes:.1f} MB, {len(corpus):,} characters")
+
+	loop_seconds, loop_output = _time(
+		lambda text: loop_transliterate(text, alphabet), corpus, repeat
+	)
+	table_seconds, table_output = _time(
+		lambda text: transliterate(text, alphabet=alphabet), corpus, repeat
+	)
+	if loop_output != table_output:
+		raise SystemExit(f"transliterated output differs on {name}")
+
+	print(f"  loop:    {loop_seconds:8.3f} s  {megabytes / loop_seconds:8.1f} MB/s")
+	print(f"  table:   {table_seconds:8.3f} s  {megabytes / table_seconds:8.1f} MB/s")
+	print(f"  speedup: {loop_seconds / table_seconds:8.1f}x")
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--size-mb", type=float, default=10.0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--text", type=Path, action="append", default=[])
+	parser.add_argument("--alphabet", default="estonian")
+	args = parser.parse_args(argv)
+
+	corpus = mixed_corpus(int(args.size_mb * 1024 * 1024))
+	measure("mixed corpus", corpus, args.repeat, args.alphabet)
+	for path in args.text:
+		text = path.read_text(encoding="utf-8", errors="ignore")
+		measure(path.name, text, args.repeat, args.alphabet)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,96 @@
+"""Benchmark word-level memoization of the text→Morse encoder.
+
+Usage::
+
+    python benchmarks/bench_word_cache.py [--size-mb 10] [--repeat 3]
+        [--text pg1342.txt ...] [--cache-size 4096]
+
+Always measures the exercise corpus (the translation text samples repeated to
+the requested size).  Every ``--text`` file, e.g. a Project Gutenberg plain
+text, is measured too after collapsing whitespace and dropping characters the
+encoder does not support.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+	sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.main.python.resources import constants as consts  # noqa: E402
+from src.main.python.utils.alphabets import compile_alphabet  # noqa: E402
+from src.main.python.utils.morse_translator import (  # noqa: E402
+	configure_word_cache,
+	convert_text_to_morse,
+	word_cache_stats,
+)
+
+
+def exercise_corpus(size_bytes: int) -> str:
+	samples = " ".join(consts.TRANSLATION_TEXT_SAMPLES)
+	repeats = size_bytes // len(samples.encode("utf-8")) + 1
+	return " ".join([samples] * repeats)
+
+
+def text_corpus(path: Path) -> str:
+	supported = compile_alphabet().encode_table
+	words = path.read_text(encoding="utf-8", errors="ignore").split()
+	cleaned = ("".join(char for char in word if char in supported) for word in words)
+	return " ".join(word for word in cleaned if word)
+
+
+def _time(func, corpus: str, repeat: int, setup=lambda: None) -> tuple[float, str]:
+	best = float("inf")
+	result = ""
+	for _ in range(repeat):
+		setup()
+		start = time.perf_counter()
+		result = func(corpus)
+		best = min(best, time.perf_counter() - start)
+	return best, result
+
+
+def measure(name: str, corpus: str, repeat: int, cache_size: int) -> None:
+	megabytes = len(corpus.encode("utf-8")) / (1024 * 1024)
+	words = corpus.count(" ") + 1
+	print(f"{name}: {megabytes:.1f} MB, {words:,} words")
+
+	plain_seconds, plain_output = _time(convert_text_to_morse, corpus, repeat)
+	# Every run starts cold, as when encoding a single document.
+	memo_seconds, memo_output = _time(
+		lambda text: convert_text_to_morse(text, memoize=True),
+		corpus,
+		repeat,
+		setup=lambda: configure_word_cache(cache_size),
+	)
+	if plain_output != memo_output:
+		raise SystemExit(f"memoized output differs on {name}")
+	stats = word_cache_stats()
+
+	print(f"  plain:      {plain_seconds:8.3f} s  {megabytes / plain_seconds:8.1f} MB/s")
+	print(f"  memoized:   {memo_seconds:8.3f} s  {megabytes / memo_seconds:8.1f} MB/s")
+	print(f"  speedup:    {plain_seconds / memo_seconds:8.1f}x")
+	print(f"  hit rate:   {stats.hit_rate:8.1%}  ({stats.currsize:,} words cached)")
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--size-mb", type=float, default=10.0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--text", type=Path, action="append", default=[])
+	parser.add_argument("--cache-size", type=int, default=4096)
+	args = parser.parse_args(argv)
+
+	corpus = exercise_corpus(int(args.size_mb * 1024 * 1024))
+	measure("exercise corpus", corpus, args.repeat, args.cache_size)
+	for path in args.text:
+		measure(path.name, text_corpus(path), args.repeat, args.cache_size)
+
+
+if __name__ == "__main__":
+	main()
@@ -20,6 +20,7 @@ from .services import (
 	create_translation_resources,
 	pygame,
 )
+from .services.audio_playback import stop_audio
 from .view_stack import ViewStack
 from .views.flashcard_view import FlashcardView
 from .views.home_view import HomeView, IntroductionView
@@ -134,7 +135,7 @@ class Application:
 		self.flashcard_view.show_menu()
 
 	def režiim2(self) -> None:
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self.reset_translation_state()
 		if self.translation_view is None:
 			return
@@ -143,7 +144,7 @@ class Application:
 		self.translation_view.show_menu()
 
 	def translation_sandbox(self) -> None:
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		if self.translation_sandbox_view is None:
 			return
 		if self.view_stack is not None:
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from ..exceptions import SessionNotInitializedError
 from ..model.flashcard_session import FlashcardSession
 from ..services.audio_cache import AudioCache
+from ..services.morse_audio import MorseAudio
 
 
 @dataclass(frozen=True)
@@ -20,7 +21,7 @@ class FlashcardState:
 	progress_value: float
 	is_first: bool
 	is_last: bool
-	audio_path: str | None
+	audio: MorseAudio | str | None
 	progress_text: str
 	has_previous: bool
 	next_label: str
@@ -81,7 +82,7 @@ class FlashcardPresenter:
 	def _build_state(self, session: FlashcardSession) -> FlashcardState:
 		card = session.current()
 		display_text = card.back if self._showing_back else card.front
-		audio_path = self._audio_cache.resolve_with_fallback(card.back, card.front)
+		audio = self._audio_cache.resolve_with_fallback(card.back, card.front)
 		progress_value = session.progress_percentage()
 		is_first = session.is_first()
 		is_last = session.is_last()
@@ -94,11 +95,11 @@ class FlashcardPresenter:
 			progress_value=progress_value,
 			is_first=is_first,
 			is_last=is_last,
-			audio_path=audio_path,
+			audio=audio,
 			progress_text=f"{progress_value:.1f}% läbitud",
 			has_previous=not is_first,
 			next_label="Lõpeta treening" if is_last else "Liigu edasi",
-			show_audio_button=self._showing_back and audio_path is not None,
+			show_audio_button=self._showing_back and audio is not None,
 		)
 
 	def _require_session(self) -> FlashcardSession:
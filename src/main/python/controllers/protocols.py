@@ -7,9 +7,11 @@ controller implementations.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Protocol
 
+from ..services.morse_audio import MorseAudio
 from .flashcard_controller import FlashcardState
 from .test_controller import TestQuestionState
 from .translation_controller import TranslationState
@@ -37,7 +39,7 @@ class TranslationPresenterProtocol(Protocol):
 	def previous(self) -> TranslationState: ...
 	def hint(self) -> str: ...
 	def check_answer(self, user_input: str) -> tuple[bool, str]: ...
-	def audio_path(self) -> str | None: ...
+	def audio(self) -> MorseAudio | None: ...
 	def title_for_mode(self, mode: str) -> str: ...
 
 
@@ -65,6 +67,7 @@ class SandboxPresenterProtocol(Protocol):
 	def current_state(self) -> SandboxState: ...
 	def toggle_mode(self) -> SandboxState: ...
 	def set_mode(self, mode: str) -> SandboxState: ...
+	def set_alphabet(self, alphabet: str) -> SandboxState: ...
 	def translate(self, text: str) -> SandboxState: ...
 	def generate_audio(
 		self,
@@ -73,9 +76,11 @@ class SandboxPresenterProtocol(Protocol):
 		unit_duration_ms: int | None = None,
 		volume: float | None = None,
 	) -> SandboxState: ...
+	def stream_audio(self) -> Iterator[MorseAudio]: ...
 	def clear_audio(self) -> SandboxState: ...
 	def save_audio_to_output(self) -> tuple[SandboxState, Path]: ...
 	def save_audio_as(self, destination: Path) -> tuple[SandboxState, Path]: ...
+	def next_output_path(self) -> Path: ...
 	def update_volume(self, volume: float) -> SandboxState: ...
 	def update_speed(self, unit_duration_ms: int) -> SandboxState: ...
 	def update_pitch(self, frequency_hz: float) -> SandboxState: ...
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from ..exceptions import SessionNotInitializedError
 from ..model.translation_session import TranslationSession
 from ..services.audio_cache import AudioCache
+from ..services.morse_audio import MorseAudio
 
 
 @dataclass(frozen=True)
@@ -20,7 +21,7 @@ class TranslationState:
 	progress_step: float
 	is_first: bool
 	is_last: bool
-	audio_path: str | None
+	audio: MorseAudio | None
 	progress_text: str
 	has_previous: bool
 	next_label: str
@@ -112,8 +113,8 @@ class TranslationPresenter:
 
 		return is_correct, correct
 
-	def audio_path(self) -> str | None:
-		"""Fetch the audio file path associated with the active prompt."""
+	def audio(self) -> MorseAudio | None:
+		"""Fetch the rendered audio for the active prompt."""
 
 		if self._active_mode != "morse_to_text" or self._audio_cache is None:
 			return None
@@ -136,9 +137,9 @@ class TranslationPresenter:
 
 		prompt = session.current_prompt()
 		if mode == "morse_to_text" and self._audio_cache is not None:
-			audio_path = self._audio_cache.resolve(prompt, prompt)
+			audio = self._audio_cache.resolve(prompt, prompt)
 		else:
-			audio_path = None
+			audio = None
 		is_first = session.is_first()
 		is_last = session.is_last()
 		prompt_style = "large" if mode == "text_to_morse" else "medium"
@@ -153,12 +154,12 @@ class TranslationPresenter:
 			progress_step=progress_step,
 			is_first=is_first,
 			is_last=is_last,
-			audio_path=audio_path,
+			audio=audio,
 			progress_text=f"{progress_value:.1f}% läbitud",
 			has_previous=not is_first,
 			next_label="Lõpeta treening" if is_last else "Liigu edasi",
 			prompt_style=prompt_style,
-			audio_available=audio_path is not None,
+			audio_available=audio is not None,
 		)
 
 	def _require_session(self) -> TranslationSession:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import shutil
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,8 +11,19 @@ from ..exceptions import (
 	NoAudioContentError,
 )
 from ..services.audio_settings import AudioSettings
-from ..services.morse_audio import synthesize_morse_audio
-from ..utils import morse_translator
+from ..services.morse_audio import MorseAudio, stream_morse_pcm, synthesize_morse_pcm
+from ..utils.alphabets import DEFAULT_ALPHABET, get_alphabet
+from ..utils.incremental_translation import DiffTranslator
+from ..utils.morse_validation import (
+	DEFAULT_TEXT_PLACEHOLDER,
+	ERROR_SIGNAL,
+	TranslationIssue,
+	issue_error,
+)
+from ..utils.nearest_codes import suggest_characters
+
+# Audio for playback is rendered at full scale; the mixer applies the volume.
+_PLAYBACK_VOLUME = 1.0
 
 
 @dataclass(frozen=True)
@@ -27,10 +38,11 @@ class SandboxState:
 	output_text: str
 	error_message: str | None
 	audio_ready: bool
-	audio_path: Path | None
 	volume: float
 	speed_ms: int
 	pitch_hz: float
+	issues: tuple[TranslationIssue, ...] = ()
+	alphabet: str = DEFAULT_ALPHABET
 
 
 class TranslationSandboxPresenter:
@@ -51,25 +63,38 @@ class TranslationSandboxPresenter:
 		"morse_to_text": "Tekst",
 	}
 
+	# What unsupported tokens translate to while they are being collected.
+	_PLACEHOLDERS = {
+		"text_to_morse": ERROR_SIGNAL,
+		"morse_to_text": DEFAULT_TEXT_PLACEHOLDER,
+	}
+
+	_MAX_SUGGESTIONS = 3
+
 	def __init__(self) -> None:
 		self._mode = "text_to_morse"
 		self._input_text = ""
 		self._output_text = ""
 		self._error_message: str | None = None
+		self._issues: tuple[TranslationIssue, ...] = ()
 		self._morse_source: str = ""
-		self._audio_path: Path | None = None
+		self._audio: MorseAudio | None = None
 		self._audio_settings = AudioSettings()
+		self._alphabet = DEFAULT_ALPHABET
+		self._translator = self._new_translator()
 
 	def current_state(self) -> SandboxState:
 		return self._build_state()
 
 	def toggle_mode(self) -> SandboxState:
 		self._mode = "morse_to_text" if self._mode == "text_to_morse" else "text_to_morse"
+		self._translator = self._new_translator()
 		self._input_text = ""
 		self._output_text = ""
 		self._error_message = None
+		self._issues = ()
 		self._morse_source = ""
-		self._discard_audio_file()
+		self._discard_audio()
 		return self._build_state()
 
 	def set_mode(self, mode: str) -> SandboxState:
@@ -78,46 +103,76 @@ class TranslationSandboxPresenter:
 		if mode == self._mode:
 			return self._build_state()
 		self._mode = mode
+		self._translator = self._new_translator()
 		self._input_text = ""
 		self._output_text = ""
 		self._error_message = None
+		self._issues = ()
 		self._morse_source = ""
-		self._discard_audio_file()
+		self._discard_audio()
 		return self._build_state()
 
+	def set_alphabet(self, alphabet: str) -> SandboxState:
+		get_alphabet(alphabet)
+		if alphabet == self._alphabet:
+			return self._build_state()
+		self._alphabet = alphabet
+		self._translator = self._new_translator()
+		return self.translate(self._input_text)
+
 	def translate(self, text: str) -> SandboxState:
 		self._input_text = text
+		self._issues = ()
 		trimmed = text.strip()
 		if not trimmed:
 			self._output_text = ""
 			self._error_message = None
 			self._morse_source = ""
-			self._discard_audio_file()
+			self._discard_audio()
 			return self._build_state()
 
+		previous_source = self._morse_source
 		try:
-			if self._mode == "text_to_morse":
-				self._output_text = morse_translator.convert_text_to_morse(text)
-				self._morse_source = self._output_text.strip()
-			else:
-				self._output_text = morse_translator.convert_morse_to_text(text)
-				self._morse_source = trimmed
-			self._error_message = None
+			# Only the words around the edit are re-translated, and every
+			# offending token is collected on the way; see DiffTranslator.
+			output = self._translator.translate(text)
 		except MorseTrainerError as exc:
 			self._output_text = ""
 			self._morse_source = ""
 			self._error_message = exc.user_message
-			self._discard_audio_file()
+			self._discard_audio()
 			return self._build_state()
 		except ValueError as exc:
 			# Fallback for any non-typed ValueError
 			self._output_text = ""
 			self._morse_source = ""
 			self._error_message = str(exc)
-			self._discard_audio_file()
+			self._discard_audio()
 			return self._build_state()
 
-		self._refresh_temp_audio()
+		self._issues = self._translator.issues
+		if self._issues:
+			self._output_text = ""
+			self._morse_source = ""
+			message = issue_error(self._issues[0], mode=self._mode).user_message
+			if len(self._issues) > 1:
+				message = f"{message} Vigu kokku: {len(self._issues)}."
+			hint = self._suggestion_hint()
+			self._error_message = f"{message} {hint}" if hint else message
+			self._discard_audio()
+			return self._build_state()
+
+		self._output_text = output
+		if self._mode == "text_to_morse":
+			self._morse_source = output.strip()
+		else:
+			self._morse_source = trimmed
+		self._error_message = None
+
+		# Audio is rendered when it is played or saved, never per keystroke;
+		# edits that leave the Morse unchanged keep an earlier render.
+		if self._morse_source != previous_source:
+			self._discard_audio()
 		return self._build_state()
 
 	def generate_audio(
@@ -135,47 +190,42 @@ class TranslationSandboxPresenter:
 			self._audio_settings = self._audio_settings.with_speed(unit_duration_ms)
 		if volume is not None:
 			self._audio_settings = self._audio_settings.with_volume(volume)
-		self._refresh_temp_audio()
+		self._render_audio()
 		return self._build_state()
 
+	def stream_audio(self) -> Iterator[MorseAudio]:
+		"""Return the audio as chunks rendered while they are played.
+
+		Playback can start before a long text is fully rendered; see
+		``stream_morse_pcm``.  The chunks are at full volume: the player
+		applies ``SandboxState.volume`` as a mixer gain.
+		"""
+
+		if not self._morse_source:
+			raise NoAudioContentError()
+		if self._audio is not None:
+			return iter((self._audio,))
+		return stream_morse_pcm(self._morse_source, **self._playback_settings.as_synthesis_kwargs)
+
 	def clear_audio(self) -> SandboxState:
-		self._discard_audio_file()
+		self._discard_audio()
 		return self._build_state()
 
 	def save_audio_to_output(self) -> tuple[SandboxState, Path]:
-		if not self._audio_path:
-			raise NoAudioContentError(user_message="Ei ole helifaili salvestamiseks.")
-		target = self._next_output_file()
-		try:
-			shutil.copy2(self._audio_path, target)
-		except OSError as exc:
-			raise AudioSaveError(
-				"Failed to save audio file",
-				user_message="Helifaili ei õnnestunud salvestada.",
-				cause=exc,
-			) from exc
-		self._discard_audio_file()
+		target = self._save_audio(self.next_output_path())
 		return self._build_state(), target
 
 	def save_audio_as(self, destination: Path) -> tuple[SandboxState, Path]:
-		if not self._audio_path:
-			raise NoAudioContentError(user_message="Ei ole helifaili salvestamiseks.")
 		resolved_destination = destination
 		if resolved_destination.suffix.lower() != ".wav":
 			resolved_destination = resolved_destination.with_suffix(".wav")
 		resolved_destination.parent.mkdir(parents=True, exist_ok=True)
-		try:
-			shutil.copy2(self._audio_path, resolved_destination)
-		except OSError as exc:
-			raise AudioSaveError(
-				"Failed to save audio file",
-				user_message="Helifaili ei õnnestunud salvestada.",
-				cause=exc,
-			) from exc
-		self._discard_audio_file()
-		return self._build_state(), resolved_destination
+		target = self._save_audio(resolved_destination)
+		return self._build_state(), target
+
+	def next_output_path(self) -> Path:
+		"""Return the next free ``output/tõlgeN.wav`` path, creating the directory."""
 
-	def _next_output_file(self) -> Path:
 		output_dir = Path.cwd() / "output"
 		output_dir.mkdir(parents=True, exist_ok=True)
 		prefix = "tõlge"
@@ -187,48 +237,75 @@ class TranslationSandboxPresenter:
 		next_index = highest_index + 1
 		return output_dir / f"{prefix}{next_index}.wav"
 
+	def _save_audio(self, target: Path) -> Path:
+		# Audio lives in memory until the user saves it; this is the only write.
+		# The playback render is at full volume, so the file bakes the volume in.
+		if self._audio is not None and self._playback_settings == self._audio_settings:
+			audio: MorseAudio | None = self._audio
+		else:
+			audio = self._synthesize(self._audio_settings)
+		if audio is None:
+			raise NoAudioContentError(user_message="Ei ole helifaili salvestamiseks.")
+		try:
+			audio.write_wav(target)
+		except OSError as exc:
+			raise AudioSaveError(
+				"Failed to save audio file",
+				user_message="Helifaili ei õnnestunud salvestada.",
+				cause=exc,
+			) from exc
+		return target
+
 	def update_volume(self, volume: float) -> SandboxState:
+		# A playback gain: the rendered audio stays valid.
 		self._audio_settings = self._audio_settings.with_volume(volume)
-		if self._morse_source:
-			self._refresh_temp_audio()
 		return self._build_state()
 
 	def update_speed(self, unit_duration_ms: int) -> SandboxState:
 		self._audio_settings = self._audio_settings.with_speed(unit_duration_ms)
-		if self._morse_source:
-			self._refresh_temp_audio()
+		self._discard_audio()
 		return self._build_state()
 
 	def update_pitch(self, frequency_hz: float) -> SandboxState:
 		self._audio_settings = self._audio_settings.with_pitch(frequency_hz)
-		if self._morse_source:
-			self._refresh_temp_audio()
+		self._discard_audio()
 		return self._build_state()
 
-	def _refresh_temp_audio(
-		self,
-	) -> None:
-		self._discard_audio_file()
+	def _new_translator(self) -> DiffTranslator:
+		return DiffTranslator(
+			self._mode, alphabet=self._alphabet, replacement=self._PLACEHOLDERS[self._mode]
+		)
+
+	def _suggestion_hint(self) -> str | None:
+		if self._mode != "morse_to_text" or not self._issues:
+			return None
+		suggestions = suggest_characters(self._issues[0].token, alphabet=self._alphabet)
+		if not suggestions:
+			return None
+		shown = ", ".join(suggestions[: self._MAX_SUGGESTIONS])
+		return f"Kas mõtlesid: {shown}?"
+
+	@property
+	def _playback_settings(self) -> AudioSettings:
+		return self._audio_settings.with_volume(_PLAYBACK_VOLUME)
+
+	def _render_audio(self) -> MorseAudio | None:
+		self._discard_audio()
+		self._audio = self._synthesize(self._playback_settings)
+		return self._audio
+
+	def _synthesize(self, settings: AudioSettings) -> MorseAudio | None:
 		if not self._morse_source:
-			return
+			return None
 		try:
-			self._audio_path = synthesize_morse_audio(
-				self._morse_source,
-				**self._audio_settings.as_synthesis_kwargs,
-			)
+			return synthesize_morse_pcm(self._morse_source, **settings.as_synthesis_kwargs)
 		except ValueError:
-			self._audio_path = None
+			return None
 
-	def _discard_audio_file(self) -> bool:
-		if not self._audio_path:
+	def _discard_audio(self) -> bool:
+		if self._audio is None:
 			return False
-		try:
-			if self._audio_path.exists():
-				self._audio_path.unlink()
-		except OSError:
-			pass
-		finally:
-			self._audio_path = None
+		self._audio = None
 		return True
 
 	def _build_state(self) -> SandboxState:
@@ -240,11 +317,12 @@ class TranslationSandboxPresenter:
 			input_text=self._input_text,
 			output_text=self._output_text,
 			error_message=self._error_message,
-			audio_ready=self._audio_path is not None,
-			audio_path=self._audio_path,
+			audio_ready=bool(self._morse_source),
 			volume=self._audio_settings.volume,
 			speed_ms=self._audio_settings.unit_duration_ms,
 			pitch_hz=self._audio_settings.frequency_hz,
+			issues=self._issues,
+			alphabet=self._alphabet,
 		)
 
 
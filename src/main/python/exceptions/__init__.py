@@ -8,7 +8,8 @@ Sub-modules:
     session     — SessionError, SessionNotInitializedError, SessionInvalidStateError
     translation — TranslationError, UnsupportedCharacterError, UnsupportedMorseSymbolError, EmptyInputError
     audio       — AudioError, NoAudioContentError, AudioSynthesisError, AudioSaveError
-    validation  — ValidationError, InvalidModeError, MismatchedDataError
+    validation  — ValidationError, InvalidModeError, InvalidManifestError, MismatchedDataError,
+                  UnknownAlphabetError
 
 All names are re-exported from this package so existing
 ``from ..exceptions import X`` imports continue to work unchanged.
@@ -25,7 +26,13 @@ from .translation import (
 	UnsupportedCharacterError,
 	UnsupportedMorseSymbolError,
 )
-from .validation import InvalidModeError, MismatchedDataError, ValidationError
+from .validation import (
+	InvalidManifestError,
+	InvalidModeError,
+	MismatchedDataError,
+	UnknownAlphabetError,
+	ValidationError,
+)
 
 __all__ = [
 	# Enums and dataclasses
@@ -50,7 +57,9 @@ __all__ = [
 	# Validation exceptions
 	"ValidationError",
 	"InvalidModeError",
+	"InvalidManifestError",
 	"MismatchedDataError",
+	"UnknownAlphabetError",
 	# Helpers
 	"get_user_message",
 ]
@@ -26,6 +26,44 @@ class InvalidModeError(ValidationError):
 		)
 
 
+class UnknownAlphabetError(ValidationError):
+	"""Raised when a Morse alphabet name is not registered."""
+
+	def __init__(
+		self,
+		alphabet: str,
+		*,
+		user_message: str | None = None,
+	) -> None:
+		self.alphabet = alphabet
+		super().__init__(
+			f"Unknown Morse alphabet: {alphabet}",
+			code=ErrorCode.INVALID_CONFIGURATION,
+			user_message=user_message or f"Tähestik '{alphabet}' pole toetatud.",
+		)
+
+
+class InvalidManifestError(ValidationError):
+	"""Raised when an audio export manifest cannot be read."""
+
+	def __init__(
+		self,
+		reason: str,
+		*,
+		row: int | None = None,
+		user_message: str | None = None,
+	) -> None:
+		self.reason = reason
+		self.row = row
+		location = f" (row {row})" if row is not None else ""
+		super().__init__(
+			f"Invalid export manifest{location}: {reason}",
+			code=ErrorCode.INVALID_CONFIGURATION,
+			user_message=user_message
+			or f"Ekspordi nimekiri on vigane{f' (rida {row})' if row is not None else ''}.",
+		)
+
+
 class MismatchedDataError(ValidationError):
 	"""Raised when data collections have mismatched sizes."""
 
@@ -44,6 +82,8 @@ class MismatchedDataError(ValidationError):
 
 __all__ = [
 	"ValidationError",
+	"InvalidManifestError",
 	"InvalidModeError",
 	"MismatchedDataError",
+	"UnknownAlphabetError",
 ]
@@ -71,6 +71,63 @@ NUMBER_SYMBOL_MORSE_PAIRS = (
 	("_", "..--.-"),
 )
 
+# Additional alphabets for the registry in ``utils.alphabets``.  The table
+# above is the Estonian one: the international letters plus š, ä, ö and ü.
+ITU_LETTER_MORSE_PAIRS = tuple(
+	(letter, code) for letter, code in LETTER_MORSE_PAIRS if "a" <= letter <= "z"
+)
+
+CYRILLIC_LETTER_MORSE_PAIRS = (
+	("а", ".-"),
+	("б", "-..."),
+	("в", ".--"),
+	("г", "--."),
+	("д", "-.."),
+	("е", "."),
+	("ё", "."),
+	("ж", "...-"),
+	("з", "--.."),
+	("и", ".."),
+	("й", ".---"),
+	("к", "-.-"),
+	("л", ".-.."),
+	("м", "--"),
+	("н", "-."),
+	("о", "---"),
+	("п", ".--."),
+	("р", ".-."),
+	("с", "..."),
+	("т", "-"),
+	("у", "..-"),
+	("ф", "..-."),
+	("х", "...."),
+	("ц", "-.-."),
+	("ч", "---."),
+	("ш", "----"),
+	("щ", "--.-"),
+	("ъ", "--.--"),
+	("ы", "-.--"),
+	("ь", "-..-"),
+	("э", "..-.."),
+	("ю", "..--"),
+	("я", ".-.-"),
+)
+
+# Prosigns: letters sent without letter gaps, written between angle brackets.
+# Several share a code with a symbol above (<AR> and "+", <BT> and "=", ...).
+PROSIGN_MORSE_PAIRS = (
+	("<AR>", ".-.-."),
+	("<AS>", ".-..."),
+	("<BK>", "-...-.-"),
+	("<BT>", "-...-"),
+	("<CL>", "-.-..-.."),
+	("<CT>", "-.-.-"),
+	("<KN>", "-.--."),
+	("<SK>", "...-.-"),
+	("<SN>", "...-."),
+	("<SOS>", "...---..."),
+)
+
 NUMBER_TO_MORSE_MAP = {char: code for char, code in NUMBER_SYMBOL_MORSE_PAIRS if char.isdigit()}
 SYMBOL_TO_MORSE_MAP = {char: code for char, code in NUMBER_SYMBOL_MORSE_PAIRS if not char.isdigit()}
 
@@ -85,10 +142,13 @@ SYMBOL_KEYS = tuple(char for char, _ in NUMBER_SYMBOL_MORSE_PAIRS if not char.is
 SYMBOL_ORDER = SYMBOL_KEYS
 
 __all__ = [
+	"CYRILLIC_LETTER_MORSE_PAIRS",
+	"ITU_LETTER_MORSE_PAIRS",
 	"LETTER_MORSE_PAIRS",
 	"LETTER_TO_MORSE_MAP",
 	"NUMBER_SYMBOL_MORSE_PAIRS",
 	"NUMBER_TO_MORSE_MAP",
+	"PROSIGN_MORSE_PAIRS",
 	"SYMBOL_TO_MORSE_MAP",
 	"UPPERCASE_LETTER_KEYS",
 	"UPPERCASE_LETTER_ORDER",
@@ -3,40 +3,61 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from collections.abc import Mapping
-from pathlib import Path
 
-from .morse_audio import synthesize_morse_audio
+from .audio_settings import AudioSettings
+from .morse_audio import MorseAudio, synthesize_morse_pcm
 
 _log = logging.getLogger(__name__)
 
+# A rendered exercise sentence is a few megabytes of PCM.
+DEFAULT_MAX_ENTRIES = 32
 
-class AudioCache:
-	"""Synthesizes and caches morse audio files, with optional static fallback."""
 
-	def __init__(self, static_map: Mapping[str, str] | None = None) -> None:
+class AudioCache:
+	"""Synthesizes and caches morse audio in memory, with optional static fallback.
+
+	The most recently used *max_entries* renderings are kept; static entries
+	are paths to bundled recordings.  Audio is rendered with *settings*, or
+	the synthesiser's own defaults without them; a lower sample rate or an
+	8-bit format shrinks every cached entry accordingly.
+	"""
+
+	def __init__(
+		self,
+		static_map: Mapping[str, str] | None = None,
+		*,
+		max_entries: int = DEFAULT_MAX_ENTRIES,
+		settings: AudioSettings | None = None,
+	) -> None:
 		self._static_map: Mapping[str, str] = static_map or {}
-		self._cache: dict[str, str] = {}
+		self._cache: OrderedDict[str, MorseAudio] = OrderedDict()
+		self._max_entries = max_entries
+		self._synthesis_kwargs = settings.as_synthesis_kwargs if settings is not None else {}
 
-	def resolve(self, morse_code: str, key: str) -> str | None:
+	def resolve(self, morse_code: str, key: str) -> MorseAudio | None:
 		"""Synthesize audio for *morse_code*, caching under *key*.
 
-		Returns the file path as a string, or ``None`` on error.
+		Returns the rendered audio, or ``None`` on error.
 		"""
 
 		cached = self._cache.get(key)
 		if cached is not None:
+			self._cache.move_to_end(key)
 			return cached
 
 		try:
-			path = synthesize_morse_audio(morse_code)
-			self._cache[key] = str(path)
-			return str(path)
+			audio = synthesize_morse_pcm(morse_code, **self._synthesis_kwargs)
 		except Exception:
 			_log.debug("audio synthesis failed for key=%s", key, exc_info=True)
 			return None
+		self._cache[key] = audio
+		if len(self._cache) > self._max_entries:
+			self._cache.popitem(last=False)
+		return audio
 
-	def resolve_with_fallback(self, morse_code: str, key: str) -> str | None:
+	def resolve_with_fallback(self, morse_code: str, key: str) -> MorseAudio | str | None:
 		"""Try dynamic synthesis first, then fall back to the static map."""
 
 		result = self.resolve(morse_code, key)
@@ -45,14 +66,9 @@ class AudioCache:
 		return self._static_map.get(key)
 
 	def cleanup(self) -> None:
-		"""Delete all cached temporary audio files."""
+		"""Drop all cached audio."""
 
-		for path_str in self._cache.values():
-			try:
-				Path(path_str).unlink(missing_ok=True)
-			except OSError:
-				_log.debug("failed to delete %s", path_str, exc_info=True)
 		self._cache.clear()
 
 
-__all__ = ["AudioCache"]
+__all__ = ["DEFAULT_MAX_ENTRIES", "AudioCache"]
@@ -0,0 +1,218 @@
+"""Playing audio through pygame without going through temporary files.
+
+Synthesised Morse is handed to the mixer as a ``Sound`` built on its PCM
+buffer; bundled recordings are still files and stream through
+``mixer.music``.  Long renders are played as a stream of chunks queued on
+one mixer channel, so sound starts before the render has finished.  The
+pygame module is passed in, as the views receive it.
+
+Volume is a mixer gain between 0 and 1, not part of the samples, so it can
+change while audio plays without rendering anything again.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+from .morse_audio import MorseAudio
+
+# Signed 16-bit samples, as reported by ``mixer.get_init``.
+_MIXER_S16 = -16
+
+# The mixer plays a Sound only while something references it.
+_playing: list[Any] = []
+
+
+def make_sound(pygame_module: Any, audio: MorseAudio) -> Any:
+	"""Return a ``pygame.mixer.Sound`` playing *audio*.
+
+	When the mixer runs at the audio's rate with 16-bit samples the PCM is
+	handed over as a buffer, mono duplicated across the mixer's channels;
+	otherwise the mixer converts an in-memory WAV.
+	"""
+
+	mixer = pygame_module.mixer
+	settings = mixer.get_init()
+	if not settings:
+		raise pygame_module.error("mixer not initialized")
+	frequency, size, channels = settings
+	if (
+		frequency == audio.sample_rate
+		and size == _MIXER_S16
+		and audio.sample_format == "s16"
+		and sys.byteorder == "little"
+		and audio.channels in (1, channels)
+	):
+		return mixer.Sound(buffer=_spread_channels(audio.frames, audio.channels, channels))
+	return mixer.Sound(file=io.BytesIO(audio.to_wav_bytes()))
+
+
+def play_audio(
+	pygame_module: Any, audio: MorseAudio | str | os.PathLike[str], *, volume: float = 1.0
+) -> None:
+	"""Stop whatever is playing and play *audio*, rendered PCM or a sound file.
+
+	Raises ``pygame_module.error`` when the mixer cannot play it.
+	"""
+
+	stop_audio(pygame_module)
+	if isinstance(audio, MorseAudio):
+		sound = make_sound(pygame_module, audio)
+		sound.set_volume(volume)
+		sound.play()
+		_playing.append(sound)
+	else:
+		pygame_module.mixer.music.load(os.fspath(audio))
+		pygame_module.mixer.music.set_volume(volume)
+		pygame_module.mixer.music.play()
+
+
+class AudioStream:
+	"""Chunks of audio played back to back on one mixer channel.
+
+	A channel holds one playing and one queued sound.  ``pump`` queues the
+	next chunk whenever the queue slot is free, pulling it from the chunk
+	iterator only then, so at most three chunks exist at once however long
+	the audio is.  It must be called more often than a chunk lasts.
+	"""
+
+	def __init__(
+		self, pygame_module: Any, chunks: Iterable[MorseAudio], *, volume: float = 1.0
+	) -> None:
+		self._pygame = pygame_module
+		self._chunks = iter(chunks)
+		self._channel: Any = None
+		self._sounds: deque[Any] = deque(maxlen=2)
+		self._volume = volume
+
+	def start(self) -> None:
+		"""Play the first chunk and queue the second.
+
+		Raises ``pygame_module.error`` when no mixer channel is free.
+		"""
+
+		sound = self._next_sound()
+		if sound is None:
+			return
+		self._channel = sound.play()
+		if self._channel is None:
+			raise self._pygame.error("no free mixer channel")
+		self.pump()
+
+	def pump(self) -> bool:
+		"""Queue the next chunk if there is room; return whether the stream is still playing."""
+
+		channel = self._channel
+		if channel is None:
+			return False
+		if channel.get_queue() is None:
+			sound = self._next_sound()
+			if sound is not None:
+				# Starts at once if the channel already ran dry.
+				channel.queue(sound)
+		if channel.get_busy():
+			return True
+		self._channel = None
+		self._sounds.clear()
+		return False
+
+	def set_volume(self, volume: float) -> None:
+		"""Change the volume of the playing and queued chunks and all later ones."""
+
+		self._volume = volume
+		for sound in self._sounds:
+			sound.set_volume(volume)
+
+	def stop(self) -> None:
+		if self._channel is not None:
+			self._channel.stop()
+			self._channel = None
+		self._sounds.clear()
+
+	def _next_sound(self) -> Any:
+		chunk = next(self._chunks, None)
+		if chunk is None:
+			return None
+		sound = make_sound(self._pygame, chunk)
+		sound.set_volume(self._volume)
+		self._sounds.append(sound)
+		return sound
+
+
+def stream_audio(
+	pygame_module: Any, chunks: Iterable[MorseAudio], *, volume: float = 1.0
+) -> AudioStream:
+	"""Stop whatever is playing and start playing *chunks* as they are produced.
+
+	Keep calling ``pump_audio`` while it returns ``True``.  Raises
+	``pygame_module.error`` when the mixer cannot play the audio.
+	"""
+
+	stop_audio(pygame_module)
+	stream = AudioStream(pygame_module, chunks, volume=volume)
+	stream.start()
+	_playing.append(stream)
+	return stream
+
+
+def stop_audio(pygame_module: Any) -> None:
+	"""Stop buffered sounds, streams and the music stream."""
+
+	for playing in _playing:
+		if isinstance(playing, AudioStream):
+			playing.stop()
+	pygame_module.mixer.music.stop()
+	pygame_module.mixer.stop()
+	_playing.clear()
+
+
+def set_volume(pygame_module: Any, volume: float) -> None:
+	"""Change the volume of whatever ``play_audio`` or ``stream_audio`` is playing."""
+
+	for playing in _playing:
+		playing.set_volume(volume)
+	pygame_module.mixer.music.set_volume(volume)
+
+
+def audio_busy(pygame_module: Any) -> bool:
+	"""Return whether anything started by ``play_audio`` is still playing."""
+
+	return bool(pygame_module.mixer.music.get_busy() or pygame_module.mixer.get_busy())
+
+
+def pump_audio(pygame_module: Any) -> bool:
+	"""Top up the queue of every stream; return whether anything is still playing."""
+
+	streaming = False
+	for playing in _playing:
+		if isinstance(playing, AudioStream):
+			streaming = playing.pump() or streaming
+	return streaming or audio_busy(pygame_module)
+
+
+def _spread_channels(frames: bytes, source: int, target: int) -> bytes:
+	if source == target:
+		return frames
+	mono = array("h", frames)
+	spread = array("h", bytes(len(frames) * target))
+	for channel in range(target):
+		spread[channel::target] = mono
+	return spread.tobytes()
+
+
+__all__ = [
+	"AudioStream",
+	"audio_busy",
+	"make_sound",
+	"play_audio",
+	"pump_audio",
+	"set_volume",
+	"stop_audio",
+	"stream_audio",
+]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+from .morse_audio import SAMPLE_FORMATS
 
 _MIN_VOLUME = 0.0
 _MAX_VOLUME = 1.0
@@ -11,6 +13,12 @@ _MAX_UNIT_DURATION_MS = 180
 _DEFAULT_FREQUENCY_HZ = 400.0
 _DEFAULT_UNIT_DURATION_MS = 60
 _DEFAULT_VOLUME = 0.5
+_DEFAULT_SAMPLE_RATE = 44100
+_DEFAULT_SAMPLE_FORMAT = "s16"
+
+# Rates offered for rendering; even 8 kHz leaves headroom above the
+# highest 800 Hz tone.
+SAMPLE_RATES = (8000, 16000, 22050, 44100)
 
 
 @dataclass(frozen=True)
@@ -20,35 +28,47 @@ class AudioSettings:
 	volume: float = _DEFAULT_VOLUME
 	unit_duration_ms: int = _DEFAULT_UNIT_DURATION_MS
 	frequency_hz: float = _DEFAULT_FREQUENCY_HZ
+	sample_rate: int = _DEFAULT_SAMPLE_RATE
+	sample_format: str = _DEFAULT_SAMPLE_FORMAT
 
 	def with_volume(self, volume: float) -> AudioSettings:
-		return AudioSettings(
-			volume=_clamp(volume, _MIN_VOLUME, _MAX_VOLUME),
-			unit_duration_ms=self.unit_duration_ms,
-			frequency_hz=self.frequency_hz,
-		)
+		return replace(self, volume=_clamp(volume, _MIN_VOLUME, _MAX_VOLUME))
 
 	def with_speed(self, unit_duration_ms: int) -> AudioSettings:
 		clamped = int(_clamp(unit_duration_ms, _MIN_UNIT_DURATION_MS, _MAX_UNIT_DURATION_MS))
-		return AudioSettings(
-			volume=self.volume,
-			unit_duration_ms=clamped,
-			frequency_hz=self.frequency_hz,
-		)
+		return replace(self, unit_duration_ms=clamped)
 
 	def with_pitch(self, frequency_hz: float) -> AudioSettings:
-		return AudioSettings(
-			volume=self.volume,
-			unit_duration_ms=self.unit_duration_ms,
-			frequency_hz=_clamp(frequency_hz, _MIN_FREQUENCY_HZ, _MAX_FREQUENCY_HZ),
+		return replace(
+			self, frequency_hz=_clamp(frequency_hz, _MIN_FREQUENCY_HZ, _MAX_FREQUENCY_HZ)
 		)
 
+	def with_sample_rate(self, sample_rate: int) -> AudioSettings:
+		"""Return a copy rendering at *sample_rate*, one of ``SAMPLE_RATES``."""
+
+		if sample_rate not in SAMPLE_RATES:
+			rates = ", ".join(map(str, SAMPLE_RATES))
+			raise ValueError(f"Unsupported sample rate {sample_rate}; choose one of {rates}")
+		return replace(self, sample_rate=int(sample_rate))
+
+	def with_sample_format(self, sample_format: str) -> AudioSettings:
+		"""Return a copy rendering *sample_format*: ``"u8"``, ``"s16"`` or ``"mulaw"``."""
+
+		if sample_format not in SAMPLE_FORMATS:
+			formats = ", ".join(SAMPLE_FORMATS)
+			raise ValueError(
+				f"Unsupported sample format {sample_format!r}; choose one of {formats}"
+			)
+		return replace(self, sample_format=sample_format)
+
 	@property
-	def as_synthesis_kwargs(self) -> dict[str, float | int]:
+	def as_synthesis_kwargs(self) -> dict[str, float | int | str]:
 		return {
 			"volume": self.volume,
 			"unit_duration_ms": self.unit_duration_ms,
 			"frequency": self.frequency_hz,
+			"sample_rate": self.sample_rate,
+			"sample_format": self.sample_format,
 		}
 
 
@@ -56,4 +76,4 @@ def _clamp(value: float, lower: float, upper: float) -> float:
 	return max(lower, min(value, upper))
 
 
-__all__ = ["AudioSettings"]
+__all__ = ["SAMPLE_RATES", "AudioSettings"]
@@ -0,0 +1,315 @@
+"""Rendering many phrases to WAV files in parallel.
+
+A manifest lists the phrases, as text or Morse, each with optional audio
+settings.  Every item gets a deterministic file name, renders in a worker
+process straight into its file, and is written atomically; its name and a
+hash of its content are then appended to a journal in the output directory.
+Running the same manifest again skips everything the journal records with
+unchanged content, so an interrupted job resumes where it stopped, and an
+edited row is rendered again.
+
+Manifests are CSV with a header row or a JSON list of objects, using the
+keys ``text`` or ``morse`` (one of them), and optionally ``name``,
+``volume``, ``unit_duration_ms``, ``frequency_hz``, ``sample_rate``,
+``sample_format`` and ``alphabet``.
+
+Run ``python -m src.main.python.services.batch_export manifest.csv out/``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from ..exceptions import InvalidManifestError, MorseTrainerError
+from ..utils.alphabets import DEFAULT_ALPHABET
+from ..utils.morse_translator import convert_text_to_morse
+from ..utils.timing_plan import compile_timing_plan
+from .audio_settings import AudioSettings
+from .morse_audio import synthesize_morse_pcm, write_morse_wav
+
+JOURNAL_NAME = "export.journal"
+# Items handed to a worker at a time; large enough to amortise the IPC.
+DEFAULT_CHUNKSIZE = 16
+
+_SETTING_FIELDS = {
+	"volume": AudioSettings.with_volume,
+	"unit_duration_ms": AudioSettings.with_speed,
+	"frequency_hz": AudioSettings.with_pitch,
+	"sample_rate": AudioSettings.with_sample_rate,
+}
+_DEFAULT_SETTINGS = AudioSettings()
+
+
+@dataclass(frozen=True)
+class ExportItem:
+	"""One phrase to render: its Morse, settings and output file name."""
+
+	name: str
+	morse: str
+	settings: AudioSettings = AudioSettings()
+
+
+@dataclass(frozen=True)
+class ExportReport:
+	"""Outcome of an export run; *failed* pairs file names with the error."""
+
+	written: int
+	skipped: int
+	failed: tuple[tuple[str, str], ...] = ()
+
+
+def default_name(morse: str, settings: AudioSettings) -> str:
+	"""Return the file name for *morse* at *settings*, the same on every run."""
+
+	key = f"{morse}|{settings.volume!r}|{settings.unit_duration_ms}|{settings.frequency_hz!r}"
+	# Output settings join the key only when changed, keeping earlier names.
+	if (settings.sample_rate, settings.sample_format) != (
+		_DEFAULT_SETTINGS.sample_rate,
+		_DEFAULT_SETTINGS.sample_format,
+	):
+		key = f"{key}|{settings.sample_rate}|{settings.sample_format}"
+	return f"morse_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.wav"
+
+
+def load_manifest(path: str | os.PathLike[str]) -> list[ExportItem]:
+	"""Read a CSV or JSON manifest into export items.
+
+	Text is converted to Morse here, so a bad row is reported with its
+	number before any rendering starts.  So is a name given to two rows
+	with different content; rows with equal content share their file.
+	"""
+
+	manifest = Path(path)
+	try:
+		with open(manifest, encoding="utf-8", newline="") as handle:
+			if manifest.suffix.lower() == ".json":
+				rows = json.load(handle)
+				if not isinstance(rows, list):
+					raise InvalidManifestError("expected a JSON list of objects")
+			else:
+				rows = list(csv.DictReader(handle))
+	except (OSError, UnicodeDecodeError, json.JSONDecodeError, csv.Error) as exc:
+		raise InvalidManifestError(str(exc)) from exc
+
+	items = []
+	first_rows: dict[str, tuple[int, str]] = {}
+	for number, row in enumerate(rows, 1):
+		item = _parse_row(row, number)
+		first, digest = first_rows.setdefault(item.name, (number, content_digest(item)))
+		if digest != content_digest(item):
+			raise InvalidManifestError(
+				f"name {item.name!r} is already used by row {first} for other audio", row=number
+			)
+		items.append(item)
+	return items
+
+
+def _parse_row(row: object, number: int) -> ExportItem:
+	if not isinstance(row, dict):
+		raise InvalidManifestError("expected an object", row=number)
+	text = str(row.get("text") or "").strip()
+	morse = str(row.get("morse") or "").strip()
+	if bool(text) == bool(morse):
+		raise InvalidManifestError("give exactly one of 'text' and 'morse'", row=number)
+
+	settings = AudioSettings()
+	for field, setter in _SETTING_FIELDS.items():
+		value = row.get(field)
+		if value in (None, ""):
+			continue
+		try:
+			settings = setter(settings, float(value))
+		except (TypeError, ValueError) as exc:
+			raise InvalidManifestError(f"{field}: {exc}", row=number) from None
+	sample_format = str(row.get("sample_format") or "").strip()
+	if sample_format:
+		try:
+			settings = settings.with_sample_format(sample_format)
+		except ValueError as exc:
+			raise InvalidManifestError(str(exc), row=number) from None
+
+	try:
+		if text:
+			morse = convert_text_to_morse(
+				text, alphabet=str(row.get("alphabet") or DEFAULT_ALPHABET)
+			)
+		compile_timing_plan(morse)
+	except MorseTrainerError as exc:
+		raise InvalidManifestError(str(exc), row=number) from exc
+
+	name = str(row.get("name") or "").strip()
+	if not name:
+		name = default_name(morse, settings)
+	elif Path(name).name != name or name.startswith("."):
+		raise InvalidManifestError(f"name {name!r} is not a plain file name", row=number)
+	elif not name.lower().endswith(".wav"):
+		name = f"{name}.wav"
+	return ExportItem(name=name, morse=morse, settings=settings)
+
+
+def content_digest(item: ExportItem) -> str:
+	"""Return a hash of everything that determines the audio of *item*."""
+
+	settings = item.settings
+	key = (
+		f"{item.morse}|{settings.volume!r}|{settings.unit_duration_ms}|{settings.frequency_hz!r}"
+		f"|{settings.sample_rate}|{settings.sample_format}"
+	)
+	return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def read_journal(path: str | os.PathLike[str]) -> dict[str, str]:
+	"""Map the names a journal records as written to their content digests.
+
+	A torn last line is ignored, and the latest entry for a name wins.
+	Entries without a digest map to ``""`` and match no item.
+	"""
+
+	try:
+		with open(path, encoding="utf-8") as handle:
+			lines = handle.read().split("\n")
+	except FileNotFoundError:
+		return {}
+	journaled: dict[str, str] = {}
+	for line in filter(None, lines[:-1]):
+		name, tab, digest = line.rpartition("\t")
+		if not tab:
+			name, digest = line, ""
+		journaled[name] = digest
+	return journaled
+
+
+def export_batch(
+	items: Iterable[ExportItem],
+	output_dir: str | os.PathLike[str],
+	*,
+	workers: int | None = None,
+	engine: str | None = None,
+	chunksize: int = DEFAULT_CHUNKSIZE,
+	on_progress: Callable[[int, int], None] | None = None,
+) -> ExportReport:
+	"""Render *items* into *output_dir*, skipping those already journaled.
+
+	Items sharing a name and content are rendered once; a later item reusing
+	a name for other content is reported as failed.  An item is skipped when
+	the journal records its name with the same content and the file exists.
+	*workers* defaults to the CPU count; with one worker everything runs in
+	this process.  *on_progress* is called with ``(done, total)`` after every
+	item of this run.  A failing item is reported, not raised, and stays out
+	of the journal so the next run retries it.
+	"""
+
+	directory = Path(output_dir)
+	directory.mkdir(parents=True, exist_ok=True)
+	journal = directory / JOURNAL_NAME
+	finished = read_journal(journal)
+
+	digests: dict[str, str] = {}
+	pending: dict[str, ExportItem] = {}
+	skipped = 0
+	failed: list[tuple[str, str]] = []
+	for item in items:
+		digest = content_digest(item)
+		if item.name in digests:
+			if digests[item.name] != digest:
+				failed.append((item.name, "name already used for other audio"))
+			continue
+		digests[item.name] = digest
+		if finished.get(item.name) == digest and (directory / item.name).exists():
+			skipped += 1
+			continue
+		pending[item.name] = item
+
+	written = 0
+	total = len(pending)
+	with open(journal, "a", encoding="utf-8") as log:
+		for done, (name, error) in enumerate(
+			_run(list(pending.values()), directory, workers, engine, chunksize), 1
+		):
+			if error is None:
+				log.write(f"{name}\t{digests[name]}\n")
+				log.flush()
+				written += 1
+			else:
+				failed.append((name, error))
+			if on_progress is not None:
+				on_progress(done, total)
+	return ExportReport(written=written, skipped=skipped, failed=tuple(failed))
+
+
+def _run(
+	items: list[ExportItem],
+	directory: Path,
+	workers: int | None,
+	engine: str | None,
+	chunksize: int,
+) -> Iterator[tuple[str, str | None]]:
+	render = partial(_export_item, directory=directory, engine=engine)
+	workers = min(workers or os.cpu_count() or 1, max(len(items), 1))
+	if workers == 1:
+		yield from map(render, items)
+		return
+	executor = ProcessPoolExecutor(max_workers=workers)
+	try:
+		yield from executor.map(render, items, chunksize=chunksize)
+	finally:
+		# On interruption, drop the queued work instead of finishing it.
+		executor.shutdown(cancel_futures=True)
+
+
+def _export_item(
+	item: ExportItem, *, directory: Path, engine: str | None
+) -> tuple[str, str | None]:
+	try:
+		if engine is None:
+			# Memory-mapped, so an hour-long item needs no more RAM than a short one.
+			write_morse_wav(item.morse, directory / item.name, **item.settings.as_synthesis_kwargs)
+		else:
+			audio = synthesize_morse_pcm(
+				item.morse, engine=engine, **item.settings.as_synthesis_kwargs
+			)
+			audio.write_wav(directory / item.name)
+	except (MorseTrainerError, ValueError, OSError) as exc:
+		return item.name, str(exc)
+	return item.name, None
+
+
+def main(argv: list[str] | None = None) -> None:
+	parser = argparse.ArgumentParser(description="Render a manifest of phrases to WAV files.")
+	parser.add_argument("manifest", type=Path)
+	parser.add_argument("output_dir", type=Path)
+	parser.add_argument("--workers", type=int)
+	parser.add_argument("--engine")
+	args = parser.parse_args(argv)
+
+	items = load_manifest(args.manifest)
+	report = export_batch(items, args.output_dir, workers=args.workers, engine=args.engine)
+	print(f"{report.written} written, {report.skipped} already done, {len(report.failed)} failed")
+	for name, error in report.failed:
+		print(f"  {name}: {error}")
+
+
+__all__ = [
+	"DEFAULT_CHUNKSIZE",
+	"JOURNAL_NAME",
+	"ExportItem",
+	"ExportReport",
+	"content_digest",
+	"default_name",
+	"export_batch",
+	"load_manifest",
+	"read_journal",
+]
+
+
+if __name__ == "__main__":
+	main()
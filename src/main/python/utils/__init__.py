@@ -1,5 +1,7 @@
 """Shared utility helpers for the Morse code trainer."""
 
-from . import morse_translator
+from . import morse_codec, morse_translator
 
-__all__ = ["morse_translator"]
+morse_codec.register()
+
+__all__ = ["morse_codec", "morse_translator"]
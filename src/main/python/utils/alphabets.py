@@ -0,0 +1,160 @@
+"""Registry of Morse alphabets compiled into lookup structures on first use.
+
+An ``Alphabet`` is just its (character, code) tables.  ``compile_alphabet``
+turns one into the encode table, the unsupported-character filter and the
+decode tables the translators need, along with the decoding tree those tables
+are built from, and caches the result for the rest of the process, so startup only pays for the default alphabet and switching between
+alphabets afterwards is a cache lookup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+
+from ..exceptions import UnknownAlphabetError
+from ..resources import morse_data
+from .morse_tree import DichotomicTree, code_for_node
+
+DEFAULT_ALPHABET = "estonian"
+
+# Marker used while encoding repeated spaces; see ``convert_text_to_morse``.
+WORD_GAP_MARKER = "\x00"
+
+
+@dataclass(frozen=True)
+class Alphabet:
+	"""Source tables for one Morse alphabet.
+
+	*prosign_pairs* are multi-character tokens encoded as one symbol; they are
+	only used in prosign mode, see ``utils.prosigns``.
+	"""
+
+	name: str
+	label: str
+	letter_pairs: tuple[tuple[str, str], ...]
+	other_pairs: tuple[tuple[str, str], ...] = morse_data.NUMBER_SYMBOL_MORSE_PAIRS
+	prosign_pairs: tuple[tuple[str, str], ...] = morse_data.PROSIGN_MORSE_PAIRS
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledAlphabet:
+	"""Read-only lookup structures built from an ``Alphabet``.
+
+	``lookup`` and ``marked_lookup`` are the bound ``__getitem__`` of the
+	encode tables, kept alongside the read-only views because the translators
+	call them once per character; ``upper_lookup`` and ``lower_lookup`` map
+	each code in ``codes`` to its character, capitalised or not, for the
+	decoder.  ``tree`` is the dichotomic tree those decode tables are built
+	from; the string translators never walk it, but the packed, segmenting
+	and nearest-code decoders index its nodes directly.  Instances hash by
+	identity, so caches keyed on them are invalidated when an alphabet is
+	registered again.
+	"""
+
+	alphabet: Alphabet
+	encode_table: Mapping[str, str]
+	unsupported_filter: Mapping[int, None]
+	codes: frozenset[str]
+	tree: DichotomicTree
+	lookup: Callable[[str], str]
+	marked_lookup: Callable[[str], str]
+	upper_lookup: Callable[[str], str]
+	lower_lookup: Callable[[str], str]
+
+	@property
+	def name(self) -> str:
+		return self.alphabet.name
+
+
+_REGISTRY: dict[str, Alphabet] = {}
+
+
+def register_alphabet(alphabet: Alphabet) -> None:
+	"""Add *alphabet* to the registry, replacing any alphabet with its name."""
+
+	_REGISTRY[alphabet.name] = alphabet
+	compile_alphabet.cache_clear()
+
+
+def available_alphabets() -> tuple[Alphabet, ...]:
+	"""Return the registered alphabets in registration order."""
+
+	return tuple(_REGISTRY.values())
+
+
+def get_alphabet(name: str) -> Alphabet:
+	try:
+		return _REGISTRY[name]
+	except KeyError:
+		raise UnknownAlphabetError(name) from None
+
+
+@cache
+def compile_alphabet(name: str = DEFAULT_ALPHABET) -> CompiledAlphabet:
+	"""Return the compiled lookup structures for the alphabet called *name*."""
+
+	alphabet = get_alphabet(name)
+	table = _build_encode_table(alphabet.letter_pairs, alphabet.other_pairs)
+	tree = DichotomicTree.from_pairs(alphabet.letter_pairs, alphabet.other_pairs)
+	return _compiled(alphabet, table, tree)
+
+
+def _compiled(alphabet: Alphabet, table: dict[str, str], tree: DichotomicTree) -> CompiledAlphabet:
+	"""Wrap an encode table and decoding tree in a ``CompiledAlphabet``."""
+
+	marked_table = {**table, " ": WORD_GAP_MARKER}
+	entries = {code_for_node(node): entry for node, entry in enumerate(tree.nodes) if entry}
+	return CompiledAlphabet(
+		alphabet=alphabet,
+		encode_table=MappingProxyType(table),
+		unsupported_filter=MappingProxyType(dict.fromkeys(map(ord, table))),
+		codes=frozenset(entries),
+		tree=tree,
+		lookup=table.__getitem__,
+		marked_lookup=marked_table.__getitem__,
+		upper_lookup={code: entry[0] for code, entry in entries.items()}.__getitem__,
+		lower_lookup={code: entry[1] for code, entry in entries.items()}.__getitem__,
+	)
+
+
+def _build_encode_table(
+	letter_pairs: Iterable[tuple[str, str]],
+	other_pairs: Iterable[tuple[str, str]],
+) -> dict[str, str]:
+	"""Merge the alphabet's tables into one char→code table.
+
+	Every supported character maps to its code followed by a letter separator.
+	A space maps to two more spaces, so a single space after a symbol yields the
+	three-space word gap.
+	"""
+
+	table: dict[str, str] = {}
+	for letter, code in letter_pairs:
+		table[letter] = table[letter.upper()] = f"{code} "
+	for char, code in other_pairs:
+		table[char] = f"{code} "
+	table[" "] = "  "
+	return table
+
+
+for _alphabet in (
+	Alphabet("estonian", "Eesti", morse_data.LETTER_MORSE_PAIRS),
+	Alphabet("itu", "Rahvusvaheline (ITU)", morse_data.ITU_LETTER_MORSE_PAIRS),
+	Alphabet("cyrillic", "Kirillitsa", morse_data.CYRILLIC_LETTER_MORSE_PAIRS),
+):
+	register_alphabet(_alphabet)
+
+
+__all__ = [
+	"DEFAULT_ALPHABET",
+	"WORD_GAP_MARKER",
+	"Alphabet",
+	"CompiledAlphabet",
+	"available_alphabets",
+	"compile_alphabet",
+	"get_alphabet",
+	"register_alphabet",
+]
@@ -0,0 +1,199 @@
+"""Words that sound alike once the letter gaps are gone.
+
+Run together, ``ET`` (``. -``) and ``A`` (``.-``) are the same ``.-``.  The
+index maps each word's gap-stripped element string to every word sharing it,
+for drills on words that are easy to confuse.  It is built in one pass over
+a word list and written as sorted records behind an offset table, so a
+saved index is opened with ``mmap`` and queried by binary search without
+being read into memory.
+
+File layout (little-endian)::
+
+    magic  b"MCAI"   version u32   record count u32
+    offsets u32 * (count + 1)      record i spans data[offsets[i]:offsets[i + 1]]
+    data    UTF-8 records "key\\tword\\tword...", sorted by key
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+
+from .alphabets import DEFAULT_ALPHABET, CompiledAlphabet, compile_alphabet
+
+_MAGIC = b"MCAI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_SEPARATOR = "\t"
+
+
+def element_key(word: str, *, alphabet: str = DEFAULT_ALPHABET) -> str | None:
+	"""Return *word*'s elements with the letter gaps removed, or ``None`` if unencodable."""
+
+	return _element_key(word.lower(), compile_alphabet(alphabet))
+
+
+def build_ambiguity_index(
+	words: Iterable[str], *, alphabet: str = DEFAULT_ALPHABET
+) -> dict[str, list[str]]:
+	"""Group *words* by element key in one pass; keys and groups come out sorted.
+
+	Words are compared in lower case.  Words containing a character the
+	alphabet cannot encode, or whitespace, are skipped.
+	"""
+
+	compiled = compile_alphabet(alphabet)
+	groups: dict[str, set[str]] = {}
+	for word in words:
+		word = word.strip().lower()
+		if not word or _SEPARATOR in word or len(word.split()) != 1:
+			continue
+		key = _element_key(word, compiled)
+		if key is not None:
+			groups.setdefault(key, set()).add(word)
+	return {key: sorted(groups[key]) for key in sorted(groups)}
+
+
+def write_ambiguity_index(
+	path: str | os.PathLike[str],
+	words: Iterable[str],
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+) -> int:
+	"""Build the index of *words* and save it to *path*; return the number of keys.
+
+	The file is written next to *path* and renamed over it, so readers never
+	see a partial index.
+	"""
+
+	groups = build_ambiguity_index(words, alphabet=alphabet)
+	offsets = array("I", [0])
+	records: list[bytes] = []
+	for key, group in groups.items():
+		record = _SEPARATOR.join((key, *group)).encode("utf-8")
+		records.append(record)
+		offsets.append(offsets[-1] + len(record))
+	if sys.byteorder == "big":
+		offsets.byteswap()
+
+	target = Path(path)
+	temporary = target.with_name(f".{target.name}.tmp")
+	with open(temporary, "wb") as handle:
+		handle.write(_HEADER.pack(_MAGIC, _VERSION, len(records)))
+		handle.write(offsets.tobytes())
+		handle.writelines(records)
+	os.replace(temporary, target)
+	return len(records)
+
+
+class AmbiguityIndex:
+	"""A saved index, memory-mapped and searched in place."""
+
+	def __init__(self, path: str | os.PathLike[str], *, alphabet: str = DEFAULT_ALPHABET) -> None:
+		self.alphabet = alphabet
+		with open(path, "rb") as handle:
+			self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			magic, version, count = _HEADER.unpack_from(self._map)
+		except struct.error:
+			self._map.close()
+			raise ValueError(f"{os.fspath(path)!r} is not a Morse ambiguity index") from None
+		if magic != _MAGIC or version != _VERSION:
+			self._map.close()
+			raise ValueError(f"{os.fspath(path)!r} is not a Morse ambiguity index")
+		start = _HEADER.size
+		end = start + 4 * (count + 1)
+		view = memoryview(self._map)[start:end]
+		if sys.byteorder == "little":
+			self._offsets: memoryview | array = view.cast("I")
+		else:
+			self._offsets = array("I", view)
+			self._offsets.byteswap()
+			view.release()
+		self._count = count
+		self._data = end
+
+	def __len__(self) -> int:
+		return self._count
+
+	def __enter__(self) -> AmbiguityIndex:
+		return self
+
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc: BaseException | None,
+		traceback: TracebackType | None,
+	) -> None:
+		self.close()
+
+	def close(self) -> None:
+		if isinstance(self._offsets, memoryview):
+			self._offsets.release()
+		self._map.close()
+
+	def lookup(self, key: str) -> tuple[str, ...]:
+		"""Return the words whose element key is *key*, or an empty tuple."""
+
+		target = key.encode("ascii")
+		low, high = 0, self._count
+		while low < high:
+			middle = (low + high) // 2
+			if self._key(middle) < target:
+				low = middle + 1
+			else:
+				high = middle
+		if low < self._count and self._key(low) == target:
+			return tuple(self._record(low).decode("utf-8").split(_SEPARATOR)[1:])
+		return ()
+
+	def sound_alikes(self, word: str) -> tuple[str, ...]:
+		"""Return the other words that share *word*'s element key."""
+
+		key = element_key(word, alphabet=self.alphabet)
+		if key is None:
+			return ()
+		word = word.lower()
+		return tuple(other for other in self.lookup(key) if other != word)
+
+	def groups(self, *, min_size: int = 2) -> Iterator[tuple[str, tuple[str, ...]]]:
+		"""Yield ``(key, words)`` for every key shared by at least *min_size* words."""
+
+		for index in range(self._count):
+			key, *words = self._record(index).decode("utf-8").split(_SEPARATOR)
+			if len(words) >= min_size:
+				yield key, tuple(words)
+
+	def _record(self, index: int) -> bytes:
+		return self._map[self._data + self._offsets[index] : self._data + self._offsets[index + 1]]
+
+	def _key(self, index: int) -> bytes:
+		start = self._data + self._offsets[index]
+		end = self._map.find(b"\t", start, self._data + self._offsets[index + 1])
+		return self._map[start:end]
+
+
+def _element_key(word: str, alphabet: CompiledAlphabet) -> str | None:
+	if not word or word.translate(alphabet.unsupported_filter):
+		return None
+	return word.translate(_element_table(alphabet))
+
+
+@lru_cache(maxsize=8)
+def _element_table(alphabet: CompiledAlphabet) -> dict[int, str]:
+	return {ord(char): code.strip() for char, code in alphabet.encode_table.items()}
+
+
+__all__ = [
+	"AmbiguityIndex",
+	"build_ambiguity_index",
+	"element_key",
+	"write_ambiguity_index",
+]
@@ -0,0 +1,233 @@
+"""Diff-based re-translation for inputs that change a little at a time.
+
+The sandbox re-translates its whole input on every edit.  ``DiffTranslator``
+remembers the previous input, its output and a sparse index of word starts
+together with the translator state at each of them.  A new input is diffed
+against the old one, only the words around the edited span are translated
+again, and the unchanged output on either side is spliced back in.  Errors
+are collected in the same pass, so an input with a typo costs no more to
+re-translate than one without.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any
+
+from ..exceptions import InvalidModeError
+from .alphabets import DEFAULT_ALPHABET
+from .morse_translator import ErrorHandler, IncrementalMorseDecoder, IncrementalMorseEncoder
+from .morse_validation import TranslationIssue
+
+# A word start: a non-space character directly after a space.  Translator
+# state there never includes a half-read symbol, so it is safe to resume from.
+_WORD_START = re.compile(r"(?<= )[^ ]")
+
+# Minimum distance between recorded word starts.  Sparse checkpoints keep a
+# full translation down to a few hundred translator calls while bounding the
+# re-translated span around an edit to a few hundred characters.
+_CHECKPOINT_SPACING = 256
+
+_ISSUE_OFFSET = attrgetter("offset")
+
+
+def _common_prefix_length(old: str, new: str) -> int:
+	"""Length of the longest common prefix, found by C-level slice comparisons."""
+
+	low, high = 0, min(len(old), len(new))
+	while low < high:
+		middle = (low + high + 1) // 2
+		if old[:middle] == new[:middle]:
+			low = middle
+		else:
+			high = middle - 1
+	return low
+
+
+def _common_suffix_length(old: str, new: str, limit: int) -> int:
+	"""Length of the longest common suffix, capped at *limit* characters."""
+
+	low, high = 0, limit
+	while low < high:
+		middle = (low + high + 1) // 2
+		if old[len(old) - middle :] == new[len(new) - middle :]:
+			low = middle
+		else:
+			high = middle - 1
+	return low
+
+
+class DiffTranslator:
+	"""Translate successive versions of an input, re-translating only edits.
+
+	Results are identical to ``convert_text_to_morse`` / ``convert_morse_to_text``
+	of the full input.  A translation error propagates and leaves the cached
+	state of the previous input in place.
+
+	With *replacement* unsupported tokens do not raise: each is translated as
+	*replacement* (a Morse code when encoding, text when decoding, "" to drop
+	it) and listed in ``issues`` with its offset in the input, as
+	``translate_checked`` would report it.
+	"""
+
+	def __init__(
+		self,
+		mode: str,
+		*,
+		alphabet: str = DEFAULT_ALPHABET,
+		replacement: str | None = None,
+	) -> None:
+		on_error: ErrorHandler | None = None if replacement is None else self._collect
+		self._coder: IncrementalMorseEncoder | IncrementalMorseDecoder
+		if mode == "text_to_morse":
+			self._coder = IncrementalMorseEncoder(alphabet=alphabet, on_error=on_error)
+			self._step = self._coder.encode
+		elif mode == "morse_to_text":
+			self._coder = IncrementalMorseDecoder(alphabet=alphabet, on_error=on_error)
+			self._step = self._coder.decode
+		else:
+			raise InvalidModeError(mode)
+		self.mode = mode
+		self.alphabet = alphabet
+		self._replacement = replacement
+		# Issues found by the translation in progress, and where the chunk
+		# being translated starts in its input.
+		self._found: list[TranslationIssue] = []
+		self._chunk_start = 0
+		self.reset()
+
+	@property
+	def issues(self) -> tuple[TranslationIssue, ...]:
+		"""Unsupported tokens of the last input translated, in input order."""
+
+		return tuple(self._issues)
+
+	def reset(self) -> None:
+		"""Forget the previous input so the next call translates in full."""
+
+		self._coder.reset()
+		self._input: str | None = None
+		self._output = ""
+		self._in_offsets: list[int] = [0]
+		self._out_offsets: list[int] = [0]
+		self._states: list[Any] = [self._coder.getstate()]
+		self._issues: list[TranslationIssue] = []
+
+	def translate(self, text: str) -> str:
+		old = self._input
+		if old is None:
+			old = ""
+			prefix = suffix = 0
+			self.reset()
+		elif text == old:
+			return self._output
+		else:
+			prefix = _common_prefix_length(old, text)
+			suffix = _common_suffix_length(old, text, min(len(old), len(text)) - prefix)
+
+		# Resume from the last checkpoint inside the common prefix.
+		first = bisect_right(self._in_offsets, prefix) - 1
+		position = self._in_offsets[first]
+		out_start = self._out_offsets[first]
+		self._coder.setstate(self._states[first])
+		# Tokens end before the word start they precede, so the issues before
+		# the checkpoint are unaffected by the edit.
+		kept = bisect_left(self._issues, position, key=_ISSUE_OFFSET)
+		self._found = self._issues[:kept]
+
+		in_offsets = self._in_offsets[: first + 1]
+		out_offsets = self._out_offsets[: first + 1]
+		states = self._states[: first + 1]
+		pieces: list[str] = []
+		out_position = out_start
+
+		# Old checkpoints inside the common suffix are candidates for rejoining
+		# the previous output: once the translator state at one of them matches
+		# the recorded state, everything after it translates exactly as before.
+		delta = len(text) - len(old)
+		for candidate in range(
+			bisect_left(self._in_offsets, len(old) - suffix), len(self._in_offsets)
+		):
+			target = self._in_offsets[candidate] + delta
+			position, out_position = self._advance(
+				text, position, target, pieces, out_position, in_offsets, out_offsets, states
+			)
+			if self._coder.getstate() != self._states[candidate]:
+				continue
+			out_shift = out_position - self._out_offsets[candidate]
+			in_offsets.extend(offset + delta for offset in self._in_offsets[candidate:])
+			out_offsets.extend(offset + out_shift for offset in self._out_offsets[candidate:])
+			states.extend(self._states[candidate:])
+			rejoined = bisect_left(self._issues, self._in_offsets[candidate], key=_ISSUE_OFFSET)
+			self._found.extend(
+				TranslationIssue(issue.offset + delta, issue.token)
+				for issue in self._issues[rejoined:]
+			)
+			output = "".join(
+				(
+					self._output[:out_start],
+					*pieces,
+					self._output[self._out_offsets[candidate] :],
+				)
+			)
+			return self._commit(text, output, in_offsets, out_offsets, states)
+
+		self._advance(
+			text, position, len(text), pieces, out_position, in_offsets, out_offsets, states
+		)
+		self._chunk_start = len(text)
+		pieces.append(self._step("", True))
+		output = self._output[:out_start] + "".join(pieces)
+		return self._commit(text, output, in_offsets, out_offsets, states)
+
+	def _advance(
+		self,
+		text: str,
+		position: int,
+		target: int,
+		pieces: list[str],
+		out_position: int,
+		in_offsets: list[int],
+		out_offsets: list[int],
+		states: list[Any],
+	) -> tuple[int, int]:
+		"""Translate ``text[position:target]``, recording sparse checkpoints."""
+
+		while position < target:
+			match = _WORD_START.search(text, position + _CHECKPOINT_SPACING, target)
+			end = match.start() if match else target
+			self._chunk_start = position
+			piece = self._step(text[position:end], False)
+			pieces.append(piece)
+			out_position += len(piece)
+			position = end
+			if match:
+				in_offsets.append(end)
+				out_offsets.append(out_position)
+				states.append(self._coder.getstate())
+		return position, out_position
+
+	def _commit(
+		self,
+		text: str,
+		output: str,
+		in_offsets: list[int],
+		out_offsets: list[int],
+		states: list[Any],
+	) -> str:
+		self._input = text
+		self._output = output
+		self._in_offsets = in_offsets
+		self._out_offsets = out_offsets
+		self._states = states
+		self._issues = self._found
+		return output
+
+	def _collect(self, token: str, offset: int) -> str:
+		self._found.append(TranslationIssue(self._chunk_start + offset, token))
+		return self._replacement or ""
+
+
+__all__ = ["DiffTranslator"]
@@ -0,0 +1,227 @@
+"""``morse`` text codec built on the incremental Morse translators.
+
+Once registered, stdlib I/O treats Morse as an encoding: writing text encodes
+it to Morse bytes and reading decodes Morse bytes back to text::
+
+    with open(path, "w", encoding="morse") as handle:
+        handle.write("Tere maailm")
+
+Encoded bytes are plain ASCII dots, dashes and spaces.  Line breaks pass
+through unchanged and each line is translated on its own, so decoding follows
+``convert_morse_to_text`` (including its capitalisation rule) line by line.
+
+``errors="strict"`` raises ``UnicodeEncodeError`` / ``UnicodeDecodeError``
+spanning the unsupported character or Morse symbol, with the translator's
+typed error as the cause.  ``"ignore"`` and ``"replace"`` follow the ``SKIP``
+and ``REPLACE`` policies of ``translate_checked``: bad tokens are dropped, or
+become the error signal when encoding and U+FFFD when decoding.  Any other
+registered handler name is treated as ``"strict"``.
+"""
+
+from __future__ import annotations
+
+import codecs
+
+from ..exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
+from .morse_translator import ErrorHandler, IncrementalMorseDecoder, IncrementalMorseEncoder
+from .morse_validation import DEFAULT_TEXT_PLACEHOLDER, ERROR_SIGNAL
+
+CODEC_NAME = "morse"
+
+# Morse only uses ASCII, and latin-1 maps every byte to one character so an
+# unexpected byte still surfaces as an unsupported Morse symbol.
+_BYTE_CODEC = "latin-1"
+
+
+def _error_handler(errors: str, replacement: str, strict: ErrorHandler) -> ErrorHandler:
+	"""Return the translator error handler for the codec error handler *errors*."""
+
+	if errors == "ignore":
+		return lambda token, offset: ""
+	if errors == "replace":
+		return lambda token, offset: replacement
+	# Unknown names fail here, as they would for a built-in codec.
+	codecs.lookup_error(errors)
+	return strict
+
+
+def _encode_error(text: str, token: str, offset: int) -> UnicodeEncodeError:
+	error = UnicodeEncodeError(
+		CODEC_NAME, text, offset, offset + len(token), "character has no Morse code"
+	)
+	error.__cause__ = UnsupportedCharacterError(token)
+	return error
+
+
+def _decode_error(data: bytes, symbol: str, offset: int) -> UnicodeDecodeError:
+	error = UnicodeDecodeError(
+		CODEC_NAME, data, offset, offset + len(symbol), "unknown Morse symbol"
+	)
+	error.__cause__ = UnsupportedMorseSymbolError(symbol)
+	return error
+
+
+def encode(text: str, errors: str = "strict") -> tuple[bytes, int]:
+	def strict(token: str, offset: int) -> str:
+		raise _encode_error(text, token, offset)
+
+	encoder = IncrementalMorseEncoder(
+		keep_line_breaks=True, on_error=_error_handler(errors, ERROR_SIGNAL, strict)
+	)
+	return encoder.encode(text, final=True).encode(_BYTE_CODEC), len(text)
+
+
+def decode(data: bytes, errors: str = "strict") -> tuple[str, int]:
+	def strict(symbol: str, offset: int) -> str:
+		raise _decode_error(bytes(data), symbol, offset)
+
+	decoder = IncrementalMorseDecoder(
+		keep_line_breaks=True, on_error=_error_handler(errors, DEFAULT_TEXT_PLACEHOLDER, strict)
+	)
+	return decoder.decode(codecs.latin_1_decode(data)[0], final=True), len(data)
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+	def __init__(self, errors: str = "strict") -> None:
+		super().__init__(errors)
+		self._encoder = IncrementalMorseEncoder(
+			keep_line_breaks=True, on_error=_error_handler(errors, ERROR_SIGNAL, self._strict)
+		)
+		self._input = ""
+
+	def encode(self, input: str, final: bool = False) -> bytes:
+		self._input = input
+		return self._encoder.encode(input, final).encode(_BYTE_CODEC)
+
+	def _strict(self, token: str, offset: int) -> str:
+		raise _encode_error(self._input, token, offset)
+
+	def reset(self) -> None:
+		self._encoder.reset()
+
+	def getstate(self) -> int:
+		return self._encoder.getstate()
+
+	def setstate(self, state: int) -> None:
+		self._encoder.setstate(state)
+
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+	"""Incremental decoder whose buffered bytes are the still-open symbol.
+
+	``getstate`` reports that symbol as undecoded input, which is exactly what
+	``io.TextIOWrapper`` needs to reconstruct positions for ``tell()``.  A
+	strict decoding error spans the buffered bytes followed by *input*.
+	"""
+
+	def __init__(self, errors: str = "strict") -> None:
+		super().__init__(errors)
+		self._decoder = IncrementalMorseDecoder(
+			keep_line_breaks=True,
+			on_error=_error_handler(errors, DEFAULT_TEXT_PLACEHOLDER, self._strict),
+		)
+		self._input = b""
+		self._pending = ""
+
+	def decode(self, input: bytes, final: bool = False) -> str:
+		self._input = input
+		self._pending = self._decoder.getstate()[0]
+		return self._decoder.decode(codecs.latin_1_decode(input)[0], final)
+
+	def _strict(self, symbol: str, offset: int) -> str:
+		# Offsets are relative to *input*; a symbol begun in an earlier chunk
+		# starts inside the buffered bytes.
+		data = self._pending.encode(_BYTE_CODEC) + bytes(self._input)
+		raise _decode_error(data, symbol, offset + len(self._pending))
+
+	def reset(self) -> None:
+		self._decoder.reset()
+
+	def getstate(self) -> tuple[bytes, int]:
+		pending, flags = self._decoder.getstate()
+		return pending.encode(_BYTE_CODEC), flags
+
+	def setstate(self, state: tuple[bytes, int]) -> None:
+		pending, flags = state
+		self._decoder.setstate((pending.decode(_BYTE_CODEC), flags))
+
+
+class StreamWriter(codecs.StreamWriter):
+	def __init__(self, stream, errors: str = "strict") -> None:
+		super().__init__(stream, errors)
+		self._encoder = IncrementalEncoder(errors)
+
+	def encode(self, input: str, errors: str = "strict") -> tuple[bytes, int]:
+		return self._encoder.encode(input), len(input)
+
+	def reset(self) -> None:
+		super().reset()
+		self._encoder.reset()
+
+
+class StreamReader(codecs.StreamReader):
+	"""Stream reader that leaves the open symbol in ``codecs``' byte buffer.
+
+	``codecs.StreamReader`` never signals end of input to ``decode``; it just
+	stops calling it once the stream and its buffer are empty.  Reporting the
+	open symbol as unconsumed keeps it buffered, and being handed exactly that
+	buffer again with nothing new appended can only mean the stream ended.
+	"""
+
+	def __init__(self, stream, errors: str = "strict") -> None:
+		super().__init__(stream, errors)
+		self._decoder = IncrementalDecoder(errors)
+		self._unconsumed = b""
+
+	def decode(self, input: bytes, errors: str = "strict") -> tuple[str, int]:
+		data = bytes(input)
+		final = bool(self._unconsumed) and data == self._unconsumed
+		_, flags = self._decoder.getstate()
+		self._decoder.setstate((b"", flags))
+		text = self._decoder.decode(data, final)
+		self._unconsumed = b"" if final else self._decoder.getstate()[0]
+		return text, len(data) - len(self._unconsumed)
+
+	def reset(self) -> None:
+		super().reset()
+		self._decoder.reset()
+		self._unconsumed = b""
+
+
+def _search(name: str) -> codecs.CodecInfo | None:
+	if name != CODEC_NAME:
+		return None
+	return codecs.CodecInfo(
+		name=CODEC_NAME,
+		encode=encode,
+		decode=decode,
+		incrementalencoder=IncrementalEncoder,
+		incrementaldecoder=IncrementalDecoder,
+		streamwriter=StreamWriter,
+		streamreader=StreamReader,
+	)
+
+
+_registered = False
+
+
+def register() -> None:
+	"""Register the ``morse`` codec with :mod:`codecs` (safe to call repeatedly)."""
+
+	global _registered
+	if _registered:
+		return
+	codecs.register(_search)
+	_registered = True
+
+
+__all__ = [
+	"CODEC_NAME",
+	"IncrementalDecoder",
+	"IncrementalEncoder",
+	"StreamReader",
+	"StreamWriter",
+	"decode",
+	"encode",
+	"register",
+]
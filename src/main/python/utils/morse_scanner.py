@@ -0,0 +1,51 @@
+"""The one grammar every reader of dot/dash Morse strings follows.
+
+A symbol is a run of non-whitespace characters.  The whitespace between two
+symbols is a word gap if it contains three consecutive spaces or a line
+break; any other whitespace (one or two spaces, tabs) is a letter gap.
+
+``split_words`` applies the grammar with C-level ``str`` operations: it cuts
+the input at word gaps, and ``str.split()`` then yields each word's symbols.
+The decoder, ``PackedMorse.from_morse`` and the audio synthesizer all read
+their input that way, in a single pass.  ``scan_morse`` yields the same
+tokens with their offsets, for callers that report positions.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+
+SYMBOL = 1
+WORD_GAP = 2
+LETTER_GAP = 3
+
+# Group numbers are the token kinds, so ``match.lastindex`` classifies a match.
+_MORSE_TOKEN = re.compile(r"(\S+)|(\s*(?:   |[\r\n])\s*)|(\s+)")
+
+_WORD_SEPARATOR = "   "
+
+
+def split_words(morse: str) -> list[str]:
+	"""Return the words of *morse*; ``word.split()`` gives a word's symbols.
+
+	Word gaps longer than three spaces leave empty or blank words behind;
+	callers skip words without symbols.
+	"""
+
+	if "\n" in morse:
+		morse = morse.replace("\n", _WORD_SEPARATOR)
+	if "\r" in morse:
+		morse = morse.replace("\r", _WORD_SEPARATOR)
+	return morse.split(_WORD_SEPARATOR)
+
+
+def scan_morse(morse: str) -> Iterator[tuple[int, int, int]]:
+	"""Yield ``(kind, start, end)`` for every symbol and gap in *morse*."""
+
+	for match in _MORSE_TOKEN.finditer(morse):
+		start, end = match.span()
+		yield match.lastindex, start, end
+
+
+__all__ = ["LETTER_GAP", "SYMBOL", "WORD_GAP", "scan_morse", "split_words"]
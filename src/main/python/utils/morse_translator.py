@@ -2,73 +2,580 @@
 
 from __future__ import annotations
 
-from ..exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
-from ..resources import constants as consts
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TextIO
 
-_LETTER_FROM_MORSE: dict[str, tuple[str, str]] = {}
-for letter, code in consts.LETTER_MORSE_PAIRS:
-	_LETTER_FROM_MORSE[code] = (letter.upper(), letter)
+from ..exceptions import InvalidModeError, UnsupportedCharacterError, UnsupportedMorseSymbolError
+from .alphabets import DEFAULT_ALPHABET, WORD_GAP_MARKER, CompiledAlphabet, compile_alphabet
+from .morse_scanner import split_words
+from .prosigns import compile_prosigns
+from .transliteration import _fold_text, transliteration_table
 
-_NUMBER_FROM_MORSE: dict[str, str] = {
-	code: char for char, code in consts.NUMBER_TO_MORSE_MAP.items()
-}
 
-_SYMBOL_FROM_MORSE: dict[str, str] = {
-	code: char for char, code in consts.SYMBOL_TO_MORSE_MAP.items()
-}
+def convert_text_to_morse(
+	message: str,
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	memoize: bool = False,
+	transliterate: bool = False,
+	prosigns: bool = False,
+) -> str:
+	"""Translate plain text into a Morse code string.
 
+	With *memoize* words are looked up in a bounded LRU cache and only new
+	words are encoded.  That pays off on text whose vocabulary fits the cache,
+	such as the exercise corpus; see ``word_cache_stats`` for the hit rate.
 
-def convert_text_to_morse(message: str) -> str:
-	"""Translate plain text into a Morse code string."""
+	With *transliterate* the text is first folded onto the alphabet (accents
+	dropped, ``ß`` → ``ss``, line breaks → spaces, ...); see
+	``utils.transliteration``.
+
+	With *prosigns* tokens from the alphabet's prosign table, such as
+	``<AR>``, are sent as one symbol; see ``utils.prosigns``.
+	"""
 
 	if not message:
 		return ""
+	compiled = compile_alphabet(alphabet)
+	if transliterate:
+		message = _fold_text(message, transliteration_table(compiled))
+	if prosigns:
+		prosign_alphabet = compile_prosigns(compiled)
+		message = prosign_alphabet.substitute(message)
+		compiled = prosign_alphabet.compiled
+	if memoize:
+		return _word_cache.encode(message, compiled)
+	return _encode(message, compiled)
 
-	morse_words: list[str] = []
-	for word in message.split(" "):
-		if word == "":
-			morse_words.append("")
-			continue
-		symbols: list[str] = []
-		for char in word:
-			if char in consts.LETTER_TO_MORSE_MAP:
-				symbols.append(consts.LETTER_TO_MORSE_MAP[char])
-			elif char in consts.NUMBER_TO_MORSE_MAP:
-				symbols.append(consts.NUMBER_TO_MORSE_MAP[char])
-			elif char in consts.SYMBOL_TO_MORSE_MAP:
-				symbols.append(consts.SYMBOL_TO_MORSE_MAP[char])
-			else:
-				raise UnsupportedCharacterError(char)
-		morse_words.append(" ".join(symbols))
-	return "   ".join(morse_words)
+
+def convert_texts_to_morse(
+	messages: Iterable[str],
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	memoize: bool = False,
+	transliterate: bool = False,
+	prosigns: bool = False,
+) -> list[str]:
+	"""Translate each of *messages*, sharing the word cache across them when memoizing."""
+
+	return [
+		convert_text_to_morse(
+			message,
+			alphabet=alphabet,
+			memoize=memoize,
+			transliterate=transliterate,
+			prosigns=prosigns,
+		)
+		for message in messages
+	]
+
+
+def _encode(message: str, alphabet: CompiledAlphabet) -> str:
+	if not message:
+		return ""
+	# ``str.translate`` deletes every encodable character; whatever survives
+	# is unsupported input, reported in its original order.
+	unsupported = message.translate(alphabet.unsupported_filter)
+	if unsupported:
+		raise UnsupportedCharacterError(unsupported[0])
+	return _encode_supported(message, alphabet.lookup, alphabet.marked_lookup)
+
+
+DEFAULT_WORD_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class WordCacheStats:
+	"""Counters of the word cache used by ``convert_text_to_morse(memoize=True)``.
+
+	Every word of every memoized message is one lookup; a word already cached,
+	or repeated earlier in the same message, counts as a hit.
+	"""
+
+	hits: int
+	misses: int
+	maxsize: int | None
+	currsize: int
+
+	@property
+	def hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+
+class _WordCache:
+	"""Bounded LRU maps of word → encoded word, one per alphabet."""
+
+	def __init__(self, maxsize: int | None) -> None:
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._tables: dict[CompiledAlphabet, OrderedDict[str, str]] = {}
+
+	def __len__(self) -> int:
+		return sum(len(table) - 1 for table in self._tables.values())
+
+	def encode(self, message: str, alphabet: CompiledAlphabet) -> str:
+		table = self._tables.get(alphabet)
+		if table is None:
+			table = self._tables[alphabet] = OrderedDict({"": ""})
+		words = message.split(" ")
+		# Set arithmetic finds the new words without a Python-level loop over
+		# the message; only distinct words ever reach one.
+		distinct = set(words)
+		missing = list(distinct.difference(table))
+		for word in distinct.intersection(table):
+			table.move_to_end(word)
+		if missing:
+			try:
+				# Words never contain a word gap, so one encoder call covers
+				# every new word and splitting on the gap recovers each code.
+				codes = _encode(" ".join(missing), alphabet).split("   ")
+			except UnsupportedCharacterError:
+				# Re-encode the message itself to report its first offender.
+				_encode(message, alphabet)
+				raise
+			table.update(zip(missing, codes))
+
+		self.misses += len(missing)
+		self.hits += len(words) - len(missing)
+		# Word gaps are three spaces whether or not the words are empty, so
+		# joining the encoded words reproduces the unmemoized output exactly.
+		encoded = "   ".join(map(table.__getitem__, words))
+		if self.maxsize is not None:
+			# Evict least recently used words; the empty word always stays.
+			while len(table) > self.maxsize + 1:
+				word, code = table.popitem(last=False)
+				if not word:
+					table[word] = code
+		return encoded
+
+
+_word_cache = _WordCache(DEFAULT_WORD_CACHE_SIZE)
 
 
-def convert_morse_to_text(message: str) -> str:
-	"""Translate a Morse string back into human-readable text."""
+def word_cache_stats() -> WordCacheStats:
+	cache = _word_cache
+	return WordCacheStats(cache.hits, cache.misses, cache.maxsize, len(cache))
+
+
+def configure_word_cache(maxsize: int | None = DEFAULT_WORD_CACHE_SIZE) -> None:
+	"""Replace the word cache with an empty one holding at most *maxsize* words."""
+
+	global _word_cache
+	_word_cache = _WordCache(maxsize)
+
+
+def clear_word_cache() -> None:
+	"""Empty the word cache and reset its counters."""
+
+	configure_word_cache(_word_cache.maxsize)
+
+
+def _encode_supported(
+	message: str,
+	lookup: Callable[[str], str],
+	marked_lookup: Callable[[str], str],
+) -> str:
+	"""Encode a non-empty *message* whose characters all have a code in *lookup*."""
+
+	# ``map`` over the merged table beats ``str.translate`` once the replacement
+	# values are longer than one character.  Repeated spaces each need a full
+	# word gap, so on that (rare) path every space is first emitted as a marker,
+	# and the letter separator in front of a marker is folded away before the
+	# markers expand to three spaces.
+	if message[0] == " " or "  " in message:
+		encoded = "".join(map(marked_lookup, message))
+		encoded = encoded.replace(f" {WORD_GAP_MARKER}", WORD_GAP_MARKER)
+		encoded = encoded.replace(WORD_GAP_MARKER, "   ")
+	else:
+		encoded = "".join(map(lookup, message))
+	return encoded if message[-1] == " " else encoded[:-1]
+
+
+_LINE_BREAK = re.compile(r"([\r\n])")
+_SYMBOL = re.compile(r"\S+")
+
+# Receives an unsupported character or Morse symbol and its offset in the
+# chunk being translated (negative while it started in an earlier chunk) and
+# returns what to translate it to: a Morse code when encoding, text when
+# decoding, or "" to drop it.
+ErrorHandler = Callable[[str, int], str]
+
+# Replacement codes are encoded through private-use stand-ins from plane 15,
+# clear of the prosign stand-ins in the BMP.
+_REPLACEMENT_BASE = 0xF0000
+
+
+@lru_cache(maxsize=8)
+def _unsupported_pattern(alphabet: CompiledAlphabet) -> re.Pattern[str]:
+	return re.compile("[^" + "".join(map(re.escape, alphabet.encode_table)) + "]")
+
+
+def convert_morse_to_text(
+	message: str,
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	prosigns: bool = False,
+) -> str:
+	"""Translate a Morse string back into human-readable text.
+
+	With *prosigns* prosign codes decode to their tokens, e.g. ``<AR>``,
+	even where a symbol shares the code.
+	"""
 
 	if not message:
 		return ""
+	decoder = IncrementalMorseDecoder(alphabet=alphabet, prosigns=prosigns)
+	return decoder.decode(message, final=True)
+
+
+def _translate_lines(
+	coder: IncrementalMorseEncoder | IncrementalMorseDecoder,
+	translate_line: Callable[[str, bool, int], str],
+	chunk: str,
+	final: bool,
+) -> str:
+	"""Translate *chunk* line by line, passing line breaks through unchanged.
+
+	*translate_line* also receives the offset of the line in *chunk*.
+	"""
+
+	pieces = _LINE_BREAK.split(chunk)
+	if len(pieces) == 1:
+		return translate_line(chunk, final, 0)
+	output: list[str] = []
+	offset = 0
+	for line, line_break in zip(pieces[::2], pieces[1::2]):
+		output.append(translate_line(line, True, offset))
+		output.append(line_break)
+		offset += len(line) + len(line_break)
+		coder.reset()
+	output.append(translate_line(pieces[-1], final, offset))
+	return "".join(output)
+
 
-	translation: list[str] = []
-	previous_empty = False
-	for symbol in message.split(" "):
-		if symbol == "":
-			if previous_empty and translation and translation[-1] != " ":
-				translation.append(" ")
-			previous_empty = True
-			continue
-
-		previous_empty = False
-		if symbol in _LETTER_FROM_MORSE:
-			upper, lower = _LETTER_FROM_MORSE[symbol]
-			translation.append(upper if (not translation or translation[-1] == " ") else lower)
-		elif symbol in _NUMBER_FROM_MORSE:
-			translation.append(_NUMBER_FROM_MORSE[symbol])
-		elif symbol in _SYMBOL_FROM_MORSE:
-			translation.append(_SYMBOL_FROM_MORSE[symbol])
+class IncrementalMorseEncoder:
+	"""Encode text supplied in chunks, producing Morse as soon as it is known.
+
+	Feeding chunks ``a`` then ``b`` yields exactly ``convert_text_to_morse(a + b)``;
+	the only state carried across a boundary is whether a letter separator is
+	owed before the next symbol.  With *keep_line_breaks* every line is encoded
+	on its own and ``\\r``/``\\n`` pass through unchanged.  With *transliterate*
+	each chunk is folded onto the alphabet first, as in ``convert_text_to_morse``.
+
+	Unsupported characters raise ``UnsupportedCharacterError`` unless
+	*on_error* is given; it is called with each of them and the code it
+	returns is sent in its place.
+	"""
+
+	def __init__(
+		self,
+		*,
+		keep_line_breaks: bool = False,
+		alphabet: str = DEFAULT_ALPHABET,
+		transliterate: bool = False,
+		on_error: ErrorHandler | None = None,
+	) -> None:
+		compiled = compile_alphabet(alphabet)
+		self._keep_line_breaks = keep_line_breaks
+		self._alphabet = compiled.name
+		self._fold = transliteration_table(compiled) if transliterate else None
+		self._on_error = on_error
+		self._after_symbol = False
+
+	def encode(self, chunk: str, final: bool = False) -> str:
+		"""Encode *chunk*; *final* is accepted for symmetry with the decoder."""
+
+		if self._keep_line_breaks:
+			return _translate_lines(self, self._encode_line, chunk, final)
+		return self._encode_line(chunk, final, 0)
+
+	def _encode_line(self, chunk: str, final: bool, offset: int) -> str:
+		if self._fold is not None:
+			chunk = _fold_text(chunk, self._fold)
+		if not chunk:
+			return ""
+		try:
+			encoded = convert_text_to_morse(chunk, alphabet=self._alphabet)
+		except UnsupportedCharacterError:
+			if self._on_error is None:
+				raise
+			chunk, encoded = self._encode_repaired(chunk, offset, self._on_error)
+			if not chunk:
+				return ""
+		if self._after_symbol and chunk[0] != " ":
+			encoded = f" {encoded}"
+		self._after_symbol = chunk[-1] != " "
+		return encoded
+
+	def _encode_repaired(self, chunk: str, offset: int, on_error: ErrorHandler) -> tuple[str, str]:
+		"""Return *chunk* with the error handler's replacements spliced in, and its code.
+
+		Each distinct replacement code is spliced in as one stand-in character
+		that a widened copy of the encode table maps to the code.
+		"""
+
+		compiled = compile_alphabet(self._alphabet)
+		stand_ins: dict[str, str] = {}
+		pieces: list[str] = []
+		position = 0
+		for match in _unsupported_pattern(compiled).finditer(chunk):
+			pieces.append(chunk[position : match.start()])
+			code = on_error(match.group(), offset + match.start())
+			if code:
+				stand_in = chr(_REPLACEMENT_BASE + len(stand_ins))
+				pieces.append(stand_ins.setdefault(code, stand_in))
+			position = match.end()
+		pieces.append(chunk[position:])
+		repaired = "".join(pieces)
+		if not repaired:
+			return "", ""
+		table = {**compiled.encode_table}
+		table.update((stand_in, f"{code} ") for code, stand_in in stand_ins.items())
+		marked_table = {**table, " ": WORD_GAP_MARKER}
+		return repaired, _encode_supported(repaired, table.__getitem__, marked_table.__getitem__)
+
+	def reset(self) -> None:
+		self._after_symbol = False
+
+	def getstate(self) -> int:
+		return int(self._after_symbol)
+
+	def setstate(self, state: int) -> None:
+		self._after_symbol = bool(state)
+
+
+# Decoder state flag exposed through ``getstate``/``setstate``.
+_MID_WORD = 1
+
+
+class IncrementalMorseDecoder:
+	"""Decode Morse supplied in chunks, carrying open symbols across boundaries.
+
+	Feeding chunks with ``final=True`` on the last one yields exactly
+	``convert_morse_to_text`` of the concatenated input.  Only the token that
+	is still open at the end of a chunk (a symbol, or a gap too short to be a
+	word gap yet) is buffered, so memory stays bounded by the longest symbol
+	rather than the input size.  With *keep_line_breaks* every line is decoded
+	on its own and ``\\r``/``\\n`` pass through unchanged; otherwise a line
+	break is a word gap.  *prosigns* decodes prosign codes to their tokens.
+
+	Unknown symbols raise ``UnsupportedMorseSymbolError`` unless *on_error*
+	is given; it is called with each of them and the text it returns is
+	decoded in its place.
+	"""
+
+	def __init__(
+		self,
+		*,
+		keep_line_breaks: bool = False,
+		alphabet: str = DEFAULT_ALPHABET,
+		prosigns: bool = False,
+		on_error: ErrorHandler | None = None,
+	) -> None:
+		compiled = compile_alphabet(alphabet)
+		if prosigns:
+			compiled = compile_prosigns(compiled).compiled
+		self._keep_line_breaks = keep_line_breaks
+		self._compiled = compiled
+		self._on_error = on_error
+		self.reset()
+
+	def reset(self) -> None:
+		self._pending = ""
+		self._word_start = True
+
+	def getstate(self) -> tuple[str, int]:
+		"""Return the buffered open token and the capitalisation flag."""
+
+		return self._pending, 0 if self._word_start else _MID_WORD
+
+	def setstate(self, state: tuple[str, int]) -> None:
+		self._pending, flags = state
+		self._word_start = not flags & _MID_WORD
+
+	def decode(self, chunk: str, final: bool = False) -> str:
+		"""Decode *chunk*, closing any open symbol when *final* is true."""
+
+		if self._keep_line_breaks:
+			return _translate_lines(self, self._decode_line, chunk, final)
+		return self._decode_line(chunk, final, 0)
+
+	def _decode_line(self, chunk: str, final: bool, offset: int) -> str:
+		# The end of the input closes the last symbol the way a space would,
+		# so a trailing gap counts one character longer.
+		text = f"{self._pending}{chunk} " if final else self._pending + chunk
+		words = split_words(text)
+		pending = ""
+		if not final:
+			# An open symbol, or trailing spaces that may still grow into a
+			# word gap, wait for the next chunk.
+			last = words[-1]
+			closed = last.rstrip(" ")
+			if len(closed) < len(last):
+				pending = last[len(closed) :]
+			elif last and not last[-1].isspace():
+				*head, pending = last.rsplit(None, 1)
+				closed = head[0] if head else ""
+			words[-1] = closed
+
+		try:
+			translation, word_start = self._decode_words(words)
+		except KeyError:
+			if self._on_error is None:
+				codes = self._compiled.codes
+				unknown = next(
+					symbol for word in words for symbol in word.split() if symbol not in codes
+				)
+				raise UnsupportedMorseSymbolError(unknown) from None
+			# *text* starts with the pending token carried over from the last chunk.
+			shift = offset - len(self._pending)
+			translation, word_start = self._decode_repaired(words, text, shift, self._on_error)
+
+		if final:
+			self.reset()
 		else:
-			raise UnsupportedMorseSymbolError(symbol)
-	return "".join(translation)
+			self._pending = pending
+			self._word_start = word_start
+		return translation
+
+	def _decode_words(self, words: list[str]) -> tuple[str, bool]:
+		"""Decode *words*, raising ``KeyError`` at the first unknown symbol."""
+
+		upper = self._compiled.upper_lookup
+		lower = self._compiled.lower_lookup
+		word_start = self._word_start
+		translation: list[str] = []
+		append = translation.append
+		for index, word in enumerate(words):
+			if index and not word_start:
+				append(" ")
+				word_start = True
+			symbols = word.split()
+			if not symbols:
+				continue
+			if word_start:
+				append(upper(symbols[0]))
+				append("".join(map(lower, symbols[1:])))
+			else:
+				append("".join(map(lower, symbols)))
+			word_start = False
+		return "".join(translation), word_start
+
+	def _decode_repaired(
+		self, words: list[str], text: str, shift: int, on_error: ErrorHandler
+	) -> tuple[str, bool]:
+		"""Decode *words* symbol by symbol, passing unknown ones to the error handler.
+
+		*words* were split from *text*, which starts *shift* characters into the
+		chunk; the handler is given offsets in the chunk.
+		"""
+
+		compiled = self._compiled
+		codes = compiled.codes
+		starts = (match.start() for match in _SYMBOL.finditer(text))
+		word_start = self._word_start
+		translation: list[str] = []
+		append = translation.append
+		for index, word in enumerate(words):
+			if index and not word_start:
+				append(" ")
+				word_start = True
+			for symbol in word.split():
+				start = next(starts)
+				if symbol in codes:
+					append(
+						compiled.upper_lookup(symbol)
+						if word_start
+						else compiled.lower_lookup(symbol)
+					)
+				else:
+					replacement = on_error(symbol, start + shift)
+					if not replacement:
+						continue
+					append(replacement)
+				word_start = False
+		return "".join(translation), word_start
+
+
+def iter_encode(
+	chunks: Iterable[str],
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	transliterate: bool = False,
+) -> Iterator[str]:
+	"""Lazily encode an iterable of text chunks, yielding Morse as it is ready."""
+
+	encoder = IncrementalMorseEncoder(alphabet=alphabet, transliterate=transliterate)
+	for chunk in chunks:
+		encoded = encoder.encode(chunk)
+		if encoded:
+			yield encoded
+
+
+def iter_decode(chunks: Iterable[str], *, alphabet: str = DEFAULT_ALPHABET) -> Iterator[str]:
+	"""Lazily decode an iterable of Morse chunks, yielding text as it is ready."""
+
+	decoder = IncrementalMorseDecoder(alphabet=alphabet)
+	for chunk in chunks:
+		decoded = decoder.decode(chunk)
+		if decoded:
+			yield decoded
+	decoded = decoder.decode("", final=True)
+	if decoded:
+		yield decoded
+
+
+def translate_stream(
+	source: TextIO,
+	target: TextIO,
+	*,
+	mode: str,
+	chunk_size: int = 1 << 16,
+	alphabet: str = DEFAULT_ALPHABET,
+	transliterate: bool = False,
+) -> None:
+	"""Translate *source* into *target* in fixed-size chunks.
+
+	*mode* is ``"text_to_morse"`` or ``"morse_to_text"``.  Line breaks are
+	kept as line breaks: every line is translated on its own, so neither
+	direction ever holds more than one chunk plus one open symbol in memory.
+	*transliterate* applies to encoding only.
+	"""
+
+	translate: Callable[[str, bool], str]
+	if mode == "text_to_morse":
+		translate = IncrementalMorseEncoder(
+			keep_line_breaks=True, alphabet=alphabet, transliterate=transliterate
+		).encode
+	elif mode == "morse_to_text":
+		translate = IncrementalMorseDecoder(keep_line_breaks=True, alphabet=alphabet).decode
+	else:
+		raise InvalidModeError(mode)
+
+	while chunk := source.read(chunk_size):
+		target.write(translate(chunk, False))
+	target.write(translate("", True))
 
 
-__all__ = ["convert_morse_to_text", "convert_text_to_morse"]
+__all__ = [
+	"DEFAULT_WORD_CACHE_SIZE",
+	"ErrorHandler",
+	"IncrementalMorseDecoder",
+	"IncrementalMorseEncoder",
+	"WordCacheStats",
+	"clear_word_cache",
+	"configure_word_cache",
+	"convert_morse_to_text",
+	"convert_text_to_morse",
+	"convert_texts_to_morse",
+	"iter_decode",
+	"iter_encode",
+	"translate_stream",
+	"word_cache_stats",
+]
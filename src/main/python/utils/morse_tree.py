@@ -0,0 +1,102 @@
+"""Flat-array dichotomic tree for decoding Morse symbols element by element.
+
+Nodes use implicit heap numbering: the root is ``1`` and a node ``n`` has its
+dot child at ``2n`` and its dash child at ``2n + 1``.  A symbol therefore
+decodes by walking its elements from the root without building a substring,
+and the node number doubles as a compact code for the symbol itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+ROOT = 1
+
+# (uppercase, lowercase) form of the character stored at a node; numbers and
+# symbols use the same character twice.
+TreeEntry = tuple[str, str]
+
+
+def node_for_code(code: str) -> int:
+	"""Return the node number reached by walking *code* from the root."""
+
+	node = ROOT
+	for element in code:
+		if element == ".":
+			node = 2 * node
+		elif element == "-":
+			node = 2 * node + 1
+		else:
+			raise ValueError(f"Invalid Morse element {element!r} in {code!r}")
+	return node
+
+
+def code_for_node(node: int) -> str:
+	"""Return the dot/dash code leading to *node* (the inverse of ``node_for_code``)."""
+
+	if node < ROOT:
+		raise ValueError(f"Invalid tree node {node}")
+	return bin(node)[3:].replace("0", ".").replace("1", "-")
+
+
+@dataclass(frozen=True)
+class DichotomicTree:
+	"""Immutable Morse decoding tree stored in a flat tuple."""
+
+	nodes: tuple[TreeEntry | None, ...]
+
+	@classmethod
+	def from_pairs(
+		cls,
+		letter_pairs: Iterable[tuple[str, str]],
+		other_pairs: Iterable[tuple[str, str]] = (),
+	) -> DichotomicTree:
+		"""Build a tree from (character, code) pairs.
+
+		Letters decode to an (upper, lower) entry so callers can apply word
+		capitalisation; other characters decode to themselves.  When two
+		characters share a code the first one wins.
+		"""
+
+		entries: dict[int, TreeEntry] = {}
+		for letter, code in letter_pairs:
+			entries.setdefault(node_for_code(code), (letter.upper(), letter))
+		for char, code in other_pairs:
+			entries.setdefault(node_for_code(code), (char, char))
+
+		size = 2 ** max(entries, default=ROOT).bit_length()
+		nodes: list[TreeEntry | None] = [None] * size
+		for node, entry in entries.items():
+			nodes[node] = entry
+		return cls(nodes=tuple(nodes))
+
+	@property
+	def size(self) -> int:
+		"""Number of node slots; any node number at or beyond it is a dead end."""
+
+		return len(self.nodes)
+
+	def entry(self, node: int) -> TreeEntry | None:
+		"""Return the entry stored at *node*, or ``None`` for an empty or dead node."""
+
+		if ROOT <= node < len(self.nodes):
+			return self.nodes[node]
+		return None
+
+	def lookup(self, code: str) -> TreeEntry | None:
+		"""Return the entry for a complete dot/dash *code*, or ``None``."""
+
+		try:
+			return self.entry(node_for_code(code))
+		except ValueError:
+			return None
+
+
+__all__ = [
+	"ROOT",
+	"DichotomicTree",
+	"TreeEntry",
+	"code_for_node",
+	"node_for_code",
+]
@@ -0,0 +1,186 @@
+"""Translation that reports every unsupported token instead of only the first.
+
+``convert_text_to_morse`` and ``convert_morse_to_text`` stop at the first bad
+token.  ``translate_checked`` finds all of them, each with its offset in the
+input, and applies an ``ErrorPolicy`` so one pass yields both the list of
+problems and a best-effort translation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+
+from ..exceptions import (
+	InvalidModeError,
+	TranslationError,
+	UnsupportedCharacterError,
+	UnsupportedMorseSymbolError,
+)
+from .alphabets import DEFAULT_ALPHABET, compile_alphabet
+from .morse_scanner import SYMBOL, scan_morse
+from .morse_translator import (
+	ErrorHandler,
+	IncrementalMorseDecoder,
+	IncrementalMorseEncoder,
+	_unsupported_pattern,
+	convert_morse_to_text,
+	convert_text_to_morse,
+)
+from .nearest_codes import DEFAULT_MAX_DISTANCE, nearest_codes
+
+# The "error" procedural signal (eight dots), sent for replaced characters.
+ERROR_SIGNAL = "........"
+DEFAULT_TEXT_PLACEHOLDER = "\ufffd"
+
+_DEFAULT_PLACEHOLDERS = {
+	"text_to_morse": ERROR_SIGNAL,
+	"morse_to_text": DEFAULT_TEXT_PLACEHOLDER,
+}
+
+
+class ErrorPolicy(Enum):
+	"""What ``translate_checked`` does with an unsupported token."""
+
+	RAISE = "raise"
+	SKIP = "skip"
+	REPLACE = "replace"
+	NEAREST = "nearest"
+
+
+@dataclass(frozen=True)
+class TranslationIssue:
+	"""An unsupported character or Morse symbol and where it starts."""
+
+	offset: int
+	token: str
+
+	@property
+	def end(self) -> int:
+		return self.offset + len(self.token)
+
+
+@dataclass(frozen=True)
+class TranslationResult:
+	"""Translated text together with every issue found in the input."""
+
+	text: str
+	issues: tuple[TranslationIssue, ...] = ()
+
+	@property
+	def ok(self) -> bool:
+		return not self.issues
+
+
+def find_issues(
+	message: str,
+	*,
+	mode: str,
+	alphabet: str = DEFAULT_ALPHABET,
+) -> tuple[TranslationIssue, ...]:
+	"""Return every unsupported token in *message*, in input order."""
+
+	if mode == "text_to_morse":
+		pattern = _unsupported_pattern(compile_alphabet(alphabet)).finditer(message)
+		return tuple(TranslationIssue(match.start(), match.group()) for match in pattern)
+	if mode == "morse_to_text":
+		known = compile_alphabet(alphabet).codes
+		return tuple(
+			TranslationIssue(start, message[start:end])
+			for kind, start, end in scan_morse(message)
+			if kind == SYMBOL and message[start:end] not in known
+		)
+	raise InvalidModeError(mode)
+
+
+def translate_checked(
+	message: str,
+	*,
+	mode: str,
+	policy: ErrorPolicy = ErrorPolicy.RAISE,
+	placeholder: str | None = None,
+	alphabet: str = DEFAULT_ALPHABET,
+) -> TranslationResult:
+	"""Translate *message*, handling unsupported tokens according to *policy*.
+
+	``RAISE`` raises the same typed error as the plain converters, for the
+	first offending token.  ``SKIP`` drops offending tokens and ``REPLACE``
+	swaps each for *placeholder*: a Morse code when encoding (default: the
+	error signal) or a non-letter character when decoding (default: U+FFFD).
+	``NEAREST`` decodes each bad symbol as the nearest valid code, one edit
+	away, and replaces symbols with no such neighbour; when encoding it is
+	``REPLACE``.  Either way the result lists all issues with their offsets,
+	collected while translating rather than by a separate scan.
+	"""
+
+	if mode not in _DEFAULT_PLACEHOLDERS:
+		raise InvalidModeError(mode)
+	if policy is ErrorPolicy.RAISE:
+		if mode == "text_to_morse":
+			return TranslationResult(convert_text_to_morse(message, alphabet=alphabet))
+		return TranslationResult(convert_morse_to_text(message, alphabet=alphabet))
+
+	placeholder = placeholder or _DEFAULT_PLACEHOLDERS[mode]
+	issues: list[TranslationIssue] = []
+	replacement = "" if policy is ErrorPolicy.SKIP else placeholder
+
+	def collect(token: str, offset: int) -> str:
+		issues.append(TranslationIssue(offset, token))
+		return replacement
+
+	text = _translate(message, mode, alphabet, collect)
+	if issues and policy is ErrorPolicy.NEAREST and mode == "morse_to_text":
+		# Only the symbols already known to be bad are looked at again.
+		nearest = (_nearest_code(issue.token, alphabet) for issue in issues)
+		repaired = _splice(message, issues, nearest)
+		text = _translate(repaired, mode, alphabet, lambda token, offset: placeholder)
+	return TranslationResult(text, tuple(issues))
+
+
+def issue_error(issue: TranslationIssue, *, mode: str) -> TranslationError:
+	"""Return the typed error the plain converter would raise for *issue*."""
+
+	if mode == "text_to_morse":
+		return UnsupportedCharacterError(issue.token)
+	if mode == "morse_to_text":
+		return UnsupportedMorseSymbolError(issue.token)
+	raise InvalidModeError(mode)
+
+
+def _splice(message: str, issues: Iterable[TranslationIssue], replacements: Iterable[str]) -> str:
+	pieces: list[str] = []
+	position = 0
+	for issue, replacement in zip(issues, replacements):
+		pieces.append(message[position : issue.offset])
+		pieces.append(replacement)
+		position = issue.end
+	pieces.append(message[position:])
+	return "".join(pieces)
+
+
+def _translate(message: str, mode: str, alphabet: str, on_error: ErrorHandler) -> str:
+	if mode == "text_to_morse":
+		encoder = IncrementalMorseEncoder(alphabet=alphabet, on_error=on_error)
+		return encoder.encode(message, final=True)
+	decoder = IncrementalMorseDecoder(alphabet=alphabet, on_error=on_error)
+	return decoder.decode(message, final=True)
+
+
+def _nearest_code(symbol: str, alphabet: str) -> str:
+	"""Return the nearest valid code to *symbol*, or *symbol* itself if none is close."""
+
+	candidates = nearest_codes(symbol, alphabet=alphabet, max_distance=DEFAULT_MAX_DISTANCE)
+	return candidates[0] if candidates else symbol
+
+
+__all__ = [
+	"DEFAULT_TEXT_PLACEHOLDER",
+	"ERROR_SIGNAL",
+	"ErrorPolicy",
+	"TranslationIssue",
+	"TranslationResult",
+	"find_issues",
+	"issue_error",
+	"translate_checked",
+]
@@ -0,0 +1,156 @@
+"""Nearest valid Morse codes for mistyped symbols.
+
+A learner's ``.-..-`` is usually ``.-..`` with one element too many.  The
+codes of an alphabet are indexed in a BK-tree under the Levenshtein distance,
+so finding every code within a small distance of a symbol visits only the
+branches the triangle inequality cannot rule out instead of all codes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from .alphabets import DEFAULT_ALPHABET, CompiledAlphabet, compile_alphabet
+
+# One added, dropped or flipped element; at two, most short symbols are
+# within reach of a large part of the alphabet.
+DEFAULT_MAX_DISTANCE = 1
+
+
+def edit_distance(first: str, second: str) -> int:
+	"""Return the Levenshtein distance between two strings."""
+
+	if len(first) < len(second):
+		first, second = second, first
+	previous = list(range(len(second) + 1))
+	for row, char in enumerate(first, 1):
+		current = [row]
+		for column, other in enumerate(second, 1):
+			current.append(
+				min(
+					previous[column] + 1,
+					current[column - 1] + 1,
+					previous[column - 1] + (char != other),
+				)
+			)
+		previous = current
+	return previous[-1]
+
+
+class BKTree:
+	"""Burkhard-Keller tree over strings under ``edit_distance``.
+
+	Each node keeps its children by their distance to it.  A search for
+	matches within *d* of a query at distance *k* from a node only descends
+	into children whose edge lies in ``[k - d, k + d]``.
+	"""
+
+	def __init__(self, words: Iterable[str] = ()) -> None:
+		self._root: tuple[str, dict[int, tuple]] | None = None
+		self._size = 0
+		for word in words:
+			self.add(word)
+
+	def __len__(self) -> int:
+		return self._size
+
+	def add(self, word: str) -> None:
+		if self._root is None:
+			self._root = (word, {})
+			self._size = 1
+			return
+		node = self._root
+		while True:
+			distance = edit_distance(word, node[0])
+			if distance == 0:
+				return
+			child = node[1].get(distance)
+			if child is None:
+				node[1][distance] = (word, {})
+				self._size += 1
+				return
+			node = child
+
+	def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+		"""Return ``(distance, match)`` for every word within *max_distance*, nearest first."""
+
+		found: list[tuple[int, str]] = []
+		stack = [self._root] if self._root is not None else []
+		while stack:
+			candidate, children = stack.pop()
+			distance = edit_distance(word, candidate)
+			if distance <= max_distance:
+				found.append((distance, candidate))
+			for edge, child in children.items():
+				if distance - max_distance <= edge <= distance + max_distance:
+					stack.append(child)
+		found.sort(key=lambda match: (match[0], len(match[1]), match[1]))
+		return found
+
+
+@lru_cache(maxsize=8)
+def code_index(alphabet: CompiledAlphabet) -> BKTree:
+	"""Return the BK-tree over every code of *alphabet*, built once per alphabet."""
+
+	return BKTree(sorted(alphabet.codes, key=lambda code: (len(code), code)))
+
+
+def nearest_codes(
+	symbol: str,
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> tuple[str, ...]:
+	"""Return the valid codes nearest to *symbol*, at most *max_distance* away.
+
+	Only the codes at the smallest distance found are returned, shorter codes
+	first and, among codes of one length, those sharing a longer prefix with
+	*symbol*, as slips tend to come at its end.  A valid *symbol* is its own
+	only match.
+	"""
+
+	return _nearest(compile_alphabet(alphabet), symbol, max_distance)
+
+
+def suggest_characters(
+	symbol: str,
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> tuple[str, ...]:
+	"""Return the characters of ``nearest_codes(symbol)``, for "did you mean" hints."""
+
+	compiled = compile_alphabet(alphabet)
+	tree = compiled.tree
+	return tuple(tree.lookup(code)[0] for code in _nearest(compiled, symbol, max_distance))
+
+
+@lru_cache(maxsize=1024)
+def _nearest(alphabet: CompiledAlphabet, symbol: str, max_distance: int) -> tuple[str, ...]:
+	matches = code_index(alphabet).search(symbol, max_distance)
+	if not matches:
+		return ()
+	best = matches[0][0]
+	nearest = [code for distance, code in matches if distance == best]
+	nearest.sort(key=lambda code: (len(code), -_common_prefix(symbol, code), code))
+	return tuple(nearest)
+
+
+def _common_prefix(first: str, second: str) -> int:
+	length = 0
+	for char, other in zip(first, second):
+		if char != other:
+			break
+		length += 1
+	return length
+
+
+__all__ = [
+	"DEFAULT_MAX_DISTANCE",
+	"BKTree",
+	"code_index",
+	"edit_distance",
+	"nearest_codes",
+	"suggest_characters",
+]
@@ -0,0 +1,160 @@
+"""Compact byte-packed Morse sequences.
+
+Each symbol is stored as its dichotomic-tree node number: a leading sentinel
+bit followed by one bit per element (``0`` for a dot, ``1`` for a dash), so
+the int carries both the length and the elements.  Symbols of up to seven
+elements, which covers every built-in code, fit in one byte; byte ``0`` marks
+a word gap.  A sequence is then a ``bytes`` object, so equality and hashing
+are plain byte comparisons and a corpus costs about a byte per symbol.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+
+from ..exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
+from .alphabets import DEFAULT_ALPHABET, WORD_GAP_MARKER, CompiledAlphabet, compile_alphabet
+from .morse_scanner import split_words
+from .morse_tree import ROOT, code_for_node, node_for_code
+from .timing_plan import LETTER_GAP, _symbol_runs
+from .timing_plan import WORD_GAP as WORD_GAP_RUN
+
+WORD_GAP = 0
+MAX_SYMBOL_ELEMENTS = 7
+
+_MAX_NODE = (1 << (MAX_SYMBOL_ELEMENTS + 1)) - 1
+_GAP_RUN = re.compile(b"\x00{2,}")
+
+_NODE_FOR_CODE: dict[str, int] = {
+	"".join(elements): node_for_code("".join(elements))
+	for length in range(1, MAX_SYMBOL_ELEMENTS + 1)
+	for elements in product(".-", repeat=length)
+}
+# Node → code plus letter separator, with the word gap as the encoder's marker.
+_CODE_FOR_BYTE: tuple[str, ...] = (WORD_GAP_MARKER,) + tuple(
+	f"{code_for_node(node)} " for node in range(ROOT, _MAX_NODE + 1)
+)
+# Timing-plan runs of each symbol; see ``utils.timing_plan``.
+_RUNS_FOR_BYTE: tuple[tuple[int, ...], ...] = ((),) + tuple(
+	_symbol_runs(code_for_node(node)) for node in range(ROOT, _MAX_NODE + 1)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PackedMorse:
+	"""An immutable Morse sequence stored one byte per symbol.
+
+	Sequences are kept canonical: no leading word gap and never two in a row,
+	so two inputs that decode alike pack to equal bytes.
+	"""
+
+	data: bytes = b""
+
+	@classmethod
+	def from_text(cls, text: str, *, alphabet: str = DEFAULT_ALPHABET) -> PackedMorse:
+		"""Pack plain *text* without building its dot/dash spelling first."""
+
+		table, supported = _pack_table(compile_alphabet(alphabet))
+		unsupported = text.translate(supported)
+		if unsupported:
+			raise UnsupportedCharacterError(unsupported[0])
+		data = b"".join(map(table.__getitem__, text))
+		return cls(_GAP_RUN.sub(b"\x00", data).lstrip(b"\x00"))
+
+	@classmethod
+	def from_morse(cls, morse: str) -> PackedMorse:
+		"""Pack a dot/dash string, reading gaps the way ``convert_morse_to_text`` does."""
+
+		packed = bytearray()
+		# As in the decoder, the end of the input counts as one more space.
+		for index, word in enumerate(split_words(f"{morse} ")):
+			if index and packed and packed[-1] != WORD_GAP:
+				packed.append(WORD_GAP)
+			for symbol in word.split():
+				node = _NODE_FOR_CODE.get(symbol)
+				if node is None:
+					raise UnsupportedMorseSymbolError(symbol)
+				packed.append(node)
+		return cls(bytes(packed))
+
+	def to_morse(self) -> str:
+		"""Return the dot/dash spelling: one space between letters, three between words."""
+
+		data = self.data
+		if not data:
+			return ""
+		morse = "".join(map(_CODE_FOR_BYTE.__getitem__, data))
+		if WORD_GAP in data:
+			morse = morse.replace(f" {WORD_GAP_MARKER}", WORD_GAP_MARKER)
+			morse = morse.replace(WORD_GAP_MARKER, "   ")
+		return morse if data[-1] == WORD_GAP else morse[:-1]
+
+	def to_text(self, *, alphabet: str = DEFAULT_ALPHABET) -> str:
+		"""Decode to text with the capitalisation of ``convert_morse_to_text``."""
+
+		nodes = compile_alphabet(alphabet).tree.nodes
+		size = len(nodes)
+		text: list[str] = []
+		word_start = True
+		for node in self.data:
+			if node == WORD_GAP:
+				if not word_start:
+					text.append(" ")
+					word_start = True
+				continue
+			entry = nodes[node] if node < size else None
+			if entry is None:
+				raise UnsupportedMorseSymbolError(code_for_node(node))
+			text.append(entry[0] if word_start else entry[1])
+			word_start = False
+		return "".join(text)
+
+	def timing_plan(self) -> array:
+		"""Return the timing-plan runs for audio synthesis.
+
+		The runs equal ``compile_timing_plan(self.to_morse())`` without the
+		dot/dash spelling in between; leading and trailing word gaps are silent.
+		"""
+
+		plan = array("b")
+		gap = LETTER_GAP
+		for node in self.data:
+			if node == WORD_GAP:
+				gap = WORD_GAP_RUN
+				continue
+			if plan:
+				plan.append(gap)
+			gap = LETTER_GAP
+			plan.extend(_RUNS_FOR_BYTE[node])
+		return plan
+
+	@property
+	def symbols(self) -> bytes:
+		"""The packed symbols without word gaps, for gap-insensitive comparison."""
+
+		return self.data.replace(b"\x00", b"")
+
+	def __len__(self) -> int:
+		return len(self.data)
+
+	def __bool__(self) -> bool:
+		return bool(self.data)
+
+
+@lru_cache(maxsize=8)
+def _pack_table(alphabet: CompiledAlphabet) -> tuple[dict[str, bytes], dict[int, None]]:
+	"""Return char→packed byte for *alphabet* and a filter deleting those chars."""
+
+	table = {" ": b"\x00"}
+	for char, code in alphabet.encode_table.items():
+		node = _NODE_FOR_CODE.get(code[:-1])
+		if node is not None:
+			table[char] = bytes((node,))
+	return table, dict.fromkeys(map(ord, table))
+
+
+__all__ = ["MAX_SYMBOL_ELEMENTS", "WORD_GAP", "PackedMorse"]
@@ -0,0 +1,167 @@
+"""Prosigns and other multi-character tokens sent as a single Morse symbol.
+
+The encoder works one character at a time, so a token such as ``<AR>`` is
+handled by a pre-pass: an Aho-Corasick automaton, built once from the
+alphabet's prosign table, finds the leftmost-longest tokens in one linear
+scan, and each is replaced by a private-use stand-in character that an
+extended encode table maps to the prosign's code.  The rest of the text is
+then encoded by the unchanged table-driven encoder.  The extended decoding
+tree carries the reverse entries, so a prosign code decodes to its token.
+
+Only prosigns are built in.  Operating abbreviations such as ``CQ``, ``DE``
+or ``73`` are keyed letter by letter with ordinary letter gaps, so the plain
+encoder already sends them correctly; listing them here would run their
+letters together into a single, different symbol.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..exceptions import UnsupportedCharacterError
+from .alphabets import CompiledAlphabet, _compiled
+from .morse_tree import DichotomicTree
+
+# Stand-ins come from the Private Use Area, which no alphabet encodes.
+_STAND_IN_BASE = 0xE000
+_STAND_IN = re.compile("[\ue000-\uf8ff]")
+
+
+class TokenAutomaton:
+	"""Aho-Corasick automaton matching a fixed set of tokens, ignoring case.
+
+	The failure links are folded into a full transition table when the
+	automaton is built, so scanning costs one dict lookup per character, and
+	stretches of text that cannot start a token are skipped with a regex.
+	"""
+
+	def __init__(self, tokens: Sequence[str]) -> None:
+		goto: list[dict[str, int]] = [{}]
+		outputs: list[tuple[int, ...]] = [()]
+		for index, token in enumerate(tokens):
+			state = 0
+			for char in token.lower():
+				child = goto[state].get(char)
+				if child is None:
+					child = goto[state][char] = len(goto)
+					goto.append({})
+					outputs.append(())
+				state = child
+			outputs[state] += (index,)
+
+		# Breadth-first, so a state's failure target is complete before it.
+		delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+		fail = [0] * len(goto)
+		queue = deque(goto[0].values())
+		while queue:
+			state = queue.popleft()
+			outputs[state] += outputs[fail[state]]
+			delta[state] = {**delta[fail[state]], **goto[state]}
+			for char, child in goto[state].items():
+				fail[child] = delta[fail[state]].get(char, 0)
+				queue.append(child)
+
+		for transitions in delta:
+			for char, target in list(transitions.items()):
+				for variant in {char.upper(), char.title()}:
+					if len(variant) == 1:
+						transitions.setdefault(variant, target)
+
+		self._delta = tuple(delta)
+		self._outputs = tuple(outputs)
+		self._lengths = tuple(len(token.lower()) for token in tokens)
+		firsts = "".join(delta[0])
+		self._start = re.compile("[" + re.escape(firsts) + "]") if firsts else None
+
+	def find(self, text: str) -> list[tuple[int, int, int]]:
+		"""Return leftmost-longest, non-overlapping ``(start, end, token index)`` matches."""
+
+		if self._start is None:
+			return []
+		delta = self._delta
+		outputs = self._outputs
+		lengths = self._lengths
+		search = self._start.search
+		found: list[tuple[int, int, int]] = []
+		state = 0
+		position = 0
+		size = len(text)
+		while position < size:
+			if not state:
+				start = search(text, position)
+				if start is None:
+					break
+				position = start.start()
+			state = delta[state].get(text[position], 0)
+			position += 1
+			for index in outputs[state]:
+				found.append((position - lengths[index], position, index))
+
+		found.sort(key=lambda match: (match[0], -match[1]))
+		matches: list[tuple[int, int, int]] = []
+		end = 0
+		for match in found:
+			if match[0] >= end:
+				matches.append(match)
+				end = match[1]
+		return matches
+
+	def substitute(self, text: str, replacements: Sequence[str]) -> str:
+		"""Replace every match in *text* with the replacement for its token."""
+
+		pieces: list[str] = []
+		position = 0
+		for start, end, index in self.find(text):
+			pieces.append(text[position:start])
+			pieces.append(replacements[index])
+			position = end
+		if not pieces:
+			return text
+		pieces.append(text[position:])
+		return "".join(pieces)
+
+
+@dataclass(frozen=True, eq=False)
+class ProsignAlphabet:
+	"""A compiled alphabet extended with its prosigns.
+
+	``compiled`` encodes the stand-in characters and decodes prosign codes to
+	their tokens.  A prosign sharing a code with a symbol (``<AR>`` and
+	``+``) decodes to the prosign.
+	"""
+
+	compiled: CompiledAlphabet
+	automaton: TokenAutomaton
+	stand_ins: tuple[str, ...]
+
+	def substitute(self, text: str) -> str:
+		"""Replace every prosign in *text* with its stand-in character."""
+
+		stray = _STAND_IN.search(text)
+		if stray is not None:
+			raise UnsupportedCharacterError(stray.group())
+		return self.automaton.substitute(text, self.stand_ins)
+
+
+@lru_cache(maxsize=8)
+def compile_prosigns(alphabet: CompiledAlphabet) -> ProsignAlphabet:
+	"""Return *alphabet* extended with its prosign table, built once per alphabet."""
+
+	source = alphabet.alphabet
+	pairs = source.prosign_pairs
+	stand_ins = tuple(chr(_STAND_IN_BASE + index) for index in range(len(pairs)))
+	table = dict(alphabet.encode_table)
+	table.update((stand_in, f"{code} ") for stand_in, (_, code) in zip(stand_ins, pairs))
+	tree = DichotomicTree.from_pairs(source.letter_pairs, (*pairs, *source.other_pairs))
+	return ProsignAlphabet(
+		compiled=_compiled(source, table, tree),
+		automaton=TokenAutomaton([token for token, _ in pairs]),
+		stand_ins=stand_ins,
+	)
+
+
+__all__ = ["ProsignAlphabet", "TokenAutomaton", "compile_prosigns"]
@@ -0,0 +1,232 @@
+"""Decoding Morse whose letter gaps are missing.
+
+Copied Morse often runs letters together: ``.--...`` may be ``PS``, ``AIS``
+or ``ETIS``.  ``segment_morse`` finds the most probable reading under a
+character n-gram model with a Viterbi search over element positions.  From
+each position the search walks the decoding tree one element at a time, so
+every code starting there is tried in at most seven steps, and only the
+``beam_width`` cheapest hypotheses are kept per position, which keeps the
+search linear in the length of the input.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable
+from functools import lru_cache
+
+from ..exceptions import UnsupportedMorseSymbolError
+from ..resources import exercise_data
+from .alphabets import DEFAULT_ALPHABET, compile_alphabet
+from .morse_scanner import split_words
+from .morse_tree import ROOT, TreeEntry
+
+DEFAULT_ORDER = 3
+DEFAULT_BEAM_WIDTH = 8
+
+# The decoded text of a hypothesis, as a linked list of (previous, piece).
+_History = tuple["_History | None", str] | None
+
+
+class CharNgramModel:
+	"""Character n-gram model with Witten-Bell smoothing.
+
+	Text is modelled in lower case with whitespace collapsed to single spaces,
+	a space standing for every word boundary.  A character unseen in training
+	falls back to a uniform share of the observed character set plus one.
+	"""
+
+	def __init__(self, counts: dict[str, dict[str, int]], order: int) -> None:
+		self.order = order
+		self._counts = counts
+		self._totals = {context: sum(followers.values()) for context, followers in counts.items()}
+		self._uniform = 1.0 / (len(counts.get("", ())) + 1)
+		self._costs: dict[tuple[str, str], float] = {}
+		self._steps: dict[tuple[str, str], tuple[float, str]] = {}
+		self._keep = _context_length(order)
+
+	@classmethod
+	def train(cls, texts: Iterable[str], *, order: int = DEFAULT_ORDER) -> CharNgramModel:
+		"""Count the n-grams of *texts*, each treated as words between boundaries."""
+
+		if order < 1:
+			raise ValueError("order must be at least 1")
+		counts: dict[str, dict[str, int]] = {}
+		padding = " " * _context_length(order)
+		for text in texts:
+			normalized = f"{padding}{' '.join(text.lower().split())} "
+			for index in range(len(padding), len(normalized)):
+				char = normalized[index]
+				for size in range(order):
+					context = normalized[index - size : index]
+					followers = counts.setdefault(context, {})
+					followers[char] = followers.get(char, 0) + 1
+		return cls(counts, order)
+
+	def cost(self, context: str, char: str) -> float:
+		"""Return ``-log2 P(char | context)`` using up to ``order - 1`` characters of context."""
+
+		key = (context, char)
+		cost = self._costs.get(key)
+		if cost is None:
+			cost = self._costs[key] = -math.log2(self.probability(context, char))
+		return cost
+
+	def step(self, context: str, char: str) -> tuple[float, str]:
+		"""Return the cost of *char* after *context* and the context that follows it."""
+
+		key = (context, char)
+		step = self._steps.get(key)
+		if step is None:
+			step = self._steps[key] = (self.cost(context, char), (context + char)[-self._keep :])
+		return step
+
+	def probability(self, context: str, char: str) -> float:
+		"""Return ``P(char | context)``, interpolating down to the unigram estimate."""
+
+		probability = self._uniform
+		context = context[len(context) - self.order + 1 :] if self.order > 1 else ""
+		for size in range(len(context) + 1):
+			history = context[len(context) - size :]
+			followers = self._counts.get(history)
+			if not followers:
+				continue
+			types = len(followers)
+			probability = (followers.get(char, 0) + types * probability) / (
+				self._totals[history] + types
+			)
+		return probability
+
+
+def _context_length(order: int) -> int:
+	"""Characters of history a model of *order* keeps; at least one marks word starts."""
+
+	return max(order - 1, 1)
+
+
+@lru_cache(maxsize=1)
+def default_model() -> CharNgramModel:
+	"""Return the model trained on the bundled exercise texts."""
+
+	return CharNgramModel.train(
+		(*exercise_data.TRANSLATION_TEXT_SAMPLES, *exercise_data.TEST_TEXT_PROMPTS)
+	)
+
+
+def segment_morse(
+	morse: str,
+	*,
+	alphabet: str = DEFAULT_ALPHABET,
+	model: CharNgramModel | None = None,
+	beam_width: int = DEFAULT_BEAM_WIDTH,
+	insert_spaces: bool = False,
+) -> str:
+	"""Return the most probable text for *morse*, placing the missing letter gaps.
+
+	Word gaps are kept as they are and the letter gaps that are present are
+	respected; within a run of elements every split into codes is considered.
+	With *insert_spaces* the search may also end a word where no word gap
+	was sent, for input with no gaps at all.  Capitalisation follows
+	``convert_morse_to_text``.
+	"""
+
+	if beam_width < 1:
+		raise ValueError("beam_width must be at least 1")
+	model = model or default_model()
+	nodes = compile_alphabet(alphabet).tree.nodes
+
+	beam: dict[str, tuple[float, _History]] = {" " * model._keep: (0.0, None)}
+	for word_index, word in enumerate(split_words(morse)):
+		symbols = word.split()
+		if not symbols:
+			continue
+		if word_index and beam:
+			beam = _end_words(beam, model)
+		for symbol in symbols:
+			beam = _segment_symbol(symbol, beam, nodes, model, beam_width, insert_spaces)
+
+	if not beam:
+		return ""
+	_, history = min(beam.values(), key=lambda state: state[0])
+	pieces: list[str] = []
+	while history is not None:
+		history, piece = history
+		pieces.append(piece)
+	return "".join(reversed(pieces)).strip()
+
+
+def _segment_symbol(
+	symbol: str,
+	beam: dict[str, tuple[float, _History]],
+	nodes: tuple[TreeEntry | None, ...],
+	model: CharNgramModel,
+	beam_width: int,
+	insert_spaces: bool,
+) -> dict[str, tuple[float, _History]]:
+	size = len(nodes)
+	length = len(symbol)
+	steps = model._steps
+	step_for = model.step
+	beams: list[dict[str, tuple[float, _History]]] = [{} for _ in range(length + 1)]
+	beams[0] = beam
+	for start in range(length):
+		states = beams[start]
+		if not states:
+			continue
+		if insert_spaces and start:
+			open_words = {context: state for context, state in states.items() if context[-1] != " "}
+			for context, state in _end_words(open_words, model).items():
+				best = states.get(context)
+				if best is None or state[0] < best[0]:
+					states[context] = state
+		if len(states) > beam_width:
+			states = dict(heapq.nsmallest(beam_width, states.items(), key=lambda item: item[1][0]))
+		node = ROOT
+		for end in range(start, length):
+			element = symbol[end]
+			if element == ".":
+				node *= 2
+			elif element == "-":
+				node = 2 * node + 1
+			else:
+				raise UnsupportedMorseSymbolError(symbol)
+			if node >= size:
+				break
+			entry = nodes[node]
+			if entry is None:
+				continue
+			upper, char = entry
+			target = beams[end + 1]
+			for context, (total, history) in states.items():
+				cost, new_context = steps.get((context, char)) or step_for(context, char)
+				cost += total
+				best = target.get(new_context)
+				if best is None or cost < best[0]:
+					shown = upper if context[-1] == " " else char
+					target[new_context] = (cost, (history, shown))
+	if not beams[length]:
+		raise UnsupportedMorseSymbolError(symbol)
+	return beams[length]
+
+
+def _end_words(
+	beam: dict[str, tuple[float, _History]], model: CharNgramModel
+) -> dict[str, tuple[float, _History]]:
+	ended: dict[str, tuple[float, _History]] = {}
+	for context, (total, history) in beam.items():
+		cost, new_context = model.step(context, " ")
+		cost += total
+		best = ended.get(new_context)
+		if best is None or cost < best[0]:
+			ended[new_context] = (cost, (history, " "))
+	return ended
+
+
+__all__ = [
+	"DEFAULT_BEAM_WIDTH",
+	"DEFAULT_ORDER",
+	"CharNgramModel",
+	"default_model",
+	"segment_morse",
+]
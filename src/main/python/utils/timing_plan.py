@@ -0,0 +1,133 @@
+"""Settings-independent timing of Morse sequences.
+
+A timing plan lists a sequence as runs measured in dot units: a positive
+count is a tone, a negative count a silence, so ``.- -`` is
+``[1, -1, 3, -3, 3]``.  Tones and silences alternate by construction, which
+makes the plan a run-length encoding of the keyed signal.  Runs are stored in
+an ``array("b")``, one byte each, and a plan is compiled once per Morse string
+and memoised: re-rendering the same text at another speed, pitch or volume,
+or estimating its duration, does not parse it again.
+
+``iter_timing_plan`` yields the same runs a word at a time, for consumers
+that should not wait for the whole input, such as streamed playback.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from ..exceptions import UnsupportedMorseSymbolError
+from .morse_scanner import split_words
+
+DOT = 1
+DASH = 3
+ELEMENT_GAP = -1
+LETTER_GAP = -3
+WORD_GAP = -7
+
+# Every run a plan can contain.
+RUNS = (DOT, DASH, ELEMENT_GAP, LETTER_GAP, WORD_GAP)
+
+# Characters of a string input split into words per step of ``iter_timing_plan``.
+_READ_SIZE = 1 << 14
+
+
+@lru_cache(maxsize=256)
+def compile_timing_plan(morse_code: str) -> array:
+	"""Return the runs of *morse_code*; the array is shared, so do not modify it.
+
+	Gaps follow ``utils.morse_scanner``: a line break or three spaces separate
+	words, and leading or trailing gaps are dropped.
+	"""
+
+	plan = array("b")
+	for word in split_words(morse_code):
+		runs = _word_runs(word)
+		if not runs:
+			continue
+		if plan:
+			plan.append(WORD_GAP)
+		plan.extend(runs)
+	return plan
+
+
+def iter_timing_plan(morse: str | Iterable[str]) -> Iterator[tuple[int, ...]]:
+	"""Yield the runs of *morse* one word at a time.
+
+	*morse* is a string or an iterable of string chunks, split anywhere.
+	Every word after the first starts with its ``WORD_GAP``, so the pieces
+	joined equal ``compile_timing_plan`` of the whole input.  Input is read
+	only as far as the word being yielded, and an invalid element raises
+	when its word is reached.
+	"""
+
+	first = True
+	for word in _iter_words(morse):
+		runs = _word_runs(word)
+		if not runs:
+			continue
+		yield runs if first else (WORD_GAP, *runs)
+		first = False
+
+
+def _iter_words(morse: str | Iterable[str]) -> Iterator[str]:
+	chunks = _read_chunks(morse) if isinstance(morse, str) else morse
+	# The text after the last word gap may still grow, so it waits for the
+	# next chunk; word gaps are found left to right, as in one ``split``.
+	pending = ""
+	for chunk in chunks:
+		words = split_words(pending + chunk)
+		pending = words.pop()
+		yield from words
+	yield pending
+
+
+def _read_chunks(morse: str) -> Iterator[str]:
+	for start in range(0, len(morse), _READ_SIZE):
+		yield morse[start : start + _READ_SIZE]
+
+
+@lru_cache(maxsize=1024)
+def _word_runs(word: str) -> tuple[int, ...]:
+	runs: list[int] = []
+	for symbol in word.split():
+		if runs:
+			runs.append(LETTER_GAP)
+		runs.extend(_symbol_runs(symbol))
+	return tuple(runs)
+
+
+@lru_cache(maxsize=256)
+def _symbol_runs(symbol: str) -> tuple[int, ...]:
+	runs: list[int] = []
+	for index, element in enumerate(symbol):
+		if index:
+			runs.append(ELEMENT_GAP)
+		if element == ".":
+			runs.append(DOT)
+		elif element == "-":
+			runs.append(DASH)
+		else:
+			raise UnsupportedMorseSymbolError(element)
+	return tuple(runs)
+
+
+def plan_units(plan: array) -> int:
+	"""Return the length of *plan* in dot units, tones and silences together."""
+
+	return sum(map(abs, plan))
+
+
+__all__ = [
+	"DASH",
+	"DOT",
+	"ELEMENT_GAP",
+	"LETTER_GAP",
+	"RUNS",
+	"WORD_GAP",
+	"compile_timing_plan",
+	"iter_timing_plan",
+	"plan_units",
+]
@@ -0,0 +1,200 @@
+"""Fold arbitrary text onto the characters a Morse alphabet can encode.
+
+Characters the alphabet supports are kept.  Every other character is replaced
+by an explicit mapping (``ß`` → ``ss``, typographic quotes and dashes, Russian
+letters after the Estonian transliteration rules) or else by its NFKD
+decomposition with the combining marks dropped (``é`` → ``e``, ``ﬁ`` → ``fi``).
+Characters with neither are left alone, so the encoder still reports them.
+
+The result for each code point is computed once per compiled alphabet and
+kept in a ``str.translate`` table; the common blocks are filled in up front,
+anything rarer on first sight.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+
+from .alphabets import DEFAULT_ALPHABET, CompiledAlphabet, compile_alphabet
+
+# Explicit replacements, tried before NFKD folding.  Their output is folded
+# again, so ``ш`` → ``š`` stays ``š`` in Estonian and becomes ``s`` in ITU.
+TRANSLITERATIONS: dict[str, str] = {
+	# Whitespace and invisible characters.
+	"\t": " ",
+	"\n": " ",
+	"\r": " ",
+	"\v": " ",
+	"\f": " ",
+	"\u200b": "",
+	"\u200c": "",
+	"\u200d": "",
+	"\u2060": "",
+	"\ufeff": "",
+	"\u00ad": "",
+	# Punctuation without a Morse code of its own.
+	"‘": "'",
+	"’": "'",
+	"‚": "'",
+	"‛": "'",
+	"′": "'",
+	"´": "'",
+	"`": "'",
+	"“": '"',
+	"”": '"',
+	"„": '"',
+	"‟": '"',
+	"″": '"',
+	"«": '"',
+	"»": '"',
+	"‹": "'",
+	"›": "'",
+	"‐": "-",
+	"‑": "-",
+	"‒": "-",
+	"–": "-",
+	"—": "-",
+	"―": "-",
+	"−": "-",
+	"×": "x",
+	"÷": "/",
+	"[": "(",
+	"]": ")",
+	"{": "(",
+	"}": ")",
+	# Latin letters that do not decompose.
+	"ß": "ss",
+	"ẞ": "SS",
+	"æ": "ae",
+	"Æ": "AE",
+	"œ": "oe",
+	"Œ": "OE",
+	"ø": "o",
+	"Ø": "O",
+	"ł": "l",
+	"Ł": "L",
+	"đ": "d",
+	"Đ": "D",
+	"ð": "d",
+	"Ð": "D",
+	"þ": "th",
+	"Þ": "Th",
+	"ı": "i",
+	"ħ": "h",
+	"Ħ": "H",
+	"ŋ": "ng",
+	"Ŋ": "Ng",
+}
+
+# Russian → Latin after the Estonian transliteration rules; capitals follow.
+_CYRILLIC_TO_LATIN = {
+	"а": "a",
+	"б": "b",
+	"в": "v",
+	"г": "g",
+	"д": "d",
+	"е": "e",
+	"ё": "jo",
+	"ж": "ž",
+	"з": "z",
+	"и": "i",
+	"й": "i",
+	"к": "k",
+	"л": "l",
+	"м": "m",
+	"н": "n",
+	"о": "o",
+	"п": "p",
+	"р": "r",
+	"с": "s",
+	"т": "t",
+	"у": "u",
+	"ф": "f",
+	"х": "h",
+	"ц": "ts",
+	"ч": "tš",
+	"ш": "š",
+	"щ": "štš",
+	"ъ": "",
+	"ы": "õ",
+	"ь": "",
+	"э": "e",
+	"ю": "ju",
+	"я": "ja",
+}
+for _letter, _latin in _CYRILLIC_TO_LATIN.items():
+	TRANSLITERATIONS[_letter] = _latin
+	TRANSLITERATIONS[_letter.upper()] = _latin.capitalize()
+
+# Blocks resolved when a table is built: Latin-1 through Latin Extended-B,
+# Cyrillic and General Punctuation.  Other code points are resolved lazily.
+_PRECOMPUTED_RANGES = (range(0x250), range(0x400, 0x500), range(0x2000, 0x2070))
+
+# ``str.translate`` has a fast path only for pure-ASCII strings, so mostly
+# ASCII text is translated in slices that usually qualify for it.
+_CHUNK_SIZE = 1024
+
+
+class _TransliterationTable(dict):
+	"""``str.translate`` table that resolves unseen code points on demand."""
+
+	def __init__(self, supported: frozenset[str]) -> None:
+		super().__init__()
+		self._supported = supported
+		for block in _PRECOMPUTED_RANGES:
+			for codepoint in block:
+				self[codepoint] = self._resolve(chr(codepoint))
+
+	def __missing__(self, codepoint: int) -> str:
+		replacement = self[codepoint] = self._resolve(chr(codepoint))
+		return replacement
+
+	def _resolve(self, char: str) -> str:
+		if char in self._supported:
+			return char
+		if unicodedata.combining(char):
+			# A mark left over from decomposed (NFD) input.
+			return ""
+		mapped = TRANSLITERATIONS.get(char)
+		if mapped is not None:
+			return "".join(self._fold(part) or part for part in mapped)
+		return self._fold(char) or char
+
+	def _fold(self, char: str) -> str | None:
+		"""Return *char* or its NFKD base characters if the alphabet has them all."""
+
+		if char in self._supported:
+			return char
+		decomposed = unicodedata.normalize("NFKD", char)
+		folded = "".join(part for part in decomposed if not unicodedata.combining(part))
+		if decomposed == char or not all(part in self._supported for part in folded):
+			return None
+		return folded
+
+
+def transliterate(text: str, *, alphabet: str = DEFAULT_ALPHABET) -> str:
+	"""Return *text* with every foldable character replaced for *alphabet*."""
+
+	return _fold_text(text, transliteration_table(compile_alphabet(alphabet)))
+
+
+@lru_cache(maxsize=8)
+def transliteration_table(alphabet: CompiledAlphabet) -> dict[int, str]:
+	"""Return the cached ``str.translate`` table folding text onto *alphabet*."""
+
+	return _TransliterationTable(frozenset(alphabet.encode_table))
+
+
+def _fold_text(text: str, table: dict[int, str]) -> str:
+	if len(text) <= _CHUNK_SIZE or text.isascii():
+		return text.translate(table)
+	return "".join(
+		[
+			text[start : start + _CHUNK_SIZE].translate(table)
+			for start in range(0, len(text), _CHUNK_SIZE)
+		]
+	)
+
+
+__all__ = ["TRANSLITERATIONS", "transliterate", "transliteration_table"]
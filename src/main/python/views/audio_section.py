@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from pathlib import Path
 from tkinter import TclError
 
 import customtkinter as ctk
 
 from ..controllers.translation_sandbox_controller import SandboxState
+from ..services.audio_playback import pump_audio, set_volume, stop_audio, stream_audio
+from ..services.morse_audio import MorseAudio
 from .theme import get_colors
 from .widgets import (
 	font_button_large,
@@ -24,6 +25,9 @@ from .widgets import (
 # Progress bar accent — fixed blue regardless of theme
 _SLIDER_PROGRESS_COLOR = "#2563eb"
 
+# Streamed audio needs its queue topped up well within one chunk's length.
+_PLAYBACK_POLL_MS = 50
+
 
 @dataclass
 class SliderBinding:
@@ -254,7 +258,7 @@ class AudioSection:
 
 	def render(self, state: SandboxState) -> None:
 		self._sync_sliders(state)
-		audio_ready = state.audio_ready and state.audio_path is not None
+		audio_ready = state.audio_ready
 
 		for button in (
 			self.play_audio_button,
@@ -280,10 +284,9 @@ class AudioSection:
 		finally:
 			self._updating_sliders = False
 
-	def play_audio(self, audio_path: Path) -> bool:
+	def play_stream(self, chunks: Iterable[MorseAudio], *, volume: float = 1.0) -> bool:
 		try:
-			self.pygame.mixer.music.load(str(audio_path))
-			self.pygame.mixer.music.play()
+			stream_audio(self.pygame, chunks, volume=volume)
 			self.mark_audio_playing(True)
 			return True
 		except self.pygame.error:
@@ -291,8 +294,13 @@ class AudioSection:
 			self.on_audio_error("Helifaili ei saa esitada.")
 			return False
 
+	def set_volume(self, volume: float) -> None:
+		"""Apply *volume* to the audio playing now; nothing is rendered again."""
+
+		set_volume(self.pygame, volume)
+
 	def stop_playback(self) -> None:
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self.mark_audio_playing(False)
 
 	def mark_audio_playing(self, is_playing: bool) -> None:
@@ -310,7 +318,9 @@ class AudioSection:
 
 		if is_playing:
 			if self._playback_poll_job is None:
-				self._playback_poll_job = self.root.after(200, self._poll_playback_status)
+				self._playback_poll_job = self.root.after(
+					_PLAYBACK_POLL_MS, self._poll_playback_status
+				)
 		else:
 			if self._playback_poll_job is not None:
 				self.root.after_cancel(self._playback_poll_job)
@@ -318,8 +328,8 @@ class AudioSection:
 
 	def _poll_playback_status(self) -> None:
 		self._playback_poll_job = None
-		if self.pygame.mixer.music.get_busy():
-			self._playback_poll_job = self.root.after(200, self._poll_playback_status)
+		if pump_audio(self.pygame):
+			self._playback_poll_job = self.root.after(_PLAYBACK_POLL_MS, self._poll_playback_status)
 		else:
 			self.mark_audio_playing(False)
 
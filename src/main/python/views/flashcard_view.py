@@ -7,6 +7,7 @@ import customtkinter as ctk
 from ..controllers.flashcard_controller import FlashcardState
 from ..controllers.protocols import FlashcardPresenterProtocol
 from ..navigator import Navigator
+from ..services.audio_playback import play_audio, stop_audio
 from .theme import get_colors, register_theme_callback
 from .widgets import make_button, make_card, make_font, make_frame, make_label, make_progress_bar
 
@@ -68,7 +69,7 @@ class FlashcardView:
 		self.next_button = None
 		self.audio_button = None
 		self._peak_progress_value = 0.0
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 
 	def _clear_content(self) -> None:
 		"""Destroy this view's children without touching other views."""
@@ -384,19 +385,17 @@ class FlashcardView:
 		self._render_state()
 
 	def play_flashcard_audio(self) -> None:
-		if not self.state or not self.state.audio_path:
+		if not self.state or self.state.audio is None:
 			return
 		try:
-			self.pygame.mixer.music.stop()
-			self.pygame.mixer.music.load(self.state.audio_path)
-			self.pygame.mixer.music.play()
+			play_audio(self.pygame, self.state.audio)
 		except (FileNotFoundError, self.pygame.error):
 			messagebox.showerror("Heli", "Helifaili ei õnnestunud esitada.")
 
 	# Completion -----------------------------------------------------------
 
 	def flashcard_finish(self) -> None:
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self.reset_state()
 		self._clear_content()
 		colors = get_colors()
@@ -5,6 +5,7 @@ import customtkinter as ctk
 from ..controllers.protocols import TestPresenterProtocol
 from ..model.test_session import TestSummary
 from ..navigator import Navigator
+from ..services.audio_playback import stop_audio
 from .test_menu_screen import TestMenuScreen
 from .test_review_screen import TestReviewScreen
 from .test_runner_screen import TestRunnerScreen
@@ -55,7 +56,7 @@ class TestView:
 		self.review_screen.reset()
 
 	def show_menu(self) -> None:
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self.reset_state()
 		self.menu_screen.show()
 
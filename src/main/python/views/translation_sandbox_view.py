@@ -98,6 +98,7 @@ class TranslationSandboxView:
 		self.translation_section = TranslationSection(
 			card,
 			on_select_mode=self._on_select_mode,
+			on_select_alphabet=self._on_select_alphabet,
 			on_translate=self._on_translate,
 			on_clear=self._on_clear,
 		)
@@ -138,6 +139,12 @@ class TranslationSandboxView:
 		state = self.presenter.set_mode(mode_key)
 		self._render_state(state)
 
+	def _on_select_alphabet(self, alphabet: str) -> None:
+		if self.audio_section is not None:
+			self.audio_section.stop_playback()
+		state = self.presenter.set_alphabet(alphabet)
+		self._render_state(state)
+
 	def _on_translate(self) -> None:
 		if self.translation_section is None:
 			return
@@ -161,9 +168,9 @@ class TranslationSandboxView:
 		if self.audio_section is None:
 			return
 		state = self.presenter.current_state()
-		if state is None or state.audio_path is None:
+		if state is None or not state.audio_ready:
 			return
-		self.audio_section.play_audio(state.audio_path)
+		self.audio_section.play_stream(self.presenter.stream_audio(), volume=state.volume)
 
 	def _on_save_audio(self) -> None:
 		if self.audio_section is not None:
@@ -185,9 +192,9 @@ class TranslationSandboxView:
 		if self.audio_section is not None:
 			self.audio_section.stop_playback()
 		state = self.presenter.current_state()
-		if state is None or state.audio_path is None:
+		if state is None or not state.audio_ready:
 			return
-		initial_path = Path(state.audio_path)
+		initial_path = self.presenter.next_output_path()
 		selection = filedialog.asksaveasfilename(
 			title="Salvesta helifail",
 			defaultextension=".wav",
@@ -214,9 +221,10 @@ class TranslationSandboxView:
 		messagebox.showinfo("Helifail salvestatud", f"Fail salvestatud:\n{saved_path}")
 
 	def _handle_volume_change(self, volume: float) -> None:
-		if self.audio_section is not None:
-			self.audio_section.stop_playback()
+		# Volume is applied by the mixer, so playback carries on while dragging.
 		state = self.presenter.update_volume(volume)
+		if self.audio_section is not None:
+			self.audio_section.set_volume(state.volume)
 		self._render_state(state)
 
 	def _handle_speed_change(self, unit_duration_ms: int) -> None:
@@ -8,6 +8,8 @@ from tkinter import TclError
 import customtkinter as ctk
 
 from ..controllers.translation_sandbox_controller import SandboxState
+from ..utils.alphabets import available_alphabets
+from ..utils.morse_validation import TranslationIssue
 from .theme import get_colors
 from .widgets import (
 	font_button_large,
@@ -23,6 +25,8 @@ from .widgets import (
 # Accent colours used only within this component
 _BUTTON_SEGMENT_HOVER = "#1d4ed8"
 
+_ISSUE_TAG = "translation_issue"
+
 
 class TranslationSection:
 	"""Left-side translation controls and text panes."""
@@ -32,10 +36,12 @@ class TranslationSection:
 		parent,
 		*,
 		on_select_mode: Callable[[str], None],
+		on_select_alphabet: Callable[[str], None],
 		on_translate: Callable[[], None],
 		on_clear: Callable[[], None],
 	) -> None:
 		self._on_select_mode = on_select_mode
+		self._on_select_alphabet = on_select_alphabet
 		self._on_translate = on_translate
 		self._on_clear = on_clear
 
@@ -63,6 +69,12 @@ class TranslationSection:
 			"Morse → tekst": "morse_to_text",
 		}
 		self._suppress_mode_callback = False
+		self.alphabet_selector: ctk.CTkSegmentedButton | None = None
+		self._label_to_alphabet = {
+			alphabet.label: alphabet.name for alphabet in available_alphabets()
+		}
+		self._alphabet_value_var = ctk.StringVar(value=next(iter(self._label_to_alphabet)))
+		self._suppress_alphabet_callback = False
 		self.input_label: ctk.CTkLabel | None = None
 		self.input_text: ctk.CTkTextbox | None = None
 		self.output_label: ctk.CTkLabel | None = None
@@ -109,6 +121,29 @@ class TranslationSection:
 		)
 		self.mode_selector.grid(row=1, column=0, sticky="ew")
 
+		make_label(
+			mode_card,
+			"Tähestik",
+			font=self._body_font,
+			text_color=get_colors().text_muted,
+			justify="left",
+		).grid(row=2, column=0, pady=(18, 12))
+
+		self.alphabet_selector = ctk.CTkSegmentedButton(
+			mode_card,
+			values=list(self._label_to_alphabet.keys()),
+			command=self._handle_alphabet_change,
+			variable=self._alphabet_value_var,
+			font=self._button_font,
+			fg_color=_sc.entry_bg,
+			selected_color=_sc.focus_ring,
+			selected_hover_color=_BUTTON_SEGMENT_HOVER,
+			unselected_color=_sc.entry_bg,
+			unselected_hover_color=_sc.entry_border,
+			text_color=_sc.text_primary,
+		)
+		self.alphabet_selector.grid(row=3, column=0, sticky="ew")
+
 		input_section = make_frame(self.container, fg_color="transparent")
 		input_section.grid(row=2, column=0, padx=32, pady=(0, 24), sticky="nsew")
 		input_section.columnconfigure(0, weight=1)
@@ -202,6 +237,17 @@ class TranslationSection:
 				self._mode_value_var.set(state.mode_label)
 			finally:
 				self._suppress_mode_callback = False
+		alphabet_label = next(
+			(label for label, name in self._label_to_alphabet.items() if name == state.alphabet),
+			None,
+		)
+		if self.alphabet_selector and alphabet_label is not None:
+			self._suppress_alphabet_callback = True
+			try:
+				self.alphabet_selector.set(alphabet_label)
+				self._alphabet_value_var.set(alphabet_label)
+			finally:
+				self._suppress_alphabet_callback = False
 		if self.input_label:
 			self.input_label.configure(text=state.input_label)
 		if self.output_label:
@@ -210,6 +256,7 @@ class TranslationSection:
 		if self.input_text is not None:
 			if state.input_text.strip():
 				self._set_input_text(state.input_text)
+				self._highlight_issues(state.issues)
 			else:
 				self._show_input_placeholder()
 
@@ -235,6 +282,18 @@ class TranslationSection:
 		if self.error_label is not None:
 			self.error_label.configure(text=message or "")
 
+	def _highlight_issues(self, issues: tuple[TranslationIssue, ...]) -> None:
+		if not self.input_text:
+			return
+		self.input_text.tag_remove(_ISSUE_TAG, "1.0", "end")
+		if not issues:
+			return
+		self.input_text.tag_config(_ISSUE_TAG, foreground=get_colors().error_text, underline=True)
+		for issue in issues:
+			self.input_text.tag_add(
+				_ISSUE_TAG, f"1.0 + {issue.offset} chars", f"1.0 + {issue.end} chars"
+			)
+
 	def _handle_mode_change(self, selected_label: str) -> None:
 		if self._suppress_mode_callback:
 			return
@@ -243,6 +302,14 @@ class TranslationSection:
 			return
 		self._on_select_mode(mode_key)
 
+	def _handle_alphabet_change(self, selected_label: str) -> None:
+		if self._suppress_alphabet_callback:
+			return
+		alphabet = self._label_to_alphabet.get(selected_label)
+		if alphabet is None:
+			return
+		self._on_select_alphabet(alphabet)
+
 	def _show_input_placeholder(self) -> None:
 		if not self.input_text:
 			return
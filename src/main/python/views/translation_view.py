@@ -7,6 +7,7 @@ import customtkinter as ctk
 from ..controllers.protocols import TranslationPresenterProtocol
 from ..controllers.translation_controller import TranslationState
 from ..navigator import Navigator
+from ..services.audio_playback import play_audio, stop_audio
 from .theme import get_colors, register_theme_callback
 from .widgets import (
 	make_button,
@@ -105,7 +106,7 @@ class TranslationView:
 	def show_menu(self) -> None:
 		"""Display the translation direction selector."""
 
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self.reset_ui()
 		self._clear_content()
 		colors = get_colors()
@@ -213,7 +214,7 @@ class TranslationView:
 		self.mode = state.mode
 		self.title_text = state.title
 		self._failure_count = 0
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 
 		if need_initial_build:
 			self._build_translation_ui(state)
@@ -515,13 +516,12 @@ class TranslationView:
 					self.hint_label.configure(text="Vihje on saadaval, kui soovid.")
 
 	def play_translation_audio(self) -> None:
-		audio_path = self.presenter.audio_path()
-		if not audio_path:
+		audio = self.presenter.audio()
+		if audio is None:
 			self._set_feedback("Sellele kirjele helifaili pole.", False)
 			return
 		try:
-			self.pygame.mixer.music.load(audio_path)
-			self.pygame.mixer.music.play()
+			play_audio(self.pygame, audio)
 			self._set_feedback("Helifail esitatakse.", True)
 		except self.pygame.error:
 			self._set_feedback("Helifaili ei õnnestunud esitada.", False)
@@ -539,7 +539,7 @@ class TranslationView:
 	def show_completion(self) -> None:
 		"""Display the completion message and reset sessions for a fresh run."""
 
-		self.pygame.mixer.music.stop()
+		stop_audio(self.pygame)
 		self._clear_content()
 		self.nav.reset_translation()
 		colors = get_colors()
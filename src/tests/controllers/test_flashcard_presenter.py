@@ -193,10 +193,10 @@ class TestFlashcardPresenterReset:
 class TestFlashcardState:
 	"""Tests for FlashcardState dataclass."""
 
-	def test_state_contains_audio_path(self, presenter, mock_sessions):
+	def test_state_contains_audio(self, presenter, mock_sessions):
 		presenter.start("letters")
 		state = presenter.current_state()
-		assert state.audio_path == "/audio/a.wav"
+		assert state.audio == "/audio/a.wav"
 
 	def test_show_audio_button_false_when_front(self, presenter, mock_sessions):
 		presenter.start("letters")
@@ -1,5 +1,6 @@
 """Tests for TranslationSandboxPresenter controller."""
 
+import wave
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,7 +10,15 @@ from src.main.python.controllers.translation_sandbox_controller import (
 	SandboxState,
 	TranslationSandboxPresenter,
 )
-from src.main.python.exceptions import InvalidModeError, NoAudioContentError
+from src.main.python.exceptions import (
+	AudioSaveError,
+	InvalidModeError,
+	NoAudioContentError,
+	UnknownAlphabetError,
+)
+from src.main.python.services.morse_audio import MorseAudio, synthesize_morse_pcm
+
+AUDIO = MorseAudio(frames=b"\x00\x00" * 441, sample_rate=44100)
 
 
 @pytest.fixture
@@ -129,6 +138,82 @@ class TestTranslationSandboxPresenterTranslate:
 		presenter.translate("HELLO")
 		assert presenter._input_text == "HELLO"
 
+	def test_translate_successive_edits_match_full_translation(self, presenter):
+		presenter.translate("TERE MAAILM")
+		state = presenter.translate("TERE UUS MAAILM")
+		assert state.output_text == "- . .-. .   ..- ..- ...   -- .- .- .. .-.. --"
+
+	def test_translate_reports_every_issue(self, presenter):
+		state = presenter.translate("A©B ñ")
+		assert [issue.offset for issue in state.issues] == [1, 4]
+		assert "Vigu kokku: 2" in state.error_message
+
+	def test_translate_suggests_nearest_characters(self, presenter):
+		presenter.set_mode("morse_to_text")
+		state = presenter.translate(".- .-..-")
+		assert state.error_message.endswith("Kas mõtlesid: L, Ä, V?")
+
+	def test_translate_without_nearby_code_has_no_suggestion(self, presenter):
+		presenter.set_mode("morse_to_text")
+		state = presenter.translate("-.-.-.-.-.")
+		assert "Kas mõtlesid" not in state.error_message
+
+	def test_translate_clears_issues_after_fix(self, presenter):
+		presenter.translate("A©B")
+		state = presenter.translate("AB")
+		assert state.issues == ()
+
+	def test_translate_recovers_after_error(self, presenter):
+		presenter.translate("TERE")
+		presenter.translate("TE©RE")
+		state = presenter.translate("TERE")
+		assert state.error_message is None
+		assert state.output_text == "- . .-. ."
+
+	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm")
+	def test_translate_renders_no_audio(self, mock_synth, presenter):
+		state = presenter.translate("TERE")
+		assert state.audio_ready
+		mock_synth.assert_not_called()
+
+	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm")
+	def test_translate_keeps_audio_when_morse_unchanged(self, mock_synth, presenter):
+		mock_synth.return_value = AUDIO
+		presenter.translate("A")
+		presenter.generate_audio()
+		presenter.translate("A ")
+		assert presenter._audio is AUDIO
+		presenter.translate("AB")
+		assert presenter._audio is None
+
+
+class TestTranslationSandboxPresenterAlphabet:
+	"""Tests for set_alphabet method."""
+
+	def test_default_alphabet(self, presenter):
+		assert presenter.current_state().alphabet == "estonian"
+
+	def test_set_alphabet_retranslates_input(self, presenter):
+		presenter.set_mode("morse_to_text")
+		presenter.translate(".-.-")
+		state = presenter.set_alphabet("cyrillic")
+		assert state.alphabet == "cyrillic"
+		assert state.output_text == "Я"
+
+	def test_set_alphabet_reports_unsupported_letters(self, presenter):
+		presenter.translate("ÄRA")
+		state = presenter.set_alphabet("itu")
+		assert state.issues[0].token == "Ä"
+
+	def test_set_alphabet_unknown_raises(self, presenter):
+		with pytest.raises(UnknownAlphabetError):
+			presenter.set_alphabet("klingon")
+
+	def test_mode_change_keeps_alphabet(self, presenter):
+		presenter.set_alphabet("cyrillic")
+		presenter.toggle_mode()
+		assert presenter.translate("-..").output_text == "Д"
+
 
 class TestTranslationSandboxPresenterGenerateAudio:
 	"""Tests for generate_audio method."""
@@ -137,16 +222,24 @@ class TestTranslationSandboxPresenterGenerateAudio:
 		with pytest.raises(NoAudioContentError):
 			presenter.generate_audio()
 
-	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_audio")
+	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm")
 	def test_generate_audio_with_content(self, mock_synth, presenter):
-		mock_synth.return_value = Path("/tmp/audio.wav")
+		mock_synth.return_value = AUDIO
 		presenter.translate("A")  # Creates morse content
 		state = presenter.generate_audio()
-		assert state.audio_ready or presenter._audio_path is not None
+		assert state.audio_ready
+		assert presenter._audio is AUDIO
+
+	def test_generate_audio_writes_no_files(self, presenter, tmp_path, monkeypatch):
+		monkeypatch.chdir(tmp_path)
+		monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+		presenter.translate("TERE")
+		assert presenter.generate_audio().audio_ready
+		assert list(tmp_path.iterdir()) == []
 
-	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_audio")
+	@patch("src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm")
 	def test_generate_audio_updates_settings(self, mock_synth, presenter):
-		mock_synth.return_value = Path("/tmp/audio.wav")
+		mock_synth.return_value = AUDIO
 		presenter.translate("A")
 		presenter.generate_audio(frequency=600.0, unit_duration_ms=80, volume=0.8)
 		assert presenter._audio_settings.frequency_hz == 600.0
@@ -154,14 +247,46 @@ class TestTranslationSandboxPresenterGenerateAudio:
 		assert presenter._audio_settings.volume == 0.8
 
 
+class TestTranslationSandboxPresenterStreamAudio:
+	"""Tests for stream_audio method."""
+
+	def test_stream_without_content_raises(self, presenter):
+		with pytest.raises(NoAudioContentError):
+			presenter.stream_audio()
+
+	def test_stream_matches_full_render(self, presenter):
+		presenter.translate("TERE")
+		frames = b"".join(chunk.frames for chunk in presenter.stream_audio())
+		presenter.generate_audio()
+		assert frames == presenter._audio.frames
+
+	def test_stream_uses_current_settings(self, presenter):
+		presenter.translate("E")
+		presenter.update_speed(50)
+		chunks = list(presenter.stream_audio())
+		assert sum(chunk.duration_seconds for chunk in chunks) == pytest.approx(0.05)
+
+	def test_stream_is_rendered_at_full_volume(self, presenter):
+		presenter.translate("E")
+		presenter.update_volume(0.3)
+		(chunk,) = presenter.stream_audio()
+		full = presenter._audio_settings.with_volume(1.0).as_synthesis_kwargs
+		assert chunk.frames == synthesize_morse_pcm(".", **full).frames
+		assert presenter.current_state().volume == 0.3
+
+	def test_stream_reuses_rendered_audio(self, presenter):
+		presenter.translate("A")
+		presenter._audio = AUDIO
+		assert list(presenter.stream_audio()) == [AUDIO]
+
+
 class TestTranslationSandboxPresenterClearAudio:
 	"""Tests for clear_audio method."""
 
-	def test_clear_audio_resets_path(self, presenter):
-		presenter._audio_path = Path("/tmp/audio.wav")
-		state = presenter.clear_audio()
-		assert presenter._audio_path is None
-		assert not state.audio_ready
+	def test_clear_audio_drops_audio(self, presenter):
+		presenter._audio = AUDIO
+		presenter.clear_audio()
+		assert presenter._audio is None
 
 
 class TestTranslationSandboxPresenterSaveAudio:
@@ -175,15 +300,53 @@ class TestTranslationSandboxPresenterSaveAudio:
 		with pytest.raises(NoAudioContentError):
 			presenter.save_audio_as(Path("/tmp/output.wav"))
 
-	@patch("shutil.copy2")
-	@patch.object(Path, "exists", return_value=True)
-	@patch.object(Path, "mkdir")
-	def test_save_audio_as_appends_wav_extension(
-		self, mock_mkdir, mock_exists, mock_copy, presenter
-	):
-		presenter._audio_path = Path("/tmp/audio.wav")
-		state, path = presenter.save_audio_as(Path("/tmp/output"))
-		assert path.suffix == ".wav"
+	def test_save_audio_as_appends_wav_extension(self, presenter, tmp_path):
+		presenter.translate("A")
+		_, path = presenter.save_audio_as(tmp_path / "output")
+		assert path == tmp_path / "output.wav"
+
+	def test_save_audio_as_writes_wav(self, presenter, tmp_path):
+		presenter.translate("A")
+		audio = synthesize_morse_pcm(".-", **presenter._audio_settings.as_synthesis_kwargs)
+		_, path = presenter.save_audio_as(tmp_path / "a.wav")
+		with wave.open(str(path), "rb") as wav_file:
+			assert wav_file.getframerate() == audio.sample_rate
+			assert wav_file.readframes(wav_file.getnframes()) == audio.frames
+
+	def test_save_audio_to_output_numbers_files(self, presenter, tmp_path, monkeypatch):
+		monkeypatch.chdir(tmp_path)
+		(tmp_path / "output").mkdir()
+		(tmp_path / "output" / "tõlge2.wav").touch()
+		presenter.translate("A")
+		_, path = presenter.save_audio_to_output()
+		assert path == tmp_path / "output" / "tõlge3.wav"
+		assert path.stat().st_size > 0
+
+	def test_save_bakes_volume_into_file(self, presenter, tmp_path):
+		presenter.translate("A")
+		presenter.generate_audio()
+		presenter.update_volume(0.25)
+		_, path = presenter.save_audio_as(tmp_path / "a.wav")
+		quiet = synthesize_morse_pcm(".-", **presenter._audio_settings.as_synthesis_kwargs)
+		with wave.open(str(path), "rb") as wav_file:
+			assert wav_file.readframes(wav_file.getnframes()) == quiet.frames
+
+	def test_save_at_full_volume_reuses_render(self, presenter, tmp_path):
+		presenter.translate("A")
+		presenter.update_volume(1.0)
+		presenter.generate_audio()
+		with patch(
+			"src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm"
+		) as mock_synth:
+			_, path = presenter.save_audio_as(tmp_path / "a.wav")
+		mock_synth.assert_not_called()
+		assert path.read_bytes() == presenter._audio.to_wav_bytes()
+
+	def test_save_failure_raises_typed_error(self, presenter, tmp_path):
+		presenter.translate("A")
+		(tmp_path / "taken.wav").mkdir()
+		with pytest.raises(AudioSaveError):
+			presenter.save_audio_as(tmp_path / "taken.wav")
 
 
 class TestTranslationSandboxPresenterUpdateSettings:
@@ -193,6 +356,23 @@ class TestTranslationSandboxPresenterUpdateSettings:
 		state = presenter.update_volume(0.75)
 		assert state.volume == 0.75
 
+	def test_update_volume_keeps_rendered_audio(self, presenter):
+		presenter.translate("A")
+		presenter.generate_audio()
+		audio = presenter._audio
+		with patch(
+			"src.main.python.controllers.translation_sandbox_controller.synthesize_morse_pcm"
+		) as mock_synth:
+			presenter.update_volume(0.2)
+			assert list(presenter.stream_audio()) == [audio]
+		mock_synth.assert_not_called()
+
+	def test_update_speed_discards_rendered_audio(self, presenter):
+		presenter.translate("A")
+		presenter.generate_audio()
+		presenter.update_speed(100)
+		assert presenter._audio is None
+
 	def test_update_volume_clamps(self, presenter):
 		state = presenter.update_volume(1.5)  # Over max
 		assert state.volume == 1.0
@@ -219,7 +399,6 @@ class TestSandboxState:
 			output_text="",
 			error_message=None,
 			audio_ready=False,
-			audio_path=None,
 			volume=0.5,
 			speed_ms=60,
 			pitch_hz=400.0,
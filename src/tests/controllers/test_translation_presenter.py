@@ -10,6 +10,8 @@ from src.main.python.controllers.translation_controller import (
 )
 from src.main.python.exceptions import SessionNotInitializedError
 from src.main.python.model.translation_session import TranslationSession
+from src.main.python.services.audio_cache import AudioCache
+from src.main.python.services.morse_audio import MorseAudio
 
 
 @pytest.fixture
@@ -178,20 +180,24 @@ class TestTranslationPresenterCheckAnswer:
 			presenter.check_answer("test")
 
 
-class TestTranslationPresenterAudioPath:
-	"""Tests for audio_path method."""
+class TestTranslationPresenterAudio:
+	"""Tests for audio method."""
 
-	def test_audio_path_returns_path(self, presenter, mock_morse_session):
+	def test_audio_without_cache_returns_none(self, presenter):
 		presenter.start("morse_to_text")
-		mock_morse_session.current_prompt.return_value = "HELLO"
-		path = presenter.audio_path()
-		# Note: HELLO is in text mode, so key is "HELLO"
-		# But mock returns ".... . .-.. .-.. ---", so we need to check properly
-		# The audio_map has "HELLO" mapped
-		assert path is None or isinstance(path, str)
+		assert presenter.audio() is None
 
-	def test_audio_path_without_start_returns_none(self, presenter):
-		assert presenter.audio_path() is None
+	def test_audio_rendered_in_memory(self, mock_morse_session, mock_text_session):
+		presenter = TranslationPresenter(
+			mock_morse_session, mock_text_session, audio_cache=AudioCache()
+		)
+		mock_morse_session.current_prompt.return_value = ".... ."
+		state = presenter.start("morse_to_text")
+		assert isinstance(presenter.audio(), MorseAudio)
+		assert state.audio_available
+
+	def test_audio_without_start_returns_none(self, presenter):
+		assert presenter.audio() is None
 
 
 class TestTranslationPresenterTitleForMode:
@@ -232,7 +238,7 @@ class TestTranslationState:
 			progress_step=50.0,
 			is_first=True,
 			is_last=False,
-			audio_path=None,
+			audio=None,
 			progress_text="0.0% läbitud",
 			has_previous=False,
 			next_label="Järgmine",
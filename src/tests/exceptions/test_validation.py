@@ -6,8 +6,10 @@ import pytest
 
 from src.main.python.exceptions.base import ErrorCode, MorseTrainerError
 from src.main.python.exceptions.validation import (
+	InvalidManifestError,
 	InvalidModeError,
 	MismatchedDataError,
+	UnknownAlphabetError,
 	ValidationError,
 )
 
@@ -82,3 +84,37 @@ class TestMismatchedDataError:
 	def test_can_be_raised_and_caught_as_validation_error(self) -> None:
 		with pytest.raises(ValidationError):
 			raise MismatchedDataError()
+
+
+class TestUnknownAlphabetError:
+	def test_stores_alphabet(self) -> None:
+		err = UnknownAlphabetError("klingon")
+		assert err.alphabet == "klingon"
+
+	def test_code(self) -> None:
+		err = UnknownAlphabetError("klingon")
+		assert err.code is ErrorCode.INVALID_CONFIGURATION
+
+	def test_user_message_names_alphabet(self) -> None:
+		err = UnknownAlphabetError("klingon")
+		assert "klingon" in err.user_message
+
+	def test_is_validation_error(self) -> None:
+		assert isinstance(UnknownAlphabetError("klingon"), ValidationError)
+
+
+class TestInvalidManifestError:
+	def test_stores_reason_and_row(self) -> None:
+		err = InvalidManifestError("missing text", row=3)
+		assert (err.reason, err.row) == ("missing text", 3)
+
+	def test_message_names_row(self) -> None:
+		err = InvalidManifestError("missing text", row=3)
+		assert "row 3" in str(err)
+		assert "rida 3" in err.user_message
+
+	def test_row_is_optional(self) -> None:
+		assert "row" not in str(InvalidManifestError("not a list"))
+
+	def test_is_validation_error(self) -> None:
+		assert isinstance(InvalidManifestError("x"), ValidationError)
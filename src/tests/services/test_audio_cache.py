@@ -2,36 +2,46 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from unittest.mock import patch
 
 from src.main.python.services.audio_cache import AudioCache
+from src.main.python.services.audio_settings import AudioSettings
+from src.main.python.services.morse_audio import MorseAudio, synthesize_morse_pcm
 
 
 class TestAudioCacheResolve:
 	"""Tests for resolve() — dynamic synthesis."""
 
-	def test_resolve_returns_path_string(self):
+	def test_resolve_returns_audio(self):
 		cache = AudioCache()
 		result = cache.resolve(".-", "A")
-		assert isinstance(result, str)
-		assert result.endswith(".wav")
-		Path(result).unlink(missing_ok=True)
+		assert isinstance(result, MorseAudio)
+		assert result == synthesize_morse_pcm(".-")
+
+	def test_resolve_uses_settings(self):
+		settings = (
+			AudioSettings(unit_duration_ms=90).with_sample_rate(8000).with_sample_format("u8")
+		)
+		result = AudioCache(settings=settings).resolve(".-", "A")
+		assert result == synthesize_morse_pcm(".-", **settings.as_synthesis_kwargs)
+		assert (result.sample_rate, result.sample_width) == (8000, 1)
+
+	def test_resolve_writes_no_files(self, tmp_path, monkeypatch):
+		monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+		AudioCache().resolve(".-", "A")
+		assert list(tmp_path.iterdir()) == []
 
 	def test_resolve_caches_result(self):
 		cache = AudioCache()
 		first = cache.resolve(".-", "A")
 		second = cache.resolve(".-", "A")
-		assert first == second
-		Path(first).unlink(missing_ok=True)
+		assert first is second
 
-	def test_resolve_different_keys_produce_different_files(self):
+	def test_resolve_different_keys_produce_different_audio(self):
 		cache = AudioCache()
 		a = cache.resolve(".-", "A")
 		b = cache.resolve("-...", "B")
 		assert a != b
-		Path(a).unlink(missing_ok=True)
-		Path(b).unlink(missing_ok=True)
 
 	def test_resolve_returns_none_on_error(self):
 		cache = AudioCache()
@@ -43,6 +53,19 @@ class TestAudioCacheResolve:
 		result = cache.resolve("XYZ", "bad")
 		assert result is None
 
+	def test_resolve_multi_line_morse(self):
+		cache = AudioCache()
+		assert cache.resolve(".-\n-...", "multi-line") is not None
+
+	def test_least_recently_used_entry_evicted(self):
+		cache = AudioCache(max_entries=2)
+		first = cache.resolve(".-", "A")
+		cache.resolve("-...", "B")
+		cache.resolve(".-", "A")
+		cache.resolve("-.-.", "C")
+		assert list(cache._cache) == ["A", "C"]
+		assert cache.resolve(".-", "A") is first
+
 
 class TestAudioCacheResolveWithFallback:
 	"""Tests for resolve_with_fallback() — dynamic then static."""
@@ -51,9 +74,7 @@ class TestAudioCacheResolveWithFallback:
 		static = {"A": "/static/A.wav"}
 		cache = AudioCache(static_map=static)
 		result = cache.resolve_with_fallback(".-", "A")
-		assert result is not None
-		assert result != "/static/A.wav"
-		Path(result).unlink(missing_ok=True)
+		assert isinstance(result, MorseAudio)
 
 	def test_fallback_uses_static_on_synthesis_failure(self):
 		static = {"empty": "/static/empty.wav"}
@@ -69,15 +90,7 @@ class TestAudioCacheResolveWithFallback:
 
 
 class TestAudioCacheCleanup:
-	"""Tests for cleanup() — temp file deletion."""
-
-	def test_cleanup_deletes_cached_files(self):
-		cache = AudioCache()
-		path_str = cache.resolve(".-", "A")
-		assert path_str is not None
-		assert Path(path_str).exists()
-		cache.cleanup()
-		assert not Path(path_str).exists()
+	"""Tests for cleanup()."""
 
 	def test_cleanup_clears_cache_dict(self):
 		cache = AudioCache()
@@ -89,12 +102,6 @@ class TestAudioCacheCleanup:
 		cache = AudioCache()
 		cache.cleanup()  # should not raise
 
-	def test_cleanup_tolerates_already_deleted_files(self):
-		cache = AudioCache()
-		path_str = cache.resolve(".-", "A")
-		Path(path_str).unlink()
-		cache.cleanup()  # should not raise
-
 
 class TestAudioCacheInit:
 	"""Tests for AudioCache construction."""
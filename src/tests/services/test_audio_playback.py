@@ -0,0 +1,230 @@
+"""Tests for buffer-based audio playback."""
+
+from __future__ import annotations
+
+import io
+import wave
+from array import array
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.main.python.services import audio_playback
+from src.main.python.services.audio_playback import (
+	audio_busy,
+	make_sound,
+	play_audio,
+	pump_audio,
+	set_volume,
+	stop_audio,
+	stream_audio,
+)
+from src.main.python.services.morse_audio import MorseAudio
+
+AUDIO = MorseAudio(frames=array("h", [1, -2, 3]).tobytes(), sample_rate=44100)
+
+
+class FakeChannel:
+	"""Holds one playing and one queued sound, like a mixer channel."""
+
+	def __init__(self):
+		self.playing = None
+		self.queued = None
+		self.played = []
+
+	def play(self, sound):
+		self.playing = sound
+		self.played.append(sound)
+
+	def queue(self, sound):
+		if self.playing is None:
+			self.play(sound)
+		else:
+			self.queued = sound
+
+	def get_queue(self):
+		return self.queued
+
+	def get_busy(self):
+		return self.playing is not None
+
+	def finish(self):
+		"""End the playing sound; the queued one starts."""
+		queued, self.playing, self.queued = self.queued, None, None
+		if queued is not None:
+			self.play(queued)
+
+	def stop(self):
+		self.playing = self.queued = None
+
+
+@pytest.fixture
+def pygame_module():
+	module = MagicMock()
+	module.error = RuntimeError
+	module.mixer.get_init.return_value = (44100, -16, 1)
+	module.mixer.music.get_busy.return_value = False
+	module.mixer.get_busy.return_value = False
+	yield module
+	audio_playback._playing.clear()
+
+
+class TestMakeSound:
+	"""Tests for make_sound()."""
+
+	def test_matching_mixer_gets_buffer(self, pygame_module):
+		make_sound(pygame_module, AUDIO)
+		pygame_module.mixer.Sound.assert_called_once_with(buffer=AUDIO.frames)
+
+	def test_mono_spread_across_stereo_mixer(self, pygame_module):
+		pygame_module.mixer.get_init.return_value = (44100, -16, 2)
+		make_sound(pygame_module, AUDIO)
+		buffer = pygame_module.mixer.Sound.call_args.kwargs["buffer"]
+		assert list(array("h", buffer)) == [1, 1, -2, -2, 3, 3]
+
+	def test_other_rate_falls_back_to_wav(self, pygame_module):
+		pygame_module.mixer.get_init.return_value = (22050, -16, 2)
+		make_sound(pygame_module, AUDIO)
+		handle = pygame_module.mixer.Sound.call_args.kwargs["file"]
+		assert isinstance(handle, io.BytesIO)
+		with wave.open(handle, "rb") as wav:
+			assert wav.getframerate() == 44100
+			assert wav.readframes(wav.getnframes()) == AUDIO.frames
+
+	def test_eight_bit_audio_falls_back_to_wav(self, pygame_module):
+		audio = MorseAudio(frames=bytes([128, 200, 56]), sample_rate=44100, sample_format="u8")
+		make_sound(pygame_module, audio)
+		handle = pygame_module.mixer.Sound.call_args.kwargs["file"]
+		with wave.open(handle, "rb") as wav:
+			assert wav.getsampwidth() == 1
+			assert wav.readframes(wav.getnframes()) == audio.frames
+
+	def test_uninitialised_mixer_raises(self, pygame_module):
+		pygame_module.mixer.get_init.return_value = None
+		with pytest.raises(RuntimeError):
+			make_sound(pygame_module, AUDIO)
+
+
+class TestPlayback:
+	"""Tests for play_audio(), stop_audio() and audio_busy()."""
+
+	def test_play_keeps_sound_referenced(self, pygame_module):
+		play_audio(pygame_module, AUDIO)
+		sound = pygame_module.mixer.Sound.return_value
+		sound.play.assert_called_once_with()
+		assert audio_playback._playing == [sound]
+		pygame_module.mixer.music.load.assert_not_called()
+
+	def test_play_applies_volume_to_sound(self, pygame_module):
+		play_audio(pygame_module, AUDIO, volume=0.3)
+		pygame_module.mixer.Sound.return_value.set_volume.assert_called_once_with(0.3)
+
+	def test_play_file_applies_volume_to_music(self, pygame_module, tmp_path):
+		play_audio(pygame_module, tmp_path / "a.wav", volume=0.3)
+		pygame_module.mixer.music.set_volume.assert_called_once_with(0.3)
+
+	def test_set_volume_changes_playing_sound(self, pygame_module):
+		play_audio(pygame_module, AUDIO, volume=0.3)
+		set_volume(pygame_module, 0.8)
+		pygame_module.mixer.Sound.return_value.set_volume.assert_called_with(0.8)
+		pygame_module.mixer.music.set_volume.assert_called_with(0.8)
+
+	def test_play_file_streams_music(self, pygame_module, tmp_path):
+		path = tmp_path / "a.wav"
+		play_audio(pygame_module, path)
+		pygame_module.mixer.music.load.assert_called_once_with(str(path))
+		pygame_module.mixer.music.play.assert_called_once_with()
+		pygame_module.mixer.Sound.assert_not_called()
+
+	def test_stop_releases_sounds(self, pygame_module):
+		play_audio(pygame_module, AUDIO)
+		stop_audio(pygame_module)
+		pygame_module.mixer.stop.assert_called()
+		pygame_module.mixer.music.stop.assert_called()
+		assert audio_playback._playing == []
+
+	def test_busy_reflects_either_channel(self, pygame_module):
+		assert not audio_busy(pygame_module)
+		pygame_module.mixer.get_busy.return_value = True
+		assert audio_busy(pygame_module)
+
+
+class TestStreaming:
+	"""Tests for stream_audio() and pump_audio()."""
+
+	@pytest.fixture
+	def channel(self, pygame_module):
+		channel = FakeChannel()
+
+		def sound(buffer):
+			played = MagicMock(buffer=buffer)
+			played.play.side_effect = lambda: channel.play(played) or channel
+			return played
+
+		pygame_module.mixer.Sound.side_effect = sound
+		return channel
+
+	@staticmethod
+	def chunks(count, pulled):
+		for index in range(count):
+			pulled.append(index)
+			yield MorseAudio(frames=bytes([index, 0]), sample_rate=44100)
+
+	def test_first_chunk_plays_and_second_is_queued(self, pygame_module, channel):
+		pulled = []
+		stream_audio(pygame_module, self.chunks(10, pulled))
+		assert channel.playing.buffer == bytes([0, 0])
+		assert channel.queued.buffer == bytes([1, 0])
+		assert pulled == [0, 1]
+
+	def test_pump_queues_one_chunk_at_a_time(self, pygame_module, channel):
+		pulled = []
+		stream_audio(pygame_module, self.chunks(10, pulled))
+		assert pump_audio(pygame_module)
+		assert pulled == [0, 1]
+		channel.finish()
+		assert pump_audio(pygame_module)
+		assert pulled == [0, 1, 2]
+		assert channel.queued.buffer == bytes([2, 0])
+
+	def test_stream_plays_every_chunk_in_order(self, pygame_module, channel):
+		stream_audio(pygame_module, self.chunks(5, []))
+		while pump_audio(pygame_module):
+			channel.finish()
+		assert [sound.buffer[0] for sound in channel.played] == [0, 1, 2, 3, 4]
+
+	def test_pump_restarts_a_channel_that_ran_dry(self, pygame_module, channel):
+		stream_audio(pygame_module, self.chunks(5, []))
+		channel.finish()
+		channel.finish()
+		assert pump_audio(pygame_module)
+		assert channel.playing.buffer == bytes([2, 0])
+
+	def test_chunks_play_at_stream_volume(self, pygame_module, channel):
+		stream_audio(pygame_module, self.chunks(5, []), volume=0.4)
+		channel.finish()
+		pump_audio(pygame_module)
+		for sound in channel.played + [channel.queued]:
+			sound.set_volume.assert_called_once_with(0.4)
+
+	def test_set_volume_reaches_queued_and_later_chunks(self, pygame_module, channel):
+		stream_audio(pygame_module, self.chunks(5, []), volume=0.4)
+		set_volume(pygame_module, 0.9)
+		channel.playing.set_volume.assert_called_with(0.9)
+		channel.queued.set_volume.assert_called_with(0.9)
+		channel.finish()
+		pump_audio(pygame_module)
+		channel.queued.set_volume.assert_called_once_with(0.9)
+
+	def test_stop_ends_stream(self, pygame_module, channel):
+		pulled = []
+		stream_audio(pygame_module, self.chunks(10, pulled))
+		stop_audio(pygame_module)
+		assert not channel.get_busy()
+		assert not pump_audio(pygame_module)
+		assert pulled == [0, 1]
+
+	def test_no_free_channel_raises(self, pygame_module):
+		pygame_module.mixer.Sound.return_value.play.return_value = None
+		with pytest.raises(RuntimeError):
+			stream_audio(pygame_module, [AUDIO])
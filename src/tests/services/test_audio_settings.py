@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.main.python.services.audio_settings import AudioSettings, _clamp
+from src.main.python.services.audio_settings import SAMPLE_RATES, AudioSettings, _clamp
 
 
 class TestAudioSettingsDefaults:
@@ -20,6 +20,10 @@ class TestAudioSettingsDefaults:
 		settings = AudioSettings()
 		assert settings.frequency_hz == 400.0
 
+	def test_default_output_format(self):
+		settings = AudioSettings()
+		assert (settings.sample_rate, settings.sample_format) == (44100, "s16")
+
 
 class TestAudioSettingsWithVolume:
 	"""Tests for with_volume method."""
@@ -138,3 +142,36 @@ class TestClampFunction:
 
 	def test_clamp_above_upper_bound(self):
 		assert _clamp(15.0, 0.0, 10.0) == 10.0
+
+
+class TestAudioSettingsOutputFormat:
+	"""Tests for with_sample_rate and with_sample_format methods."""
+
+	@pytest.mark.parametrize("sample_rate", SAMPLE_RATES)
+	def test_with_sample_rate_sets_value(self, sample_rate):
+		assert AudioSettings().with_sample_rate(sample_rate).sample_rate == sample_rate
+
+	def test_with_sample_rate_rejects_other_rates(self):
+		with pytest.raises(ValueError):
+			AudioSettings().with_sample_rate(48000)
+
+	@pytest.mark.parametrize("sample_format", ["u8", "s16", "mulaw"])
+	def test_with_sample_format_sets_value(self, sample_format):
+		assert AudioSettings().with_sample_format(sample_format).sample_format == sample_format
+
+	def test_with_sample_format_rejects_unknown(self):
+		with pytest.raises(ValueError):
+			AudioSettings().with_sample_format("f32")
+
+	def test_preserves_other_fields(self):
+		settings = AudioSettings(volume=0.7, unit_duration_ms=90, frequency_hz=500.0)
+		new_settings = settings.with_sample_rate(8000).with_sample_format("mulaw")
+		assert (new_settings.volume, new_settings.unit_duration_ms) == (0.7, 90)
+		assert new_settings.frequency_hz == 500.0
+		assert new_settings.with_volume(0.2).sample_rate == 8000
+
+	def test_synthesis_kwargs_include_output_format(self):
+		kwargs = (
+			AudioSettings().with_sample_rate(16000).with_sample_format("u8").as_synthesis_kwargs
+		)
+		assert (kwargs["sample_rate"], kwargs["sample_format"]) == (16000, "u8")
@@ -0,0 +1,242 @@
+"""Tests for parallel batch audio export."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import wave
+from unittest.mock import patch
+
+import pytest
+
+from src.main.python.exceptions import InvalidManifestError
+from src.main.python.services import batch_export
+from src.main.python.services.audio_settings import AudioSettings
+from src.main.python.services.batch_export import (
+	JOURNAL_NAME,
+	ExportItem,
+	content_digest,
+	default_name,
+	export_batch,
+	load_manifest,
+	read_journal,
+)
+from src.main.python.services.morse_audio import synthesize_morse_pcm, write_morse_wav
+
+
+def write_csv(path, text):
+	path.write_text(text, encoding="utf-8")
+	return path
+
+
+class TestLoadManifest:
+	"""Tests for load_manifest()."""
+
+	def test_csv_text_and_morse(self, tmp_path):
+		manifest = write_csv(
+			tmp_path / "m.csv",
+			"text,morse,name,unit_duration_ms\nTere,,tere,80\n,... --- ...,,\n",
+		)
+		first, second = load_manifest(manifest)
+		assert first == ExportItem("tere.wav", "- . .-. .", AudioSettings(unit_duration_ms=80))
+		assert second.morse == "... --- ..."
+		assert second.name == default_name("... --- ...", AudioSettings())
+
+	def test_json_list(self, tmp_path):
+		manifest = tmp_path / "m.json"
+		manifest.write_text(json.dumps([{"morse": ".-", "volume": 0.25}]), encoding="utf-8")
+		(item,) = load_manifest(manifest)
+		assert item.settings.volume == 0.25
+
+	def test_output_format_columns(self, tmp_path):
+		manifest = write_csv(tmp_path / "m.csv", "morse,sample_rate,sample_format\n.-,8000,mulaw\n")
+		settings = load_manifest(manifest)[0].settings
+		assert (settings.sample_rate, settings.sample_format) == (8000, "mulaw")
+
+	def test_settings_are_clamped_like_the_sliders(self, tmp_path):
+		manifest = write_csv(tmp_path / "m.csv", "morse,frequency_hz\n.-,5000\n")
+		assert load_manifest(manifest)[0].settings.frequency_hz == 800.0
+
+	@pytest.mark.parametrize(
+		"rows, row",
+		[
+			("text,morse\n,\n", 1),
+			("text,morse\nA,.-\n", 1),
+			("text\nA\n©\n", 2),
+			("morse\n.-\n.x\n", 2),
+			("morse,volume\n.-,loud\n", 1),
+			("morse,name\n.-,../escape\n", 1),
+			("morse,sample_rate\n.-,12345\n", 1),
+			("morse,sample_format\n.-\n.-,s24\n", 2),
+		],
+	)
+	def test_bad_rows_name_their_number(self, tmp_path, rows, row):
+		with pytest.raises(InvalidManifestError) as caught:
+			load_manifest(write_csv(tmp_path / "m.csv", rows))
+		assert caught.value.row == row
+
+	def test_name_reused_for_other_audio_rejected(self, tmp_path):
+		manifest = write_csv(tmp_path / "m.csv", "text,name\nTere,a\nHead aega,a\n")
+		with pytest.raises(InvalidManifestError) as caught:
+			load_manifest(manifest)
+		assert caught.value.row == 2
+
+	def test_name_reused_for_same_audio_allowed(self, tmp_path):
+		manifest = write_csv(tmp_path / "m.csv", "text,morse,name\nE,,e\n,.,e.wav\n")
+		first, second = load_manifest(manifest)
+		assert first == second
+
+	def test_json_must_be_list(self, tmp_path):
+		manifest = tmp_path / "m.json"
+		manifest.write_text('{"morse": ".-"}', encoding="utf-8")
+		with pytest.raises(InvalidManifestError):
+			load_manifest(manifest)
+
+	def test_missing_file(self, tmp_path):
+		with pytest.raises(InvalidManifestError):
+			load_manifest(tmp_path / "missing.csv")
+
+
+class TestDefaultName:
+	"""Tests for default_name()."""
+
+	def test_deterministic(self):
+		assert default_name(".-", AudioSettings()) == default_name(".-", AudioSettings())
+
+	def test_depends_on_settings(self):
+		assert default_name(".-", AudioSettings()) != default_name(".-", AudioSettings(volume=1.0))
+		assert default_name(".-", AudioSettings()) != default_name(
+			".-", AudioSettings(sample_format="u8")
+		)
+
+	def test_default_output_format_keeps_earlier_names(self):
+		key = f".-|{0.5!r}|60|{400.0!r}"
+		expected = f"morse_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.wav"
+		assert default_name(".-", AudioSettings()) == expected
+
+
+class TestReadJournal:
+	"""Tests for read_journal()."""
+
+	def test_missing_journal_is_empty(self, tmp_path):
+		assert read_journal(tmp_path / JOURNAL_NAME) == {}
+
+	def test_torn_last_line_ignored(self, tmp_path):
+		journal = tmp_path / JOURNAL_NAME
+		journal.write_text("a.wav\t1f\nb.wav\t2e\nc.wav\t3", encoding="utf-8")
+		assert read_journal(journal) == {"a.wav": "1f", "b.wav": "2e"}
+
+	def test_latest_entry_wins(self, tmp_path):
+		journal = tmp_path / JOURNAL_NAME
+		journal.write_text("a.wav\t1f\na.wav\t2e\n", encoding="utf-8")
+		assert read_journal(journal) == {"a.wav": "2e"}
+
+	def test_entry_without_digest(self, tmp_path):
+		journal = tmp_path / JOURNAL_NAME
+		journal.write_text("a.wav\n", encoding="utf-8")
+		assert read_journal(journal) == {"a.wav": ""}
+
+
+class TestExportBatch:
+	"""Tests for export_batch()."""
+
+	ITEMS = [
+		ExportItem("a.wav", ".-"),
+		ExportItem("b.wav", "-...", AudioSettings(unit_duration_ms=40)),
+		ExportItem("c.wav", "-.-."),
+	]
+
+	def test_writes_files_and_journal(self, tmp_path):
+		report = export_batch(self.ITEMS, tmp_path, workers=1)
+		assert (report.written, report.skipped, report.failed) == (3, 0, ())
+		assert read_journal(tmp_path / JOURNAL_NAME) == {
+			item.name: content_digest(item) for item in self.ITEMS
+		}
+		expected = synthesize_morse_pcm(
+			"-...", **AudioSettings(unit_duration_ms=40).as_synthesis_kwargs
+		)
+		with wave.open(str(tmp_path / "b.wav"), "rb") as wav_file:
+			assert wav_file.readframes(wav_file.getnframes()) == expected.frames
+
+	def test_leaves_no_temporary_files(self, tmp_path):
+		export_batch(self.ITEMS, tmp_path, workers=1)
+		assert sorted(path.name for path in tmp_path.iterdir()) == [
+			"a.wav",
+			"b.wav",
+			"c.wav",
+			JOURNAL_NAME,
+		]
+
+	def test_resume_skips_journaled_items(self, tmp_path):
+		export_batch(self.ITEMS[:2], tmp_path, workers=1)
+		with patch.object(batch_export, "write_morse_wav", wraps=write_morse_wav) as write:
+			report = export_batch(self.ITEMS, tmp_path, workers=1)
+		assert (report.written, report.skipped) == (1, 2)
+		assert write.call_count == 1
+
+	def test_journaled_but_missing_file_is_redone(self, tmp_path):
+		export_batch(self.ITEMS, tmp_path, workers=1)
+		(tmp_path / "a.wav").unlink()
+		report = export_batch(self.ITEMS, tmp_path, workers=1)
+		assert (report.written, report.skipped) == (1, 2)
+		assert (tmp_path / "a.wav").exists()
+
+	def test_changed_content_is_redone(self, tmp_path):
+		export_batch(self.ITEMS, tmp_path, workers=1)
+		changed = [ExportItem("a.wav", "--"), *self.ITEMS[1:]]
+		report = export_batch(changed, tmp_path, workers=1)
+		assert (report.written, report.skipped) == (1, 2)
+		expected = synthesize_morse_pcm("--", **AudioSettings().as_synthesis_kwargs)
+		with wave.open(str(tmp_path / "a.wav"), "rb") as wav_file:
+			assert wav_file.readframes(wav_file.getnframes()) == expected.frames
+		assert export_batch(changed, tmp_path, workers=1).skipped == 3
+
+	def test_entry_without_digest_is_redone(self, tmp_path):
+		export_batch(self.ITEMS, tmp_path, workers=1)
+		(tmp_path / JOURNAL_NAME).write_text("a.wav\nb.wav\nc.wav\n", encoding="utf-8")
+		assert export_batch(self.ITEMS, tmp_path, workers=1).written == 3
+
+	def test_name_reused_for_other_audio_fails(self, tmp_path):
+		items = [*self.ITEMS, ExportItem("a.wav", "--")]
+		report = export_batch(items, tmp_path, workers=1)
+		assert report.written == 3
+		assert [name for name, _ in report.failed] == ["a.wav"]
+
+	def test_duplicate_names_rendered_once(self, tmp_path):
+		report = export_batch(self.ITEMS + self.ITEMS, tmp_path, workers=1)
+		assert report.written == 3
+
+	def test_failure_reported_and_not_journaled(self, tmp_path):
+		(tmp_path / "b.wav").mkdir()
+		report = export_batch(self.ITEMS, tmp_path, workers=1)
+		assert report.written == 2
+		assert [name for name, _ in report.failed] == ["b.wav"]
+		assert "b.wav" not in read_journal(tmp_path / JOURNAL_NAME)
+
+	def test_progress_callback(self, tmp_path):
+		calls = []
+		export_batch(self.ITEMS, tmp_path, workers=1, on_progress=lambda *args: calls.append(args))
+		assert calls == [(1, 3), (2, 3), (3, 3)]
+
+	def test_process_pool_matches_serial(self, tmp_path):
+		serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+		export_batch(self.ITEMS, serial, workers=1)
+		report = export_batch(self.ITEMS, parallel, workers=2, chunksize=1)
+		assert report.written == 3
+		for item in self.ITEMS:
+			assert (parallel / item.name).read_bytes() == (serial / item.name).read_bytes()
+
+	def test_explicit_engine_renders_in_memory(self, tmp_path):
+		with patch.object(batch_export, "write_morse_wav") as write:
+			report = export_batch(self.ITEMS, tmp_path, workers=1, engine="python")
+		assert report.written == 3
+		write.assert_not_called()
+		with wave.open(str(tmp_path / "a.wav"), "rb") as wav_file:
+			frames = wav_file.readframes(wav_file.getnframes())
+		assert frames == synthesize_morse_pcm(".-", **AudioSettings().as_synthesis_kwargs).frames
+
+	def test_main_exports_manifest(self, tmp_path, capsys):
+		manifest = write_csv(tmp_path / "m.csv", "text,name\nSOS,sos\n")
+		batch_export.main([str(manifest), str(tmp_path / "out"), "--workers", "1"])
+		assert (tmp_path / "out" / "sos.wav").exists()
+		assert "1 written" in capsys.readouterr().out
@@ -1,56 +1,31 @@
 """Tests for morse_audio service."""
 
+import errno
+import os
+import struct
+import wave
+from array import array
 from pathlib import Path
 
 import pytest
 
 from src.main.python.exceptions import NoAudioContentError, UnsupportedMorseSymbolError
-from src.main.python.services.morse_audio import _parse_morse_sequence, synthesize_morse_audio
-
-
-class TestParseMorseSequence:
-	"""Tests for _parse_morse_sequence function."""
-
-	def test_empty_string_returns_empty(self):
-		result = list(_parse_morse_sequence(""))
-		assert result == []
-
-	def test_whitespace_only_returns_empty(self):
-		result = list(_parse_morse_sequence("   "))
-		assert result == []
-
-	def test_single_dot_returns_tone_1_unit(self):
-		result = list(_parse_morse_sequence("."))
-		assert result == [("tone", 1)]
-
-	def test_single_dash_returns_tone_3_units(self):
-		result = list(_parse_morse_sequence("-"))
-		assert result == [("tone", 3)]
-
-	def test_letter_a_returns_dot_gap_dash(self):
-		result = list(_parse_morse_sequence(".-"))
-		expected = [
-			("tone", 1),  # dot
-			("gap", 1),  # gap between symbols
-			("tone", 3),  # dash
-		]
-		assert result == expected
-
-	def test_two_letters_have_letter_gap(self):
-		# A B = .- -...
-		result = list(_parse_morse_sequence(".- -..."))
-		# Should have a gap of 3 units between letters
-		assert ("gap", 3) in result
-
-	def test_two_words_have_word_gap(self):
-		# "A A" with triple space word separator
-		result = list(_parse_morse_sequence(".-   .-"))
-		# Should have a gap of 7 units between words
-		assert ("gap", 7) in result
-
-	def test_invalid_symbol_raises(self):
-		with pytest.raises(UnsupportedMorseSymbolError):
-			list(_parse_morse_sequence(".-x"))
+from src.main.python.services import morse_audio
+from src.main.python.services.morse_audio import (
+	DEFAULT_ENGINE,
+	SAMPLE_FORMATS,
+	_chunked,
+	_encode_samples,
+	_run_templates,
+	available_engines,
+	morse_duration_seconds,
+	render_morse_samples,
+	stream_morse_pcm,
+	synthesize_morse_audio,
+	synthesize_morse_pcm,
+	write_morse_wav,
+)
+from src.main.python.utils import timing_plan
 
 
 class TestSynthesizeMorseAudio:
@@ -152,3 +127,346 @@ class TestSynthesizeMorseAudioTiming:
 		result = synthesize_morse_audio(".... . .-.. .-.. ---   .-- --- .-. .-.. -..")
 		assert result.exists()
 		result.unlink()
+
+
+class TestSynthesisEngines:
+	"""Tests for the interchangeable sample renderers."""
+
+	MORSE = ".- -...   -.-. \n ..."
+
+	def test_python_engine_always_available(self):
+		assert "python" in available_engines()
+		assert DEFAULT_ENGINE in available_engines()
+
+	def test_default_engine_needs_no_numpy(self):
+		assert DEFAULT_ENGINE == "template"
+
+	def test_sample_count_matches_timeline(self):
+		# ".-" is 1 + 1 + 3 units of 4410 samples at the defaults.
+		assert len(render_morse_samples(".-", engine="python")) == 2 * 5 * 4410
+
+	def test_tones_and_silences(self):
+		samples = array("h", render_morse_samples(".-", engine="python"))
+		assert any(samples[:4410])
+		assert not any(samples[4410:8820])
+
+	def test_unknown_engine_raises(self):
+		with pytest.raises(ValueError):
+			render_morse_samples(".-", engine="fortran")
+
+	def test_empty_morse_raises_for_every_engine(self):
+		for engine in available_engines():
+			with pytest.raises(NoAudioContentError):
+				render_morse_samples("  ", engine=engine)
+
+	@pytest.mark.parametrize("engine", ["template", "numpy"])
+	@pytest.mark.parametrize(
+		"settings",
+		[
+			{},
+			{"unit_duration_ms": 37, "sample_rate": 22050, "frequency": 733.3, "volume": 1.0},
+			{"volume": 0.0},
+		],
+	)
+	def test_engines_match_python(self, engine, settings):
+		if engine not in available_engines():
+			pytest.skip(f"{engine} engine not available")
+		assert render_morse_samples(self.MORSE, engine=engine, **settings) == (
+			render_morse_samples(self.MORSE, engine="python", **settings)
+		)
+
+	@pytest.mark.parametrize(
+		"settings",
+		[
+			{},
+			{"unit_duration_ms": 37, "sample_rate": 22050},
+			{"frequency": 612.5},
+			{"frequency": 733.3, "sample_rate": 22050},
+		],
+	)
+	def test_wavetable_matches_python_timeline(self, settings):
+		wavetable = render_morse_samples(self.MORSE, engine="wavetable", **settings)
+		python = render_morse_samples(self.MORSE, engine="python", **settings)
+		assert len(wavetable) == len(python)
+		# The first tone starts at phase zero in both, at the same pitch even
+		# when it is not a whole number of hertz.
+		first = len(render_morse_samples(".", **settings))
+		assert wavetable[:first] == python[:first]
+
+	def test_wavetable_is_phase_continuous(self):
+		# Dot, element gap, dot is a dash with its middle unit silenced.
+		dots = array("h", render_morse_samples("..", engine="wavetable"))
+		dash = array("h", render_morse_samples("-", engine="wavetable"))
+		unit = len(dash) // 3
+		assert dots[:unit] == dash[:unit]
+		assert not any(dots[unit : 2 * unit])
+		assert dots[2 * unit :] == dash[2 * unit :]
+
+	def test_wavetable_silences_at_zero_volume(self):
+		assert not any(render_morse_samples(self.MORSE, engine="wavetable", volume=0.0))
+
+	def test_templates_built_once_per_setting(self):
+		_run_templates.cache_clear()
+		render_morse_samples(".-", engine="template")
+		render_morse_samples("-.-.   ...", engine="template")
+		render_morse_samples(".-", engine="template", frequency=700.0)
+		info = _run_templates.cache_info()
+		assert (info.misses, info.hits) == (2, 1)
+
+	def test_synthesize_uses_requested_engine(self):
+		path = synthesize_morse_audio(".-", engine="python")
+		try:
+			with wave.open(str(path), "rb") as wav_file:
+				assert wav_file.readframes(wav_file.getnframes()) == render_morse_samples(
+					".-", engine="python"
+				)
+		finally:
+			path.unlink()
+
+
+class TestMorseDurationSeconds:
+	"""Tests for estimating durations from the timing plan."""
+
+	@pytest.mark.parametrize(
+		"settings", [{}, {"unit_duration_ms": 37, "sample_rate": 22050}, {"sample_rate": 8000}]
+	)
+	def test_matches_rendered_length(self, settings):
+		morse = ".- -...   -.-. \n ..."
+		frames = len(render_morse_samples(morse, **settings)) // 2
+		rate = settings.get("sample_rate", 44100)
+		assert morse_duration_seconds(morse, **settings) == frames / rate
+
+	def test_paris_at_twenty_wpm(self):
+		assert morse_duration_seconds(".--. .- .-. .. ...", unit_duration_ms=60) == (
+			pytest.approx(43 * 0.06)
+		)
+
+
+def _recording(function, calls):
+	def wrapper(*args):
+		calls.append(args)
+		return function(*args)
+
+	return wrapper
+
+
+class TestStreamMorsePcm:
+	"""Tests for chunked synthesis."""
+
+	MORSE = ".- -...   -.-. \n ..."
+
+	@pytest.mark.parametrize("chunk_frames", [1, 1000, 4410, 10**6])
+	def test_chunks_join_to_full_render(self, chunk_frames):
+		chunks = list(stream_morse_pcm(self.MORSE, chunk_frames=chunk_frames))
+		assert b"".join(chunk.frames for chunk in chunks) == render_morse_samples(self.MORSE)
+
+	def test_chunks_have_fixed_size(self):
+		chunks = list(stream_morse_pcm(self.MORSE, chunk_frames=1000, sample_rate=8000))
+		assert {chunk.frame_count for chunk in chunks[:-1]} == {1000}
+		assert 0 < chunks[-1].frame_count <= 1000
+		assert {chunk.sample_rate for chunk in chunks} == {8000}
+
+	def test_invalid_input_raises_before_iteration(self):
+		with pytest.raises(NoAudioContentError):
+			stream_morse_pcm("  ")
+		with pytest.raises(UnsupportedMorseSymbolError):
+			stream_morse_pcm(".x")
+		with pytest.raises(ValueError):
+			stream_morse_pcm(".-", chunk_frames=0)
+
+	def test_invalid_symbol_raises_when_reached(self):
+		chunks = stream_morse_pcm(".-   .x", chunk_frames=100)
+		assert next(chunks).frame_count == 100
+		with pytest.raises(UnsupportedMorseSymbolError):
+			list(chunks)
+
+	def test_chunked_input_matches_string(self):
+		pieces = [".", "- -..", ".  ", " -.-. ", "\n ..."]
+		chunks = stream_morse_pcm(iter(pieces))
+		assert b"".join(chunk.frames for chunk in chunks) == render_morse_samples("".join(pieces))
+
+	def test_first_chunk_reads_only_the_words_it_needs(self):
+		read = []
+
+		def endless_input():
+			while True:
+				read.append(".- -...   ")
+				yield read[-1]
+
+		chunks = stream_morse_pcm(endless_input(), chunk_frames=1000)
+		first = next(chunks)
+		assert first.frames == render_morse_samples("".join(read))[: len(first.frames)]
+		assert len(read) <= 2
+
+	def test_first_chunk_of_long_text_parses_one_word(self, monkeypatch):
+		words = []
+		monkeypatch.setattr(timing_plan, "_word_runs", _recording(timing_plan._word_runs, words))
+		chunks = stream_morse_pcm(".- -...   " * 200_000, chunk_frames=100)
+		next(chunks)
+		assert len(words) == 1
+
+	def test_renders_lazily(self):
+		pieces = iter([b"\x01\x00" * 3, b"\x02\x00" * 3])
+		chunks = _chunked(pieces, 4, 8000)
+		assert next(chunks).frames == b"\x01\x00" * 2
+		assert next(pieces) == b"\x02\x00" * 3
+
+
+class TestSampleFormats:
+	"""Tests for rendering at other sample rates and formats."""
+
+	@pytest.mark.parametrize("sample_format", sorted(SAMPLE_FORMATS))
+	@pytest.mark.parametrize("sample_rate", [8000, 22050, 44100])
+	def test_frame_count_matches_format(self, sample_rate, sample_format):
+		audio = synthesize_morse_pcm(".-", sample_rate=sample_rate, sample_format=sample_format)
+		reference = synthesize_morse_pcm(".-", sample_rate=sample_rate)
+		assert audio.sample_width == SAMPLE_FORMATS[sample_format]
+		assert audio.frame_count == reference.frame_count
+		assert len(audio.frames) == audio.frame_count * audio.sample_width
+
+	def test_u8_keeps_high_byte_offset_by_128(self):
+		samples = array("h", [-32768, -256, -1, 0, 255, 256, 32767]).tobytes()
+		assert list(_encode_samples(samples, "u8")) == [0, 127, 127, 128, 128, 129, 255]
+
+	def test_mulaw_reference_values(self):
+		samples = array("h", [0, -1, 32767, -32768, 1000, -1000]).tobytes()
+		assert list(_encode_samples(samples, "mulaw")) == [255, 126, 128, 0, 206, 78]
+
+	def test_silence_encodes_as_format_midpoint(self):
+		for sample_format, silence in (("u8", 128), ("mulaw", 255)):
+			audio = synthesize_morse_pcm(". .", sample_format=sample_format)
+			assert silence in audio.frames
+			assert set(render_morse_samples(". .", sample_format=sample_format)) > {silence}
+
+	def test_u8_wav_round_trips(self, tmp_path):
+		audio = synthesize_morse_pcm(".-", sample_rate=8000, sample_format="u8")
+		with wave.open(str(audio.write_wav(tmp_path / "a.wav")), "rb") as wav_file:
+			assert (wav_file.getsampwidth(), wav_file.getframerate()) == (1, 8000)
+			assert wav_file.readframes(wav_file.getnframes()) == audio.frames
+
+	def test_mulaw_wav_header(self):
+		audio = synthesize_morse_pcm(".", sample_rate=8000, sample_format="mulaw")
+		data = audio.to_wav_bytes()
+		riff, size, wave_tag = struct.unpack_from("<4sI4s", data)
+		assert (riff, wave_tag, size) == (b"RIFF", b"WAVE", len(data) - 8)
+		fmt = struct.unpack_from("<4sIHHIIHH", data, 12)
+		assert fmt == (b"fmt ", 18, 7, 1, 8000, 8000, 1, 8)
+		assert struct.unpack_from("<4sII", data, 38) == (b"fact", 4, audio.frame_count)
+		assert struct.unpack_from("<4sI", data, 50) == (b"data", len(audio.frames))
+		assert data[58 : 58 + len(audio.frames)] == audio.frames
+
+	def test_pcm_wav_stores_frames_verbatim(self):
+		audio = synthesize_morse_pcm(".-", sample_rate=8000)
+		data = audio.to_wav_bytes()
+		fmt = struct.unpack_from("<4sIHHIIHH", data, 12)
+		assert fmt == (b"fmt ", 16, 1, 1, 8000, 16000, 2, 16)
+		assert struct.unpack_from("<4sI", data, 36) == (b"data", len(audio.frames))
+		# Little-endian on every host; the wave module would swap them on big-endian ones.
+		assert data[44:] == audio.frames
+
+	def test_stream_chunks_in_format(self):
+		chunks = list(
+			stream_morse_pcm(".- -...", chunk_frames=500, sample_rate=16000, sample_format="u8")
+		)
+		assert {chunk.sample_format for chunk in chunks} == {"u8"}
+		assert {len(chunk.frames) for chunk in chunks[:-1]} == {500}
+		assert b"".join(chunk.frames for chunk in chunks) == render_morse_samples(
+			".- -...", sample_rate=16000, sample_format="u8"
+		)
+
+	def test_unknown_format_raises(self):
+		with pytest.raises(ValueError):
+			synthesize_morse_pcm(".-", sample_format="s24")
+		with pytest.raises(ValueError):
+			stream_morse_pcm(".-", sample_format="alaw")
+
+
+class TestWriteMorseWav:
+	"""Tests for rendering through a memory-mapped file."""
+
+	MORSE = ".- -...   -.-. \n ..."
+
+	# u8 at 22050 Hz with 77 ms units renders MORSE to an odd frame count,
+	# so the data chunk needs a pad byte.
+	@pytest.mark.parametrize(
+		"sample_format,sample_rate,unit_duration_ms",
+		[(sample_format, 8000, 70) for sample_format in sorted(SAMPLE_FORMATS)]
+		+ [("u8", 22050, 77)],
+	)
+	def test_file_matches_in_memory_render(
+		self, tmp_path, sample_format, sample_rate, unit_duration_ms
+	):
+		kwargs = {
+			"sample_rate": sample_rate,
+			"sample_format": sample_format,
+			"unit_duration_ms": unit_duration_ms,
+		}
+		path = write_morse_wav(self.MORSE, tmp_path / "a.wav", **kwargs)
+		audio = synthesize_morse_pcm(self.MORSE, **kwargs)
+		assert path.read_bytes() == audio.to_wav_bytes()
+		assert path.stat().st_size % 2 == 0
+
+	def test_odd_u8_data_is_padded(self, tmp_path):
+		kwargs = {"sample_rate": 22050, "sample_format": "u8", "unit_duration_ms": 31}
+		audio = synthesize_morse_pcm(".", **kwargs)
+		assert len(audio.frames) % 2 == 1
+		path = write_morse_wav(".", tmp_path / "a.wav", **kwargs)
+		with wave.open(str(path), "rb") as wav_file:
+			assert wav_file.readframes(wav_file.getnframes()) == audio.frames
+		assert path.stat().st_size % 2 == 0
+
+	def test_pages_released_while_rendering(self, tmp_path, monkeypatch):
+		monkeypatch.setattr(morse_audio, "_MAP_RELEASE_BYTES", 4096)
+		released = []
+		release = morse_audio._release_pages
+		monkeypatch.setattr(
+			morse_audio,
+			"_release_pages",
+			lambda mapped, start, end: released.append(start) or release(mapped, start, end),
+		)
+		path = write_morse_wav(self.MORSE * 20, tmp_path / "a.wav")
+		assert len(released) > 1
+		assert path.read_bytes() == synthesize_morse_pcm(self.MORSE * 20).to_wav_bytes()
+
+	@pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="needs posix_fallocate")
+	def test_file_is_allocated_not_sparse(self, tmp_path):
+		path = write_morse_wav(self.MORSE, tmp_path / "a.wav", unit_duration_ms=40)
+		assert path.stat().st_blocks * 512 >= path.stat().st_size
+
+	def test_full_disk_raises_before_mapping(self, tmp_path, monkeypatch):
+		def full(fd, offset, length):
+			raise OSError(errno.ENOSPC, "No space left on device")
+
+		monkeypatch.setattr(os, "posix_fallocate", full, raising=False)
+		monkeypatch.setattr(morse_audio.mmap, "mmap", None)
+		with pytest.raises(OSError) as caught:
+			write_morse_wav(self.MORSE, tmp_path / "a.wav")
+		assert caught.value.errno == errno.ENOSPC
+		assert list(tmp_path.iterdir()) == []
+
+	@pytest.mark.parametrize("code", [errno.EINVAL, errno.EOPNOTSUPP, None])
+	def test_falls_back_to_truncate(self, tmp_path, monkeypatch, code):
+		if code is None:
+			monkeypatch.delattr(os, "posix_fallocate", raising=False)
+		else:
+
+			def unsupported(fd, offset, length):
+				raise OSError(code, os.strerror(code))
+
+			monkeypatch.setattr(os, "posix_fallocate", unsupported, raising=False)
+		path = write_morse_wav(self.MORSE, tmp_path / "a.wav")
+		assert path.read_bytes() == synthesize_morse_pcm(self.MORSE).to_wav_bytes()
+
+	def test_invalid_input_leaves_no_file(self, tmp_path):
+		with pytest.raises(NoAudioContentError):
+			write_morse_wav("  ", tmp_path / "a.wav")
+		with pytest.raises(UnsupportedMorseSymbolError):
+			write_morse_wav(".x", tmp_path / "a.wav")
+		assert list(tmp_path.iterdir()) == []
+
+	def test_replaces_existing_file(self, tmp_path):
+		target = tmp_path / "a.wav"
+		target.write_bytes(b"old")
+		write_morse_wav(".-", target)
+		assert target.read_bytes() == synthesize_morse_pcm(".-").to_wav_bytes()
+		assert [path.name for path in tmp_path.iterdir()] == ["a.wav"]
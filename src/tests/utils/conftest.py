@@ -0,0 +1,14 @@
+"""Shared fixtures for utils tests."""
+
+import pytest
+
+from src.main.python.utils import alphabets
+from src.main.python.utils.alphabets import compile_alphabet
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+	"""Let a test register alphabets without leaking them into other tests."""
+	monkeypatch.setattr(alphabets, "_REGISTRY", dict(alphabets._REGISTRY))
+	yield
+	compile_alphabet.cache_clear()
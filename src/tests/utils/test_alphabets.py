@@ -0,0 +1,84 @@
+"""Tests for the lazily compiled alphabet registry."""
+
+import pytest
+
+from src.main.python.exceptions import UnknownAlphabetError, UnsupportedCharacterError
+from src.main.python.resources.morse_data import NUMBER_SYMBOL_MORSE_PAIRS
+from src.main.python.utils.alphabets import (
+	DEFAULT_ALPHABET,
+	Alphabet,
+	available_alphabets,
+	compile_alphabet,
+	get_alphabet,
+	register_alphabet,
+)
+from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+
+
+class TestRegistry:
+	"""Tests for registering and looking up alphabets."""
+
+	def test_built_in_alphabets(self):
+		names = [alphabet.name for alphabet in available_alphabets()]
+		assert names[:3] == ["estonian", "itu", "cyrillic"]
+
+	def test_default_is_estonian(self):
+		assert DEFAULT_ALPHABET == "estonian"
+
+	def test_unknown_alphabet_raises(self):
+		with pytest.raises(UnknownAlphabetError):
+			get_alphabet("klingon")
+
+	def test_register_custom_alphabet(self, isolated_registry):
+		register_alphabet(Alphabet("test-ae", "Test", (("a", ".-"), ("e", ".")), ()))
+		assert convert_text_to_morse("AE", alphabet="test-ae") == ".- ."
+		assert convert_morse_to_text(".- .", alphabet="test-ae") == "Ae"
+
+
+class TestCompileAlphabet:
+	"""Tests for the compiled lookup structures."""
+
+	def test_compiled_once_per_process(self):
+		assert compile_alphabet("itu") is compile_alphabet("itu")
+
+	def test_tables_are_read_only(self):
+		compiled = compile_alphabet()
+		with pytest.raises(TypeError):
+			compiled.encode_table["a"] = "-"  # type: ignore[index]
+
+	def test_encode_table_covers_both_cases(self):
+		table = compile_alphabet("cyrillic").encode_table
+		assert table["я"] == table["Я"] == ".-.- "
+
+	def test_codes_match_tree(self):
+		compiled = compile_alphabet("itu")
+		assert ".-" in compiled.codes
+		assert ".-.-" not in compiled.codes
+
+	def test_decode_lookups_cover_codes(self):
+		compiled = compile_alphabet("estonian")
+		assert (compiled.upper_lookup(".-.-"), compiled.lower_lookup(".-.-")) == ("Ä", "ä")
+		assert compiled.upper_lookup("..---") == compiled.lower_lookup("..---") == "2"
+		for code in compiled.codes:
+			assert compiled.lower_lookup(code)
+
+	def test_numbers_and_symbols_shared(self):
+		codes = compile_alphabet("cyrillic").codes
+		assert all(code in codes for _, code in NUMBER_SYMBOL_MORSE_PAIRS)
+
+
+class TestTranslationWithAlphabets:
+	"""Tests for translating through a non-default alphabet."""
+
+	def test_itu_rejects_estonian_letters(self):
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse("ÄRA", alphabet="itu")
+
+	def test_cyrillic_round_trip(self):
+		morse = convert_text_to_morse("ПРИВЕТ МИР", alphabet="cyrillic")
+		assert morse == ".--. .-. .. .-- . -   -- .. .-."
+		assert convert_morse_to_text(morse, alphabet="cyrillic") == "Привет Мир"
+
+	def test_shared_code_decodes_per_alphabet(self):
+		assert convert_morse_to_text(".-.-") == "Ä"
+		assert convert_morse_to_text(".-.-", alphabet="cyrillic") == "Я"
@@ -0,0 +1,95 @@
+"""Tests for the gap-stripped sound-alike index."""
+
+import pytest
+
+from src.main.python.utils.ambiguity_index import (
+	AmbiguityIndex,
+	build_ambiguity_index,
+	element_key,
+	write_ambiguity_index,
+)
+
+WORDS = ["at", "Em", "w", "eta", "aa", "ek", "tere", "kass", "ÄRA", "naïve", "two words", ""]
+
+
+@pytest.fixture
+def index(tmp_path):
+	path = tmp_path / "words.idx"
+	write_ambiguity_index(path, WORDS)
+	with AmbiguityIndex(path) as opened:
+		yield opened
+
+
+class TestElementKey:
+	"""Tests for gap-stripped keys."""
+
+	def test_letters_run_together(self):
+		assert element_key("et") == element_key("a") == ".-"
+
+	def test_case_insensitive(self):
+		assert element_key("Tere") == element_key("tere") == "-..-.."
+
+	def test_unsupported_word(self):
+		assert element_key("naïve") is None
+		assert element_key("") is None
+
+
+class TestBuildAmbiguityIndex:
+	"""Tests for the in-memory grouping pass."""
+
+	def test_groups_sorted(self):
+		groups = build_ambiguity_index(WORDS)
+		assert list(groups) == sorted(groups)
+		assert groups[".--"] == ["at", "em", "w"]
+
+	def test_skips_unencodable_and_multiword_entries(self):
+		words = {word for group in build_ambiguity_index(WORDS).values() for word in group}
+		assert "naïve" not in words
+		assert "two words" not in words
+
+	def test_streams_lines(self, tmp_path):
+		source = tmp_path / "words.txt"
+		source.write_text("at\nem\n\nat\n", encoding="utf-8")
+		with open(source, encoding="utf-8") as lines:
+			assert build_ambiguity_index(lines) == {".--": ["at", "em"]}
+
+
+class TestAmbiguityIndex:
+	"""Tests for the memory-mapped file."""
+
+	def test_lookup(self, index):
+		assert index.lookup(".--") == ("at", "em", "w")
+		assert index.lookup(".-.-.-.-") == ()
+
+	def test_lookup_every_key(self, tmp_path):
+		groups = build_ambiguity_index(WORDS)
+		path = tmp_path / "all.idx"
+		assert write_ambiguity_index(path, WORDS) == len(groups)
+		with AmbiguityIndex(path) as index:
+			assert len(index) == len(groups)
+			for key, words in groups.items():
+				assert index.lookup(key) == tuple(words)
+
+	def test_sound_alikes(self, index):
+		assert index.sound_alikes("AT") == ("em", "w")
+		assert index.sound_alikes("naïve") == ()
+
+	def test_groups(self, index):
+		assert dict(index.groups()) == {".--": ("at", "em", "w"), ".-.-": ("aa", "ek", "eta")}
+		assert len(list(index.groups(min_size=1))) == len(index)
+
+	def test_non_ascii_words(self, index):
+		assert "ära" in index.lookup(element_key("ära"))
+
+	def test_empty_index(self, tmp_path):
+		path = tmp_path / "empty.idx"
+		write_ambiguity_index(path, [])
+		with AmbiguityIndex(path) as index:
+			assert len(index) == 0
+			assert index.lookup(".-") == ()
+
+	def test_rejects_other_files(self, tmp_path):
+		path = tmp_path / "other.idx"
+		path.write_bytes(b"not an index at all")
+		with pytest.raises(ValueError):
+			AmbiguityIndex(path)
@@ -0,0 +1,133 @@
+"""Tests for diff-based incremental re-translation."""
+
+import random
+
+import pytest
+
+from src.main.python.exceptions import (
+	InvalidModeError,
+	TranslationError,
+	UnsupportedCharacterError,
+)
+from src.main.python.utils import incremental_translation
+from src.main.python.utils.incremental_translation import DiffTranslator
+from src.main.python.utils.morse_translator import (
+	convert_morse_to_text,
+	convert_text_to_morse,
+)
+from src.main.python.utils.morse_validation import (
+	ErrorPolicy,
+	TranslationIssue,
+	translate_checked,
+)
+
+_TEXT_ALPHABET = "ABCÄÖÜ 123.,? "
+_MORSE_ALPHABET = ".- "
+
+
+@pytest.fixture
+def dense_checkpoints(monkeypatch):
+	"""Record a checkpoint at nearly every word so edits exercise splicing."""
+	monkeypatch.setattr(incremental_translation, "_CHECKPOINT_SPACING", 2)
+
+
+def _edit(rng: random.Random, text: str, alphabet: str) -> str:
+	start = rng.randrange(len(text) + 1)
+	end = min(len(text), start + rng.randrange(4))
+	insert = "".join(rng.choice(alphabet) for _ in range(rng.randrange(4)))
+	return text[:start] + insert + text[end:]
+
+
+class TestDiffTranslatorTextToMorse:
+	"""Tests for incremental text → Morse translation."""
+
+	def test_first_call_translates_fully(self):
+		translator = DiffTranslator("text_to_morse")
+		assert translator.translate("SOS") == convert_text_to_morse("SOS")
+
+	def test_unchanged_input_returns_cached_output(self):
+		translator = DiffTranslator("text_to_morse")
+		first = translator.translate("TERE")
+		assert translator.translate("TERE") is first
+
+	def test_random_edits_match_full_translation(self, dense_checkpoints):
+		rng = random.Random(5)
+		translator = DiffTranslator("text_to_morse")
+		text = "TERE MAAILM"
+		for _ in range(300):
+			text = _edit(rng, text, _TEXT_ALPHABET) or "A"
+			if not text.strip():
+				text = "A" + text
+			assert translator.translate(text) == convert_text_to_morse(text)
+
+	def test_error_keeps_previous_cache(self):
+		translator = DiffTranslator("text_to_morse")
+		first = translator.translate("TERE")
+		with pytest.raises(UnsupportedCharacterError):
+			translator.translate("TE©RE")
+		assert translator.translate("TERE") is first
+
+	def test_replacement_collects_issues(self):
+		translator = DiffTranslator("text_to_morse", replacement="........")
+		text = "A©B#"
+		expected = translate_checked(text, mode="text_to_morse", policy=ErrorPolicy.REPLACE)
+		assert translator.translate(text) == expected.text
+		assert translator.issues == (TranslationIssue(1, "©"), TranslationIssue(3, "#"))
+
+	def test_random_edits_collect_issues(self, dense_checkpoints):
+		rng = random.Random(11)
+		translator = DiffTranslator("text_to_morse", replacement="")
+		text = "TERE MAAILM"
+		for _ in range(300):
+			text = _edit(rng, text, _TEXT_ALPHABET + "©#")
+			expected = translate_checked(text, mode="text_to_morse", policy=ErrorPolicy.SKIP)
+			assert translator.translate(text) == expected.text
+			assert translator.issues == expected.issues
+
+
+class TestDiffTranslatorMorseToText:
+	"""Tests for incremental Morse → text translation."""
+
+	def test_random_edits_match_full_translation(self, dense_checkpoints):
+		rng = random.Random(7)
+		translator = DiffTranslator("morse_to_text")
+		morse = convert_text_to_morse("TERE UUS MAAILM")
+		for _ in range(300):
+			candidate = _edit(rng, morse, _MORSE_ALPHABET)
+			try:
+				expected = convert_morse_to_text(candidate)
+			except TranslationError:
+				continue
+			morse = candidate
+			assert translator.translate(morse) == expected
+
+	def test_random_edits_collect_issues(self, dense_checkpoints):
+		rng = random.Random(13)
+		translator = DiffTranslator("morse_to_text", replacement="\ufffd")
+		morse = convert_text_to_morse("TERE UUS MAAILM")
+		for _ in range(300):
+			morse = _edit(rng, morse, _MORSE_ALPHABET)
+			expected = translate_checked(morse, mode="morse_to_text", policy=ErrorPolicy.REPLACE)
+			assert translator.translate(morse) == expected.text
+			assert translator.issues == expected.issues
+
+	def test_issues_after_an_edit_keep_their_place(self):
+		translator = DiffTranslator("morse_to_text", replacement="\ufffd")
+		translator.translate(".- ........ -...")
+		translator.translate("... .- ........ -...")
+		assert translator.issues == (TranslationIssue(7, "........"),)
+
+	def test_long_input_edit_matches_full_translation(self):
+		translator = DiffTranslator("morse_to_text")
+		morse = convert_text_to_morse("TERE MAAILM " * 200)
+		translator.translate(morse)
+		edited = morse[:1000] + "... " + morse[1000:]
+		assert translator.translate(edited) == convert_morse_to_text(edited)
+
+
+class TestDiffTranslatorMode:
+	"""Tests for mode validation."""
+
+	def test_invalid_mode_raises(self):
+		with pytest.raises(InvalidModeError):
+			DiffTranslator("sideways")
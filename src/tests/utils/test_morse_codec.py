@@ -0,0 +1,162 @@
+"""Tests for the registered ``morse`` text codec."""
+
+from __future__ import annotations
+
+import codecs
+import io
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
+from src.main.python.utils import morse_codec
+from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+
+
+@pytest.fixture(autouse=True)
+def _registered_codec():
+	morse_codec.register()
+
+
+class TestCodecLookup:
+	"""Tests for codec registration."""
+
+	def test_lookup_returns_codec_info(self):
+		info = codecs.lookup("morse")
+		assert info.name == "morse"
+		assert info.incrementalencoder is morse_codec.IncrementalEncoder
+		assert info.incrementaldecoder is morse_codec.IncrementalDecoder
+
+	def test_register_is_idempotent(self):
+		morse_codec.register()
+		assert codecs.lookup("morse").name == "morse"
+
+	def test_other_names_not_claimed(self):
+		with pytest.raises(LookupError):
+			codecs.lookup("morse-but-not-really")
+
+
+class TestStatelessCodec:
+	"""Tests for str.encode / bytes.decode."""
+
+	def test_encode_matches_translator(self):
+		assert "Tere maailm".encode("morse") == convert_text_to_morse("Tere maailm").encode()
+
+	def test_decode_matches_translator(self):
+		morse = ".... ..   -- --- --"
+		assert morse.encode().decode("morse") == convert_morse_to_text(morse)
+
+	def test_line_breaks_pass_through(self):
+		assert "A\nB".encode("morse") == b".-\n-..."
+		assert b".- -...\r\n-.-.".decode("morse") == "Ab\r\nC"
+
+	def test_unsupported_character_raises(self):
+		with pytest.raises(UnicodeEncodeError) as excinfo:
+			"A\n©B".encode("morse")
+		error = excinfo.value
+		assert (error.encoding, error.object, error.start, error.end) == ("morse", "A\n©B", 2, 3)
+		assert isinstance(error.__cause__, UnsupportedCharacterError)
+
+	def test_unsupported_symbol_raises(self):
+		with pytest.raises(UnicodeDecodeError) as excinfo:
+			b".- ..--.-. -".decode("morse")
+		error = excinfo.value
+		assert (error.object, error.start, error.end) == (b".- ..--.-. -", 3, 10)
+		assert isinstance(error.__cause__, UnsupportedMorseSymbolError)
+
+	def test_ignore_skips_bad_tokens(self):
+		assert "A©B".encode("morse", "ignore") == b".- -..."
+		assert b".- ...... -...".decode("morse", "ignore") == "Ab"
+
+	def test_replace_uses_placeholders(self):
+		assert "A©B".encode("morse", "replace") == b".- ........ -..."
+		assert b".- ...... -...".decode("morse", "replace") == "A\ufffdb"
+
+	def test_unknown_error_handler_raises(self):
+		with pytest.raises(LookupError):
+			"A".encode("morse", "no-such-handler")
+
+
+class TestIncrementalCodec:
+	"""Tests for iterencode/iterdecode and the incremental classes."""
+
+	def test_iterdecode_carries_symbols_across_chunks(self):
+		chunks = [b".", b"- -", b"..."]
+		assert "".join(codecs.iterdecode(chunks, "morse")) == "Ab"
+
+	def test_iterencode_inserts_separator_across_chunks(self):
+		assert b"".join(codecs.iterencode(["A", "B C"], "morse")) == b".- -...   -.-."
+
+	def test_decoder_state_round_trip(self):
+		decoder = morse_codec.IncrementalDecoder()
+		decoder.decode(b".- -.")
+		pending, flags = decoder.getstate()
+		assert pending == b"-."
+		other = morse_codec.IncrementalDecoder()
+		other.setstate((pending, flags))
+		assert other.decode(b"", final=True) == decoder.decode(b"", final=True)
+
+	def test_decode_error_spans_buffered_bytes(self):
+		decoder = morse_codec.IncrementalDecoder()
+		decoder.decode(b".- ..--")
+		with pytest.raises(UnicodeDecodeError) as excinfo:
+			decoder.decode(b".-. -", final=True)
+		error = excinfo.value
+		assert (error.object, error.start, error.end) == (b"..--.-. -", 0, 7)
+
+	def test_encode_error_offset_is_within_chunk(self):
+		encoder = morse_codec.IncrementalEncoder()
+		encoder.encode("AB")
+		with pytest.raises(UnicodeEncodeError) as excinfo:
+			encoder.encode("C©")
+		assert (excinfo.value.object, excinfo.value.start) == ("C©", 1)
+
+
+class TestStdlibIO:
+	"""Tests for file and stream integration."""
+
+	def test_open_round_trip(self, tmp_path):
+		path = tmp_path / "message.morse"
+		with open(path, "w", encoding="morse") as handle:
+			handle.write("Tere maailm\n")
+			handle.write("Teine")
+			handle.write(" rida")
+		assert path.read_bytes() == b"- . .-. .   -- .- .- .. .-.. --\n- . .. -. .   .-. .. -.. .-"
+		with open(path, encoding="morse") as handle:
+			assert handle.read() == "Tere Maailm\nTeine Rida"
+
+	def test_tell_and_seek(self, tmp_path):
+		path = tmp_path / "lines.morse"
+		path.write_bytes(b".- -...\n-.-. -..")
+		with open(path, encoding="morse") as handle:
+			handle.readline()
+			position = handle.tell()
+			rest = handle.read()
+			handle.seek(position)
+			assert handle.read() == rest == "Cd"
+
+	def test_open_with_replace(self, tmp_path):
+		path = tmp_path / "typo.morse"
+		path.write_bytes(b".- ......\n-...")
+		with open(path, encoding="morse", errors="replace") as handle:
+			assert handle.read() == "A\ufffd\nB"
+		with open(path, encoding="morse") as handle, pytest.raises(UnicodeDecodeError):
+			handle.read()
+
+	def test_text_io_wrapper(self):
+		wrapper = io.TextIOWrapper(io.BytesIO(b".... ..   - .... . .-. ."), encoding="morse")
+		assert wrapper.read() == "Hi There"
+
+	def test_stream_reader_flushes_last_symbol(self):
+		reader = codecs.getreader("morse")(io.BytesIO(b".- -...   -.-.\n.. -"))
+		assert reader.read() == "Ab C\nIt"
+
+	def test_stream_reader_lines(self):
+		reader = codecs.getreader("morse")(io.BytesIO(b".- -...\n.. -"))
+		assert list(reader) == ["Ab\n", "It"]
+
+	def test_stream_writer_keeps_separator_between_writes(self):
+		buffer = io.BytesIO()
+		writer = codecs.getwriter("morse")(buffer)
+		writer.write("A")
+		writer.write("B")
+		assert buffer.getvalue() == b".- -..."
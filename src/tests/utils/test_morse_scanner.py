@@ -0,0 +1,77 @@
+"""Tests for the shared Morse tokenizer."""
+
+from __future__ import annotations
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.main.python.utils.morse_scanner import (
+	LETTER_GAP,
+	SYMBOL,
+	WORD_GAP,
+	scan_morse,
+	split_words,
+)
+
+
+def _kinds(morse: str) -> list[tuple[int, str]]:
+	return [(kind, morse[start:end]) for kind, start, end in scan_morse(morse)]
+
+
+class TestScanMorse:
+	"""Tests for token kinds and spans."""
+
+	def test_empty(self):
+		assert list(scan_morse("")) == []
+
+	def test_symbols_and_gaps(self):
+		assert _kinds(".- -...   -.-.") == [
+			(SYMBOL, ".-"),
+			(LETTER_GAP, " "),
+			(SYMBOL, "-..."),
+			(WORD_GAP, "   "),
+			(SYMBOL, "-.-."),
+		]
+
+	def test_spans_index_the_input(self):
+		assert list(scan_morse("  .-  -")) == [
+			(LETTER_GAP, 0, 2),
+			(SYMBOL, 2, 4),
+			(LETTER_GAP, 4, 6),
+			(SYMBOL, 6, 7),
+		]
+
+	@pytest.mark.parametrize("gap", ["   ", "     ", "\n", " \n ", "\r\n", "\t   "])
+	def test_word_gaps(self, gap):
+		assert _kinds(f".-{gap}-") == [(SYMBOL, ".-"), (WORD_GAP, gap), (SYMBOL, "-")]
+
+	@pytest.mark.parametrize("gap", [" ", "  ", "\t", " \t ", "  \t  "])
+	def test_letter_gaps(self, gap):
+		assert _kinds(f".-{gap}-") == [(SYMBOL, ".-"), (LETTER_GAP, gap), (SYMBOL, "-")]
+
+	def test_foreign_characters_stay_in_the_symbol(self):
+		assert _kinds(".x- /") == [(SYMBOL, ".x-"), (LETTER_GAP, " "), (SYMBOL, "/")]
+
+
+class TestSplitWords:
+	"""Tests for the C-level word splitter."""
+
+	def test_words_and_symbols(self):
+		words = split_words(".- -...   -.-.")
+		assert [word.split() for word in words] == [[".-", "-..."], ["-.-."]]
+
+	def test_line_breaks_separate_words(self):
+		words = split_words(".-\n-...\r\n-.-.")
+		assert [word.split() for word in words if word.split()] == [[".-"], ["-..."], ["-.-."]]
+
+	@given(st.text(alphabet=".- \t\n\rx", max_size=40))
+	def test_agrees_with_scanner(self, morse):
+		split = [word.split() for word in split_words(morse)]
+		scanned: list[list[str]] = [[]]
+		for kind, start, end in scan_morse(morse):
+			if kind == SYMBOL:
+				scanned[-1].append(morse[start:end])
+			elif kind == WORD_GAP:
+				scanned.append([])
+		assert [word for word in split if word] == [word for word in scanned if word]
@@ -3,7 +3,16 @@
 import pytest
 
 from src.main.python.exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
-from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+from src.main.python.resources.exercise_data import TRANSLATION_MORSE_SAMPLES
+from src.main.python.utils.morse_translator import (
+	DEFAULT_WORD_CACHE_SIZE,
+	clear_word_cache,
+	configure_word_cache,
+	convert_morse_to_text,
+	convert_text_to_morse,
+	convert_texts_to_morse,
+	word_cache_stats,
+)
 
 
 class TestConvertTextToMorse:
@@ -78,6 +87,91 @@ class TestConvertTextToMorse:
 		assert "   " in result
 
 
+class TestConvertTextToMorseSpacing:
+	"""Word-gap handling of the table-driven encoder."""
+
+	def test_trailing_space_keeps_word_gap(self):
+		assert convert_text_to_morse("A ") == ".-   "
+
+	def test_leading_space_emits_word_gap(self):
+		assert convert_text_to_morse(" A") == "   .-"
+
+	def test_double_space_emits_two_word_gaps(self):
+		assert convert_text_to_morse("A  B") == ".-      -..."
+
+	def test_spaces_only(self):
+		assert convert_text_to_morse("  ") == "      "
+
+	def test_reports_first_unsupported_character(self):
+		with pytest.raises(UnsupportedCharacterError) as excinfo:
+			convert_text_to_morse("AB ©x€")
+		assert excinfo.value.character == "©"
+
+	def test_newline_is_unsupported(self):
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse("A\nB")
+
+
+@pytest.fixture
+def word_cache():
+	"""Start from an empty default-sized word cache and restore it afterwards."""
+	configure_word_cache(DEFAULT_WORD_CACHE_SIZE)
+	yield
+	configure_word_cache(DEFAULT_WORD_CACHE_SIZE)
+
+
+class TestConvertTextToMorseMemoized:
+	"""Tests for the word-level memo on the encoding path."""
+
+	@pytest.mark.parametrize(
+		"message",
+		["TERE MAAILM", "A  B", " A", "A ", "A  ", "   ", "TERE TERE TERE"],
+	)
+	def test_matches_unmemoized(self, word_cache, message):
+		assert convert_text_to_morse(message, memoize=True) == convert_text_to_morse(message)
+
+	def test_counts_hits_and_misses(self, word_cache):
+		convert_text_to_morse("TERE TERE MAAILM", memoize=True)
+		stats = word_cache_stats()
+		assert (stats.hits, stats.misses) == (1, 2)
+		assert stats.hit_rate == pytest.approx(1 / 3)
+
+	def test_unsupported_character_raises_in_message_order(self, word_cache):
+		with pytest.raises(UnsupportedCharacterError) as exc_info:
+			convert_text_to_morse("TERE ©A Ñ", memoize=True)
+		assert exc_info.value.character == "©"
+		assert word_cache_stats().currsize == 0
+
+	def test_cached_words_are_reused_across_messages(self, word_cache):
+		convert_text_to_morse("TERE MAAILM", memoize=True)
+		assert convert_text_to_morse("MAAILM TERE", memoize=True) == convert_text_to_morse(
+			"MAAILM TERE"
+		)
+		assert word_cache_stats().hits == 2
+
+	def test_cache_is_bounded(self, word_cache):
+		configure_word_cache(2)
+		convert_text_to_morse("A B C D", memoize=True)
+		assert word_cache_stats().currsize == 2
+
+	def test_clear_resets_counters(self, word_cache):
+		convert_text_to_morse("A A", memoize=True)
+		clear_word_cache()
+		assert word_cache_stats().hit_rate == 0.0
+
+	def test_words_are_cached_per_alphabet(self, word_cache):
+		assert convert_text_to_morse("Я", alphabet="cyrillic", memoize=True) == ".-.-"
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse("Я", memoize=True)
+
+	def test_batch_variant_shares_cache(self, word_cache):
+		messages = ["TERE", "TERE MAAILM", "MAAILM"]
+		assert convert_texts_to_morse(messages, memoize=True) == [
+			convert_text_to_morse(message) for message in messages
+		]
+		assert word_cache_stats().hits == 2
+
+
 class TestConvertMorseToText:
 	"""Tests for convert_morse_to_text function."""
 
@@ -145,6 +239,40 @@ class TestConvertMorseToText:
 		assert result == "A B"
 
 
+class TestConvertMorseToTextSpacing:
+	"""Gap handling and error reporting of the table-lookup decoder."""
+
+	def test_double_space_is_not_word_gap(self):
+		assert convert_morse_to_text(".-  -...") == "Ab"
+
+	def test_leading_spaces_ignored(self):
+		assert convert_morse_to_text("   .-") == "A"
+
+	def test_long_gap_emits_single_space(self):
+		assert convert_morse_to_text(".-       -...") == "A B"
+
+	def test_line_break_is_word_gap(self):
+		assert convert_morse_to_text(".-\n-...") == "A B"
+		assert convert_morse_to_text(".- \r\n -...") == "A B"
+
+	def test_tab_is_letter_gap(self):
+		assert convert_morse_to_text(".-\t-...") == "Ab"
+
+	def test_multi_line_samples_decode(self):
+		for morse in TRANSLATION_MORSE_SAMPLES:
+			assert convert_morse_to_text(morse) == convert_morse_to_text(morse.replace("\n", "   "))
+
+	def test_reports_unknown_symbol(self):
+		with pytest.raises(UnsupportedMorseSymbolError) as excinfo:
+			convert_morse_to_text(".- ..--.-. -...")
+		assert excinfo.value.symbol == "..--.-."
+
+	def test_reports_symbol_with_foreign_character(self):
+		with pytest.raises(UnsupportedMorseSymbolError) as excinfo:
+			convert_morse_to_text(".- .x- -...")
+		assert excinfo.value.symbol == ".x-"
+
+
 class TestRoundTrip:
 	"""Tests for text→morse→text round-trip consistency."""
 
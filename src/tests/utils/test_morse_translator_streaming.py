@@ -0,0 +1,167 @@
+"""Tests for the incremental (chunked) Morse encoder and decoder."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from src.main.python.exceptions import (
+	InvalidModeError,
+	UnsupportedCharacterError,
+	UnsupportedMorseSymbolError,
+)
+from src.main.python.utils.morse_translator import (
+	IncrementalMorseDecoder,
+	IncrementalMorseEncoder,
+	convert_morse_to_text,
+	convert_text_to_morse,
+	iter_decode,
+	iter_encode,
+	translate_stream,
+)
+
+_TEXT_SAMPLES = ["HELLO WORLD", "A  B", " Tere ", "Tartu Ülikool 1632.", "x"]
+_MORSE_SAMPLES = [
+	".... . .-.. .-.. ---   .-- --- .-. .-.. -..",
+	".-  -...",
+	"   .-   ",
+	".- .-.-   ..",
+	"-",
+]
+
+
+def _split_every(text: str, size: int) -> list[str]:
+	return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+class TestIncrementalMorseEncoder:
+	"""Tests for IncrementalMorseEncoder."""
+
+	@pytest.mark.parametrize("text", _TEXT_SAMPLES)
+	@pytest.mark.parametrize("size", [1, 2, 3, 5])
+	def test_chunked_matches_one_shot(self, text, size):
+		assert "".join(iter_encode(_split_every(text, size))) == convert_text_to_morse(text)
+
+	def test_separator_owed_across_boundary(self):
+		encoder = IncrementalMorseEncoder()
+		assert encoder.encode("A") == ".-"
+		assert encoder.encode("B") == " -..."
+
+	def test_space_at_boundary(self):
+		encoder = IncrementalMorseEncoder()
+		assert encoder.encode("A ") == ".-   "
+		assert encoder.encode("B") == "-..."
+
+	def test_empty_chunk_keeps_state(self):
+		encoder = IncrementalMorseEncoder()
+		encoder.encode("A")
+		assert encoder.encode("") == ""
+		assert encoder.encode("B") == " -..."
+
+	def test_reset_clears_state(self):
+		encoder = IncrementalMorseEncoder()
+		encoder.encode("A")
+		encoder.reset()
+		assert encoder.encode("B") == "-..."
+
+	def test_state_round_trip(self):
+		encoder = IncrementalMorseEncoder()
+		encoder.encode("A")
+		other = IncrementalMorseEncoder()
+		other.setstate(encoder.getstate())
+		assert other.encode("B") == encoder.encode("B")
+
+	def test_unsupported_character_raises(self):
+		with pytest.raises(UnsupportedCharacterError):
+			IncrementalMorseEncoder().encode("A©")
+
+	def test_error_handler_replaces_characters(self):
+		seen = []
+
+		def replace(token, offset):
+			seen.append((token, offset))
+			return "-.-.-"
+
+		encoder = IncrementalMorseEncoder(keep_line_breaks=True, on_error=replace)
+		assert encoder.encode("A©\n#B") == ".- -.-.-\n-.-.- -..."
+		assert seen == [("©", 1), ("#", 3)]
+
+	def test_error_handler_can_drop_characters(self):
+		encoder = IncrementalMorseEncoder(on_error=lambda token, offset: "")
+		assert encoder.encode("A©") == ".-"
+		assert encoder.encode("©B") == " -..."
+
+
+class TestIncrementalMorseDecoder:
+	"""Tests for IncrementalMorseDecoder."""
+
+	@pytest.mark.parametrize("morse", _MORSE_SAMPLES)
+	@pytest.mark.parametrize("size", [1, 2, 3, 5])
+	def test_chunked_matches_one_shot(self, morse, size):
+		assert "".join(iter_decode(_split_every(morse, size))) == convert_morse_to_text(morse)
+
+	def test_open_symbol_waits_for_boundary(self):
+		decoder = IncrementalMorseDecoder()
+		assert decoder.decode(".") == ""
+		assert decoder.decode("- ") == "A"
+
+	def test_final_closes_open_symbol(self):
+		decoder = IncrementalMorseDecoder()
+		decoder.decode(".-")
+		assert decoder.decode("", final=True) == "A"
+
+	def test_capitalisation_carries_across_chunks(self):
+		decoder = IncrementalMorseDecoder()
+		assert decoder.decode(".- ") == "A"
+		assert decoder.decode("-...", final=True) == "b"
+
+	def test_error_reports_symbol_spanning_chunks(self):
+		decoder = IncrementalMorseDecoder()
+		decoder.decode(".- ..--")
+		with pytest.raises(UnsupportedMorseSymbolError) as excinfo:
+			decoder.decode(".-. -", final=True)
+		assert excinfo.value.symbol == "..--.-."
+
+	def test_error_handler_offset_of_symbol_spanning_chunks(self):
+		seen = []
+
+		def replace(token, offset):
+			seen.append((token, offset))
+			return "#"
+
+		decoder = IncrementalMorseDecoder(on_error=replace)
+		assert decoder.decode(".- ..--") == "A"
+		assert decoder.decode(".-. -", final=True) == "#t"
+		assert seen == [("..--.-.", -4)]
+
+	def test_state_round_trip(self):
+		decoder = IncrementalMorseDecoder()
+		decoder.decode(".-   -.")
+		other = IncrementalMorseDecoder()
+		other.setstate(decoder.getstate())
+		assert other.decode("..", final=True) == decoder.decode("..", final=True)
+
+	def test_final_resets_decoder(self):
+		decoder = IncrementalMorseDecoder()
+		decoder.decode(".- .-", final=True)
+		assert decoder.decode(".-", final=True) == "A"
+
+
+class TestTranslateStream:
+	"""Tests for translate_stream."""
+
+	def test_text_to_morse_keeps_lines(self):
+		target = io.StringIO()
+		translate_stream(io.StringIO("AB\nC D\n"), target, mode="text_to_morse", chunk_size=2)
+		assert target.getvalue() == ".- -...\n-.-.   -..\n"
+
+	def test_morse_to_text_keeps_lines(self):
+		target = io.StringIO()
+		source = io.StringIO(".- -...\n-.-.   -..")
+		translate_stream(source, target, mode="morse_to_text", chunk_size=3)
+		assert target.getvalue() == "Ab\nC D"
+
+	def test_invalid_mode_raises(self):
+		with pytest.raises(InvalidModeError):
+			translate_stream(io.StringIO(""), io.StringIO(), mode="sideways")
@@ -0,0 +1,72 @@
+"""Tests for the flat-array dichotomic decoding tree."""
+
+import pytest
+
+from src.main.python.resources.morse_data import LETTER_MORSE_PAIRS, NUMBER_SYMBOL_MORSE_PAIRS
+from src.main.python.utils.morse_tree import (
+	ROOT,
+	DichotomicTree,
+	code_for_node,
+	node_for_code,
+)
+
+_BUNDLED_TREE = DichotomicTree.from_pairs(LETTER_MORSE_PAIRS, NUMBER_SYMBOL_MORSE_PAIRS)
+
+
+class TestNodeNumbering:
+	"""Tests for the implicit heap numbering helpers."""
+
+	def test_dot_is_left_child(self):
+		assert node_for_code(".") == 2 * ROOT
+
+	def test_dash_is_right_child(self):
+		assert node_for_code("-") == 2 * ROOT + 1
+
+	def test_round_trip(self):
+		for _, code in LETTER_MORSE_PAIRS + NUMBER_SYMBOL_MORSE_PAIRS:
+			assert code_for_node(node_for_code(code)) == code
+
+	def test_invalid_element_raises(self):
+		with pytest.raises(ValueError):
+			node_for_code(".x")
+
+	def test_invalid_node_raises(self):
+		with pytest.raises(ValueError):
+			code_for_node(0)
+
+
+class TestBundledTree:
+	"""Tests for the tree built from the bundled tables."""
+
+	@pytest.mark.parametrize("letter,code", LETTER_MORSE_PAIRS)
+	def test_letters_decode_with_both_cases(self, letter, code):
+		assert _BUNDLED_TREE.lookup(code) == (letter.upper(), letter)
+
+	@pytest.mark.parametrize("char,code", NUMBER_SYMBOL_MORSE_PAIRS)
+	def test_numbers_and_symbols_decode_to_themselves(self, char, code):
+		assert _BUNDLED_TREE.lookup(code) == (char, char)
+
+	def test_unknown_code_returns_none(self):
+		assert _BUNDLED_TREE.lookup(".-.-.-.-.-.") is None
+
+	def test_prefix_without_entry_returns_none(self):
+		assert _BUNDLED_TREE.lookup("..--.-.") is None
+
+	def test_foreign_characters_return_none(self):
+		assert _BUNDLED_TREE.lookup(".x") is None
+
+	def test_size_covers_longest_code(self):
+		longest = max(len(code) for _, code in NUMBER_SYMBOL_MORSE_PAIRS)
+		assert _BUNDLED_TREE.size == 2 ** (longest + 1)
+
+
+class TestFromPairs:
+	"""Tests for building custom trees."""
+
+	def test_first_pair_wins_on_shared_code(self):
+		tree = DichotomicTree.from_pairs([("a", ".-")], [("+", ".-")])
+		assert tree.lookup(".-") == ("A", "a")
+
+	def test_entry_out_of_range_returns_none(self):
+		tree = DichotomicTree.from_pairs([("e", ".")])
+		assert tree.entry(tree.size + 5) is None
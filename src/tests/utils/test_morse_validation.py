@@ -0,0 +1,125 @@
+"""Tests for collect-all-errors translation and its error policies."""
+
+import pytest
+
+from src.main.python.exceptions import (
+	InvalidModeError,
+	UnsupportedCharacterError,
+	UnsupportedMorseSymbolError,
+)
+from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+from src.main.python.utils.morse_validation import (
+	DEFAULT_TEXT_PLACEHOLDER,
+	ERROR_SIGNAL,
+	ErrorPolicy,
+	TranslationIssue,
+	find_issues,
+	issue_error,
+	translate_checked,
+)
+
+
+class TestFindIssues:
+	"""Tests for locating every unsupported token."""
+
+	def test_reports_every_unsupported_character_with_offset(self):
+		issues = find_issues("A©B ñ C", mode="text_to_morse")
+		assert issues == (TranslationIssue(1, "©"), TranslationIssue(4, "ñ"))
+
+	def test_reports_every_unknown_symbol_with_offset(self):
+		issues = find_issues(".- ........ -... ..--..--", mode="morse_to_text")
+		assert issues == (TranslationIssue(3, "........"), TranslationIssue(17, "..--..--"))
+
+	def test_foreign_characters_make_the_whole_symbol_invalid(self):
+		assert find_issues(".- .x-", mode="morse_to_text") == (TranslationIssue(3, ".x-"),)
+
+	def test_valid_input_has_no_issues(self):
+		assert find_issues("TERE MAAILM", mode="text_to_morse") == ()
+		assert find_issues(".- -...", mode="morse_to_text") == ()
+
+	def test_issue_end(self):
+		assert TranslationIssue(3, "..--..--").end == 11
+
+	def test_invalid_mode_raises(self):
+		with pytest.raises(InvalidModeError):
+			find_issues("A", mode="sideways")
+
+
+class TestTranslateChecked:
+	"""Tests for the raise, skip and replace policies."""
+
+	def test_valid_input_matches_plain_converters(self):
+		result = translate_checked("TERE MAAILM", mode="text_to_morse")
+		assert result.ok
+		assert result.text == convert_text_to_morse("TERE MAAILM")
+		result = translate_checked(".- -...", mode="morse_to_text")
+		assert result.text == convert_morse_to_text(".- -...")
+
+	def test_raise_policy_raises_first_error(self):
+		with pytest.raises(UnsupportedCharacterError) as exc_info:
+			translate_checked("A©B ñ", mode="text_to_morse")
+		assert exc_info.value.character == "©"
+
+	def test_skip_drops_unsupported_characters(self):
+		result = translate_checked("A©B", mode="text_to_morse", policy=ErrorPolicy.SKIP)
+		assert result.text == convert_text_to_morse("AB")
+		assert result.issues == (TranslationIssue(1, "©"),)
+
+	def test_skip_of_only_unsupported_characters_is_empty(self):
+		result = translate_checked("©©", mode="text_to_morse", policy=ErrorPolicy.SKIP)
+		assert result.text == ""
+		assert len(result.issues) == 2
+
+	def test_replace_encodes_error_signal_by_default(self):
+		result = translate_checked("A©B", mode="text_to_morse", policy=ErrorPolicy.REPLACE)
+		assert result.text == f".- {ERROR_SIGNAL} -..."
+
+	def test_replace_uses_custom_morse_placeholder(self):
+		result = translate_checked(
+			"A©", mode="text_to_morse", policy=ErrorPolicy.REPLACE, placeholder="..--.."
+		)
+		assert result.text == ".- ..--.."
+
+	def test_skip_drops_unknown_symbols(self):
+		result = translate_checked(".- ...... -...", mode="morse_to_text", policy=ErrorPolicy.SKIP)
+		assert result.text == "Ab"
+		assert result.issues == (TranslationIssue(3, "......"),)
+
+	def test_replace_decodes_to_placeholder(self):
+		result = translate_checked(
+			".- ...... -...", mode="morse_to_text", policy=ErrorPolicy.REPLACE
+		)
+		assert result.text == f"A{DEFAULT_TEXT_PLACEHOLDER}b"
+
+	def test_replace_uses_custom_text_placeholder(self):
+		result = translate_checked(
+			".-   ......", mode="morse_to_text", policy=ErrorPolicy.REPLACE, placeholder="#"
+		)
+		assert result.text == "A #"
+
+	def test_nearest_decodes_to_nearest_code(self):
+		result = translate_checked(
+			".-..- ---   -.-.-.-.-.", mode="morse_to_text", policy=ErrorPolicy.NEAREST
+		)
+		assert result.text == f"Lo {DEFAULT_TEXT_PLACEHOLDER}"
+		assert [issue.token for issue in result.issues] == [".-..-", "-.-.-.-.-."]
+
+	def test_nearest_encodes_like_replace(self):
+		result = translate_checked("A©", mode="text_to_morse", policy=ErrorPolicy.NEAREST)
+		assert result.text == f".- {ERROR_SIGNAL}"
+
+	def test_invalid_mode_raises(self):
+		with pytest.raises(InvalidModeError):
+			translate_checked("A", mode="sideways")
+
+
+class TestIssueError:
+	"""Tests for mapping issues back to typed errors."""
+
+	def test_text_issue_maps_to_unsupported_character(self):
+		error = issue_error(TranslationIssue(0, "©"), mode="text_to_morse")
+		assert isinstance(error, UnsupportedCharacterError)
+
+	def test_morse_issue_maps_to_unsupported_symbol(self):
+		error = issue_error(TranslationIssue(0, "......"), mode="morse_to_text")
+		assert isinstance(error, UnsupportedMorseSymbolError)
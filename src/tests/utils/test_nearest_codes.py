@@ -0,0 +1,81 @@
+"""Tests for the BK-tree nearest-code lookup."""
+
+import itertools
+
+import pytest
+
+from src.main.python.utils.alphabets import compile_alphabet
+from src.main.python.utils.nearest_codes import (
+	BKTree,
+	code_index,
+	edit_distance,
+	nearest_codes,
+	suggest_characters,
+)
+
+
+class TestEditDistance:
+	"""Tests for the Levenshtein distance."""
+
+	@pytest.mark.parametrize(
+		("first", "second", "distance"),
+		[
+			("", "", 0),
+			(".-", ".-", 0),
+			(".-..", ".-..-", 1),
+			(".-..", "-..", 1),
+			(".-", "-.", 2),
+			("", "...", 3),
+			("kitten", "sitting", 3),
+		],
+	)
+	def test_distances(self, first, second, distance):
+		assert edit_distance(first, second) == distance
+		assert edit_distance(second, first) == distance
+
+
+class TestBKTree:
+	"""Tests for the metric tree."""
+
+	def test_matches_brute_force(self):
+		words = ["".join(p) for n in range(1, 6) for p in itertools.product(".-", repeat=n)]
+		tree = BKTree(words)
+		for query in ("", ".", ".-.-", "--..--", "......."):
+			for limit in (0, 1, 2):
+				expected = {(edit_distance(query, w), w) for w in words}
+				expected = {match for match in expected if match[0] <= limit}
+				assert set(tree.search(query, limit)) == expected
+
+	def test_nearest_first(self):
+		tree = BKTree(["...", "..", ".", "----"])
+		assert tree.search("...", 1) == [(0, "..."), (1, "..")]
+
+	def test_duplicates_are_kept_once(self):
+		tree = BKTree([".-", ".-", "-"])
+		assert len(tree) == 2
+
+	def test_empty_tree(self):
+		assert BKTree().search(".-", 3) == []
+
+
+class TestNearestCodes:
+	"""Tests for the alphabet-level lookup."""
+
+	def test_extra_element(self):
+		assert nearest_codes(".-..-")[0] == ".-.."
+		assert suggest_characters(".-..-")[0] == "L"
+
+	def test_valid_symbol_is_its_own_match(self):
+		assert nearest_codes(".-") == (".-",)
+
+	def test_nothing_within_distance(self):
+		assert nearest_codes("-.-.-.-.-.") == ()
+		assert nearest_codes("-.-.-.-.-.", max_distance=4)
+
+	def test_other_alphabet(self):
+		assert suggest_characters(".-.--", alphabet="cyrillic")[0] == "Я"
+
+	def test_index_built_once_per_alphabet(self):
+		compiled = compile_alphabet()
+		assert code_index(compiled) is code_index(compiled)
+		assert len(code_index(compiled)) == len(compiled.codes)
@@ -0,0 +1,103 @@
+"""Tests for the byte-packed Morse representation."""
+
+from array import array
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
+from src.main.python.resources.exercise_data import (
+	TRANSLATION_MORSE_SAMPLES,
+	TRANSLATION_TEXT_SAMPLES,
+)
+from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+from src.main.python.utils.packed_morse import WORD_GAP, PackedMorse
+from src.main.python.utils.timing_plan import DOT, compile_timing_plan
+
+
+class TestPacking:
+	"""Tests for building packed sequences."""
+
+	def test_one_byte_per_symbol(self):
+		packed = PackedMorse.from_text("SOS")
+		assert packed.data == bytes((0b1000, 0b1111, 0b1000))
+
+	def test_word_gap_is_zero_byte(self):
+		assert PackedMorse.from_text("E E").data == bytes((0b10, WORD_GAP, 0b10))
+
+	def test_from_text_matches_from_morse(self):
+		for text in TRANSLATION_TEXT_SAMPLES:
+			assert PackedMorse.from_text(text) == PackedMorse.from_morse(
+				convert_text_to_morse(text)
+			)
+
+	def test_repeated_and_leading_gaps_are_canonical(self):
+		assert PackedMorse.from_text("  A   B") == PackedMorse.from_text("A B")
+		assert PackedMorse.from_morse("   .-       -...") == PackedMorse.from_morse(".-   -...")
+
+	def test_letter_gap_variants_pack_alike(self):
+		assert PackedMorse.from_morse(".-  -...") == PackedMorse.from_morse(".- -...")
+
+	def test_unsupported_character_raises(self):
+		with pytest.raises(UnsupportedCharacterError):
+			PackedMorse.from_text("A©")
+
+	def test_invalid_symbol_raises(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			PackedMorse.from_morse(".- .x")
+
+	def test_overlong_symbol_raises(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			PackedMorse.from_morse("........")
+
+	def test_empty(self):
+		assert not PackedMorse.from_text("")
+		assert PackedMorse.from_morse("").to_morse() == ""
+
+
+class TestUnpacking:
+	"""Tests for converting packed sequences back to strings."""
+
+	def test_to_morse_matches_encoder(self):
+		for text in TRANSLATION_TEXT_SAMPLES:
+			assert PackedMorse.from_text(text).to_morse() == convert_text_to_morse(text)
+
+	def test_to_text_matches_decoder(self):
+		for morse in TRANSLATION_MORSE_SAMPLES:
+			assert PackedMorse.from_morse(morse).to_text() == convert_morse_to_text(morse)
+
+	def test_trailing_gap_round_trips(self):
+		packed = PackedMorse.from_text("A ")
+		assert packed.to_morse() == convert_text_to_morse("A ")
+		assert packed.to_text() == "A "
+
+	def test_to_text_with_other_alphabet(self):
+		assert PackedMorse.from_morse(".-.-").to_text(alphabet="cyrillic") == "Я"
+
+	def test_to_text_unknown_symbol_raises(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			PackedMorse.from_morse("......").to_text()
+
+
+class TestComparison:
+	"""Tests for equality, hashing and gap-insensitive comparison."""
+
+	def test_equal_sequences_hash_alike(self):
+		first = PackedMorse.from_text("TERE")
+		second = PackedMorse.from_morse("- . .-. .")
+		assert first == second
+		assert len({first, second}) == 1
+
+	def test_symbols_ignore_word_gaps(self):
+		assert PackedMorse.from_text("TE RE").symbols == PackedMorse.from_text("TERE").data
+
+
+class TestTimingPlan:
+	"""Tests for deriving tone and gap timings."""
+
+	def test_matches_compiled_plan(self):
+		for text in TRANSLATION_TEXT_SAMPLES:
+			morse = convert_text_to_morse(text)
+			assert PackedMorse.from_morse(morse).timing_plan() == compile_timing_plan(morse)
+
+	def test_outer_gaps_are_silent(self):
+		assert PackedMorse.from_text(" E ").timing_plan() == array("b", [DOT])
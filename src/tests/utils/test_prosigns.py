@@ -0,0 +1,113 @@
+"""Tests for prosign encoding and the Aho-Corasick token automaton."""
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedCharacterError, UnsupportedMorseSymbolError
+from src.main.python.resources.morse_data import PROSIGN_MORSE_PAIRS
+from src.main.python.utils.alphabets import Alphabet, compile_alphabet, register_alphabet
+from src.main.python.utils.morse_translator import (
+	IncrementalMorseDecoder,
+	convert_morse_to_text,
+	convert_text_to_morse,
+	convert_texts_to_morse,
+)
+from src.main.python.utils.prosigns import TokenAutomaton, compile_prosigns
+
+
+class TestTokenAutomaton:
+	"""Tests for multi-token matching."""
+
+	def test_finds_every_occurrence(self):
+		automaton = TokenAutomaton(["he", "she", "his", "hers"])
+		assert automaton.find("ushers his") == [(1, 4, 1), (7, 10, 2)]
+
+	def test_longest_match_wins_at_same_start(self):
+		automaton = TokenAutomaton(["ab", "abcd"])
+		assert automaton.find("xabcdab") == [(1, 5, 1), (5, 7, 0)]
+
+	def test_leftmost_match_wins_over_overlap(self):
+		automaton = TokenAutomaton(["abc", "bcdef"])
+		assert automaton.find("abcdef") == [(0, 3, 0)]
+
+	def test_restarts_through_failure_links(self):
+		automaton = TokenAutomaton(["<AR>"])
+		assert automaton.find("<<<AR>") == [(2, 6, 0)]
+
+	def test_ignores_case(self):
+		automaton = TokenAutomaton(["<SK>"])
+		assert automaton.find("<sk> <Sk>") == [(0, 4, 0), (5, 9, 0)]
+
+	def test_no_tokens(self):
+		assert TokenAutomaton([]).find("anything") == []
+
+	def test_substitute(self):
+		automaton = TokenAutomaton(["<AR>", "<SK>"])
+		assert automaton.substitute("a<AR>b<SK>", ["1", "2"]) == "a1b2"
+		assert automaton.substitute("plain", ["1", "2"]) == "plain"
+
+
+class TestProsignEncoding:
+	"""Tests for ``convert_text_to_morse(prosigns=True)``."""
+
+	@pytest.mark.parametrize(("token", "code"), PROSIGN_MORSE_PAIRS)
+	def test_every_prosign_is_one_symbol(self, token, code):
+		assert convert_text_to_morse(token, prosigns=True) == code
+
+	def test_prosigns_between_words(self):
+		assert convert_text_to_morse("CQ <KN>", prosigns=True) == "-.-. --.-   -.--."
+
+	def test_adjacent_prosigns_get_letter_gap(self):
+		assert convert_text_to_morse("<AR><SK>", prosigns=True) == ".-.-. ...-.-"
+
+	def test_off_by_default(self):
+		with pytest.raises(UnsupportedCharacterError) as excinfo:
+			convert_text_to_morse("<AR>")
+		assert excinfo.value.character == "<"
+
+	def test_unmatched_bracket_still_raises(self):
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse("<XY>", prosigns=True)
+
+	def test_stand_in_characters_in_input_raise(self):
+		stand_in = compile_prosigns(compile_alphabet()).stand_ins[0]
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse(f"a{stand_in}", prosigns=True)
+
+	def test_memoized(self):
+		messages = ["QRV <AR>", "QRV <SK>", "QRV <AR>"]
+		assert convert_texts_to_morse(messages, prosigns=True, memoize=True) == [
+			convert_text_to_morse(message, prosigns=True) for message in messages
+		]
+
+	def test_custom_abbreviation(self, isolated_registry):
+		register_alphabet(
+			Alphabet("test-sos", "Test", (("s", "..."), ("o", "---")), (), (("SOS", "...---..."),))
+		)
+		assert convert_text_to_morse("SOS OS", alphabet="test-sos", prosigns=True) == (
+			"...---...   --- ..."
+		)
+
+
+class TestProsignDecoding:
+	"""Tests for the reverse entries."""
+
+	def test_round_trip(self):
+		morse = convert_text_to_morse("CQ de ES1 <KN>", prosigns=True)
+		assert convert_morse_to_text(morse, prosigns=True) == "Cq De Es1 <KN>"
+
+	def test_shared_code_decodes_to_prosign(self):
+		assert convert_morse_to_text(".-.-.") == "+"
+		assert convert_morse_to_text(".-.-.", prosigns=True) == "<AR>"
+
+	def test_prosign_only_code_needs_prosign_mode(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			convert_morse_to_text("...-.-")
+		assert convert_morse_to_text("...-.-", prosigns=True) == "<SK>"
+
+	def test_incremental_decoder(self):
+		decoder = IncrementalMorseDecoder(prosigns=True)
+		assert decoder.decode("... ...-") + decoder.decode(".-", final=True) == "S<SK>"
+
+	def test_compiled_once_per_alphabet(self):
+		compiled = compile_alphabet()
+		assert compile_prosigns(compiled) is compile_prosigns(compiled)
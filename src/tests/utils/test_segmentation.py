@@ -0,0 +1,91 @@
+"""Tests for decoding Morse without letter gaps."""
+
+import math
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedMorseSymbolError
+from src.main.python.resources.exercise_data import TRANSLATION_TEXT_SAMPLES
+from src.main.python.utils.morse_translator import convert_morse_to_text, convert_text_to_morse
+from src.main.python.utils.segmentation import CharNgramModel, default_model, segment_morse
+
+
+def _without_letter_gaps(text: str) -> str:
+	return "   ".join(word.replace(" ", "") for word in convert_text_to_morse(text).split("   "))
+
+
+@pytest.fixture
+def model():
+	return CharNgramModel.train(["tere tere tere", "see on test", "ets"])
+
+
+class TestCharNgramModel:
+	"""Tests for the smoothed character model."""
+
+	def test_probabilities_sum_to_one(self, model):
+		characters = set("tere son") | {"x"}
+		for context in ("", " ", "te", "zz"):
+			total = sum(model.probability(context, char) for char in characters)
+			# "x" stands for every unseen character, so the mass is complete.
+			assert math.isclose(total, 1.0)
+
+	def test_seen_continuation_is_cheaper(self, model):
+		assert model.cost("te", "r") < model.cost("te", "s")
+
+	def test_step_keeps_context_length(self, model):
+		cost, context = model.step(" te", "r")
+		assert context == "er"
+		assert cost == model.cost(" te", "r")
+
+	def test_training_is_case_and_whitespace_insensitive(self):
+		first = CharNgramModel.train(["Tere  Tere"])
+		second = CharNgramModel.train(["tere tere"])
+		assert first.cost("te", "r") == second.cost("te", "r")
+
+	def test_invalid_order_raises(self):
+		with pytest.raises(ValueError):
+			CharNgramModel.train(["tere"], order=0)
+
+
+class TestSegmentMorse:
+	"""Tests for the beam search decoder."""
+
+	def test_letter_gaps_are_boundaries(self, model):
+		assert segment_morse(". .", model=model) == "Ee"
+		assert segment_morse("- . .-. .", model=model) == convert_morse_to_text("- . .-. .")
+
+	@pytest.mark.parametrize("text", ["Morsekood", "Tartu linn", "Delta keskus"])
+	def test_recovers_training_words(self, text):
+		assert text in TRANSLATION_TEXT_SAMPLES
+		assert segment_morse(_without_letter_gaps(text)).lower() == text.lower()
+
+	def test_recovers_sentence_with_word_gaps(self):
+		text = "Programmeerimine on eriti lahe"
+		assert segment_morse(_without_letter_gaps(text)) == text.title()
+
+	def test_model_decides_ambiguous_split(self, model):
+		assert segment_morse("-..-.", model=model) == "Ter"
+
+	def test_inserts_spaces_when_asked(self, model):
+		morse = _without_letter_gaps("tere tere").replace(" ", "")
+		assert segment_morse(morse, model=model, insert_spaces=True) == "Tere Tere"
+		assert segment_morse(morse, model=model) == "Teretere"
+
+	def test_wider_beam_never_costs_more(self, model):
+		morse = _without_letter_gaps("see on test tere")
+		assert segment_morse(morse, model=model, beam_width=64) == segment_morse(morse, model=model)
+
+	def test_empty(self):
+		assert segment_morse("") == ""
+		assert segment_morse("   \n") == ""
+
+	def test_invalid_element_raises(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			segment_morse(".-x-")
+
+	def test_invalid_beam_width_raises(self):
+		with pytest.raises(ValueError):
+			segment_morse(".-", beam_width=0)
+
+	def test_default_model_is_shared(self):
+		assert default_model() is default_model()
@@ -0,0 +1,84 @@
+"""Tests for compiled timing plans."""
+
+from array import array
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedMorseSymbolError
+from src.main.python.resources.exercise_data import TRANSLATION_TEXT_SAMPLES
+from src.main.python.utils.morse_translator import convert_text_to_morse
+from src.main.python.utils.timing_plan import (
+	DASH,
+	DOT,
+	ELEMENT_GAP,
+	LETTER_GAP,
+	WORD_GAP,
+	compile_timing_plan,
+	iter_timing_plan,
+	plan_units,
+)
+
+
+class TestIterTimingPlan:
+	"""Tests for iter_timing_plan()."""
+
+	def test_one_piece_per_word(self):
+		assert list(iter_timing_plan(". -   .\n-")) == [(1, -3, 3), (-7, 1), (-7, 3)]
+
+	@pytest.mark.parametrize("size", [1, 2, 3, 7])
+	def test_chunked_pieces_join_to_compiled_plan(self, size):
+		for text in TRANSLATION_TEXT_SAMPLES:
+			morse = f" {convert_text_to_morse(text)}    .-  "
+			chunks = (morse[start : start + size] for start in range(0, len(morse), size))
+			runs = [run for piece in iter_timing_plan(chunks) for run in piece]
+			assert runs == list(compile_timing_plan(morse))
+
+	def test_blank_input_yields_nothing(self):
+		assert list(iter_timing_plan(["  ", "\n", " "])) == []
+
+
+class TestCompileTimingPlan:
+	"""Tests for compile_timing_plan()."""
+
+	def test_letter_runs(self):
+		assert compile_timing_plan(".-") == array("b", [DOT, ELEMENT_GAP, DASH])
+
+	def test_letter_and_word_gaps(self):
+		assert list(compile_timing_plan(". -   .")) == [1, -3, 3, -7, 1]
+
+	def test_empty_input_is_empty_plan(self):
+		assert len(compile_timing_plan("  \n ")) == 0
+
+	def test_line_break_is_word_gap(self):
+		assert compile_timing_plan(".-\n.-") == compile_timing_plan(".-   .-")
+
+	def test_extra_spaces_collapse(self):
+		assert compile_timing_plan(" .-  -     . ") == compile_timing_plan(".- -   .")
+
+	def test_invalid_element_raises(self):
+		with pytest.raises(UnsupportedMorseSymbolError):
+			compile_timing_plan(".-x")
+
+	def test_tones_and_silences_alternate(self):
+		for text in TRANSLATION_TEXT_SAMPLES[:20]:
+			plan = compile_timing_plan(convert_text_to_morse(text))
+			assert all((first > 0) != (second > 0) for first, second in zip(plan, plan[1:]))
+			assert plan[0] > 0 and plan[-1] > 0
+
+	def test_plan_is_memoised(self):
+		compile_timing_plan.cache_clear()
+		first = compile_timing_plan("... --- ...")
+		assert compile_timing_plan("... --- ...") is first
+		assert compile_timing_plan.cache_info().hits == 1
+
+
+class TestPlanUnits:
+	"""Tests for plan_units()."""
+
+	def test_paris_is_fifty_units_with_word_gap(self):
+		# The standard word: 43 units of PARIS plus the 7-unit word gap.
+		plan = compile_timing_plan(convert_text_to_morse("PARIS PARIS"))
+		assert plan_units(plan) == 43 + -WORD_GAP + 43
+
+	def test_letter_gap_counts(self):
+		assert plan_units(compile_timing_plan(". .")) == 2 + -LETTER_GAP
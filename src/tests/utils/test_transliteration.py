@@ -0,0 +1,109 @@
+"""Tests for folding text onto a Morse alphabet before encoding."""
+
+import io
+
+import pytest
+
+from src.main.python.exceptions import UnsupportedCharacterError
+from src.main.python.utils import transliteration
+from src.main.python.utils.alphabets import compile_alphabet
+from src.main.python.utils.morse_translator import (
+	IncrementalMorseEncoder,
+	convert_text_to_morse,
+	convert_texts_to_morse,
+	translate_stream,
+)
+from src.main.python.utils.transliteration import transliterate, transliteration_table
+
+
+class TestTransliterate:
+	"""Tests for the character mappings."""
+
+	def test_supported_characters_are_kept(self):
+		text = "Öösel sõi Šveitsi JÄNES 42 korda?"
+		assert transliterate(text) == "Öösel soi Šveitsi JÄNES 42 korda?"
+
+	@pytest.mark.parametrize(
+		("text", "expected"),
+		[
+			("café", "cafe"),
+			("Ærø", "AEro"),
+			("Straße", "Strasse"),
+			("„jutt“", '"jutt"'),
+			("it’s", "it's"),
+			("a – b — c", "a - b - c"),
+			("ﬁnal", "final"),
+			("１２", "12"),
+			("a\u00a0b", "a b"),
+			("a\u200bb", "ab"),
+			("rida\nrida\tveerg", "rida rida veerg"),
+		],
+	)
+	def test_folds_latin_text(self, text, expected):
+		assert transliterate(text) == expected
+
+	def test_decomposed_input(self):
+		assert transliterate("e\u0301te\u0301") == "ete"
+
+	def test_cyrillic_to_estonian(self):
+		assert transliterate("Щука жила у Юрия") == "Štšuka zila u Jurija"
+
+	def test_result_depends_on_alphabet(self):
+		assert transliterate("шум", alphabet="estonian") == "šum"
+		assert transliterate("шум", alphabet="itu") == "sum"
+		assert transliterate("шум", alphabet="cyrillic") == "шум"
+
+	def test_unknown_characters_are_left_alone(self):
+		assert transliterate("a☃b") == "a☃b"
+
+	def test_table_is_cached_per_alphabet(self):
+		compiled = compile_alphabet()
+		assert transliteration_table(compiled) is transliteration_table(compiled)
+		assert transliteration_table(compiled) is not transliteration_table(compile_alphabet("itu"))
+
+	def test_long_mixed_text_matches_single_pass(self, monkeypatch):
+		monkeypatch.setattr(transliteration, "_CHUNK_SIZE", 7)
+		text = "Tšellist Ölné „Žürii“ " * 5
+		expected = text.translate(transliteration_table(compile_alphabet()))
+		assert transliterate(text) == expected
+
+
+class TestEncodingWithTransliteration:
+	"""Tests for the ``transliterate`` option of the encoders."""
+
+	def test_off_by_default(self):
+		with pytest.raises(UnsupportedCharacterError):
+			convert_text_to_morse("café")
+
+	def test_convert_text_to_morse(self):
+		assert convert_text_to_morse("café", transliterate=True) == convert_text_to_morse("cafe")
+
+	def test_memoized(self):
+		expected = convert_text_to_morse("Grüsse aus Köln")
+		assert convert_text_to_morse("Grüße aus Köln", memoize=True, transliterate=True) == expected
+
+	def test_remaining_characters_still_raise(self):
+		with pytest.raises(UnsupportedCharacterError) as excinfo:
+			convert_text_to_morse("snow ☃", transliterate=True)
+		assert excinfo.value.character == "☃"
+
+	def test_convert_texts_to_morse(self):
+		assert convert_texts_to_morse(["Ñu", "ёж"], alphabet="itu", transliterate=True) == [
+			convert_text_to_morse("Nu"),
+			convert_text_to_morse("joz"),
+		]
+
+	def test_incremental_encoder(self):
+		encoder = IncrementalMorseEncoder(transliterate=True)
+		chunks = ["Cré", "me\u200b", "\u200b brûlée"]
+		encoded = "".join(encoder.encode(chunk) for chunk in chunks)
+		assert encoded == convert_text_to_morse("Creme brulee")
+
+	def test_translate_stream_keeps_line_breaks(self):
+		target = io.StringIO()
+		translate_stream(
+			io.StringIO("naïve\ncafé"), target, mode="text_to_morse", transliterate=True
+		)
+		assert target.getvalue() == "\n".join(
+			[convert_text_to_morse("naive"), convert_text_to_morse("cafe")]
+		)